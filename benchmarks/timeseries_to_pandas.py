@@ -0,0 +1,82 @@
+"""
+Benchmark ``timeseries_response_to_pandas`` against the previous
+per-series implementation (one DataFrame per entity, then ``pd.concat``).
+
+Usage:
+    python benchmarks/timeseries_to_pandas.py [--entities N] [--points N] [--insights N]
+"""
+import argparse
+import datetime
+import random
+import time
+
+import pandas as pd
+
+from carbonarc.utils.timeseries import timeseries_response_to_pandas
+
+
+def legacy_timeseries_response_to_pandas(response: dict) -> pd.DataFrame:
+    series = []
+    for item in response["data"]:
+        df = pd.DataFrame(item["series"])
+        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df["entity_representation"] = item["entity_representation"]
+        df["entity_id"] = item["entity_id"]
+        df["entity_name"] = item["entity_name"]
+        df.rename(columns={"value": item["insight"]}, inplace=True)
+        df = df[["entity_representation", "entity_id", "entity_name", "date", item["insight"]]]
+        series.append(df)
+    return pd.concat(series)
+
+
+def make_response(entities: int, points: int, insights: int) -> dict:
+    start = datetime.date(2020, 1, 1)
+    dates = [(start + datetime.timedelta(days=7 * i)).isoformat() for i in range(points)]
+    data = []
+    for insight in range(insights):
+        for entity_id in range(entities):
+            data.append({
+                "entity_representation": random.choice(["brand", "company", "ticker"]),
+                "entity_id": entity_id,
+                "entity_name": f"Entity {entity_id}",
+                "insight": f"insight_{insight}",
+                "series": [{"date": d, "value": random.random()} for d in dates],
+            })
+    return {"data": data}
+
+
+def bench(fn, response, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(response)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--points", type=int, default=52)
+    parser.add_argument("--insights", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    response = make_response(args.entities, args.points, args.insights)
+    rows = sum(len(item["series"]) for item in response["data"])
+
+    results = {
+        "legacy": bench(legacy_timeseries_response_to_pandas, response, args.repeat),
+        "vectorized": bench(timeseries_response_to_pandas, response, args.repeat),
+        "vectorized (pivot)": bench(
+            lambda r: timeseries_response_to_pandas(r, pivot=True), response, args.repeat
+        ),
+    }
+    print(f"{len(response['data'])} series, {rows} points")
+    for name, seconds in results.items():
+        print(f"{name:>20}: {seconds:8.3f}s  {rows / seconds:12,.0f} points/s")
+    print(f"{'speedup':>20}: {results['legacy'] / results['vectorized']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,13 @@ except ImportError:
     __version__ = "unkown"
 
 from carbonarc.base import CarbonArcClient
+from carbonarc.aio import AsyncCarbonArcClient
+from carbonarc.pipeline import FrameworkPipeline
+from carbonarc.sync import OntologySync, WebcontentSync
+from carbonarc.utils.cache import ResponseCache
+from carbonarc.utils.ontology_index import OntologyIndex
+from carbonarc.utils.ratelimit import RateLimiter
+from carbonarc.utils.retry import RetryPolicy
 
 
-__all__ = ["CarbonArcClient"]
+__all__ = ["AsyncCarbonArcClient", "CarbonArcClient", "FrameworkPipeline", "OntologyIndex", "OntologySync", "RateLimiter", "ResponseCache", "RetryPolicy", "WebcontentSync"]
@@ -0,0 +1,497 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, Literal, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from carbonarc.block import (
+    BlockAPIClient,
+    BlockSnapshot,
+    _build_dataset_status,
+    _build_snapshot,
+    _find_dataset,
+    _index_arns,
+)
+from carbonarc.catalog import CatalogAPIClient
+from carbonarc.client import PlatformAPIClient
+from carbonarc.data import DataAPIClient
+from carbonarc.explorer import (
+    ExplorerAPIClient,
+    FrameworkResult,
+    _PARALLEL_PAGE_SIZE,
+    _chunked,
+    _combine_framework_pages,
+    _format_framework_data,
+    _framework_statuses,
+    _is_finished,
+    _pending_timeout,
+    _price_frame,
+    _settle_order,
+    _track_unreported,
+)
+from carbonarc.hub import HubAPIClient, _webcontent_page_converter, _with_webcontent_total
+from carbonarc.ontology import OntologyAPIClient
+from carbonarc.utils.arrow import ParquetSink, infer_schema, record_batch, require_pyarrow
+from carbonarc.utils.ontology_index import OntologyIndex, records
+from carbonarc.transcripts import TranscriptAPIClient
+from carbonarc.utils.async_client import AsyncAPIClientMixin
+from carbonarc.utils.async_manager import AsyncHttpRequestManager
+from carbonarc.utils.pagination import aiter_page_responses, cancel_tasks
+from carbonarc.utils.auth import TokenAuth
+from carbonarc.utils.cache import ResponseCache
+from carbonarc.utils.exceptions import CarbonArcException
+from carbonarc.utils.ratelimit import RateLimiter
+from carbonarc.utils.retry import RetryPolicy
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBlockAPIClient(AsyncAPIClientMixin, BlockAPIClient):
+    """Async :class:`BlockAPIClient`; every method returns an awaitable."""
+
+    async def snapshot(self, max_age: Optional[float] = None) -> BlockSnapshot:
+        """See :meth:`BlockAPIClient.snapshot`."""
+        if (
+            max_age is not None
+            and self._snapshot is not None
+            and self._snapshot.age <= max_age
+        ):
+            return self._snapshot
+        self._snapshot = _build_snapshot(*await asyncio.gather(
+            self.list_datasets(), self.list_requests(), self.list_arns()
+        ))
+        return self._snapshot
+
+    async def dataset_status(
+        self, dataset_id: str, snapshot: Optional[BlockSnapshot] = None
+    ) -> dict:
+        """See :meth:`BlockAPIClient.dataset_status`. The catalog, ARN and
+        request listings are fetched concurrently."""
+        if snapshot is not None:
+            return snapshot.dataset_status(dataset_id)
+        datasets, arns, requests = await asyncio.gather(
+            self.list_datasets(), self.list_arns(), self.list_requests()
+        )
+        catalog_entry = _find_dataset(datasets.get("datasets", []), dataset_id)
+        return _build_dataset_status(
+            dataset_id,
+            catalog_entry,
+            _index_arns(arns.get("items", []) or []) if catalog_entry is not None else {},
+            requests.get("requests", []),
+        )
+
+    async def dataset_status_many(
+        self,
+        dataset_ids,
+        snapshot: Optional[BlockSnapshot] = None,
+    ) -> dict:
+        """See :meth:`BlockAPIClient.dataset_status_many`."""
+        if snapshot is None:
+            snapshot = await self.snapshot()
+        return snapshot.dataset_status_many(dataset_ids)
+
+
+class AsyncCatalogAPIClient(AsyncAPIClientMixin, CatalogAPIClient):
+    """Async :class:`CatalogAPIClient`; every method returns an awaitable."""
+
+
+class AsyncDataAPIClient(AsyncAPIClientMixin, DataAPIClient):
+    """Async :class:`DataAPIClient`; every method returns an awaitable."""
+
+
+class AsyncExplorerAPIClient(AsyncAPIClientMixin, ExplorerAPIClient):
+    """Async :class:`ExplorerAPIClient`; every request method returns an
+    awaitable (``build_framework`` stays a plain function)."""
+
+    async def buy_frameworks(self, order, chunk_size: Optional[int] = None, max_workers: int = 4):
+        """See :meth:`ExplorerAPIClient.buy_frameworks`; chunks are bought
+        concurrently on the running loop."""
+        if isinstance(order, dict):
+            order = [order]
+        validated_order = self._validate_order(order)
+        url = f"{self.base_framework_url}/buy"
+        if not chunk_size or len(validated_order) <= chunk_size:
+            return await self._post(url, json={"order": {"frameworks": validated_order}})
+        chunks = _chunked(validated_order, chunk_size)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def buy(chunk: list) -> dict:
+            async with semaphore:
+                return await self._post(url, json={"order": {"frameworks": chunk}})
+
+        outcomes = await asyncio.gather(*(buy(chunk) for chunk in chunks), return_exceptions=True)
+        return _settle_order(chunks, outcomes)
+
+    async def check_framework_prices(self, frameworks, max_workers: int = 8, ttl: float = 300.0):
+        """See :meth:`ExplorerAPIClient.check_framework_prices`; quotes are
+        requested concurrently on the running loop."""
+        hashes, prices, missing = self._quotes_to_fetch(frameworks, ttl)
+        errors = {}
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def quote(key: str, framework: dict) -> None:
+            async with semaphore:
+                try:
+                    prices[key] = await self._quote(framework)
+                except (httpx.HTTPStatusError, CarbonArcException) as e:
+                    errors[key] = str(e)
+                else:
+                    self._store_quote(key, prices[key])
+
+        await asyncio.gather(*(quote(key, fw) for key, fw in missing.items()))
+        return _price_frame(hashes, prices, errors)
+
+    async def wait_for_frameworks(
+        self,
+        framework_ids,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        timeout: Optional[float] = None,
+        batch_size: int = 100,
+        download=False,
+        data_type: Optional[Literal["dataframe", "timeseries"]] = None,
+        download_workers: int = 4,
+    ):
+        """
+        Async generator version of
+        :meth:`ExplorerAPIClient.wait_for_frameworks`. Status batches are
+        requested concurrently and downloads run as tasks on the running
+        loop; a ``download`` callable must return an awaitable.
+        """
+        loop = asyncio.get_running_loop()
+        pending = list(dict.fromkeys(str(i) for i in framework_ids))
+        downloader = self._framework_downloader(download, data_type)
+        semaphore = asyncio.Semaphore(download_workers)
+        downloads: Dict[asyncio.Task, tuple] = {}
+        unreported: set = set()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = poll_interval
+        next_poll = loop.time()
+
+        async def fetch(framework_id: str):
+            async with semaphore:
+                return await downloader(framework_id)
+
+        try:
+            while pending or downloads:
+                if pending and loop.time() >= next_poll:
+                    statuses = {}
+                    for response in await asyncio.gather(*(
+                        self.get_framework_status(pending[start:start + batch_size])
+                        for start in range(0, len(pending), batch_size)
+                    )):
+                        statuses.update(_framework_statuses(response))
+                    _track_unreported(pending, statuses, unreported)
+                    finished = [i for i in pending if _is_finished(statuses.get(i))]
+                    pending = [i for i in pending if not _is_finished(statuses.get(i))]
+                    for framework_id in finished:
+                        result = FrameworkResult(framework_id, statuses[framework_id])
+                        if downloader and result.completed:
+                            downloads[asyncio.ensure_future(fetch(framework_id))] = result[:2]
+                        else:
+                            yield result
+                    interval = poll_interval if finished else min(interval * backoff, max_interval)
+                    next_poll = loop.time() + interval
+                if pending and deadline is not None and loop.time() >= deadline:
+                    raise _pending_timeout(pending, unreported, timeout)
+                wake = min(next_poll, deadline) if deadline is not None else next_poll
+                delay = max(0.0, wake - loop.time()) if pending else None
+                if downloads:
+                    done, _ = await asyncio.wait(
+                        downloads, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        framework_id, status = downloads.pop(task)
+                        try:
+                            data = task.result()
+                        except Exception as e:
+                            logger.warning(f"Download of framework {framework_id} failed: {e}")
+                            yield FrameworkResult(framework_id, status, error=e)
+                        else:
+                            yield FrameworkResult(framework_id, status, data)
+                elif delay:
+                    await asyncio.sleep(delay)
+        finally:
+            cancel_tasks(downloads)
+
+    async def download_framework_to_parquet(
+        self,
+        framework_id: str,
+        path: str,
+        partition_by: Optional[str] = None,
+        page_size: int = _PARALLEL_PAGE_SIZE,
+        prefetch: int = 2,
+        compression: str = "snappy",
+        panel_debias_insight_id: Optional[int] = None,
+        schema=None,
+    ) -> str:
+        """See :meth:`ExplorerAPIClient.download_framework_to_parquet`;
+        pages are prefetched as tasks on the running loop."""
+        require_pyarrow()
+        fetch = self._parquet_page_fetcher(framework_id, page_size, panel_debias_insight_id)
+        response = await fetch(1)
+        if not response or not response.get("data"):
+            logger.warning(f"Framework {framework_id} has no data; nothing written to {path}")
+            return path
+        total_pages = response.get("pages") or 1
+        pending = deque()
+        next_page = 2
+        sink = ParquetSink(path, schema or infer_schema(response["data"]), partition_by, compression)
+        try:
+            while response is not None:
+                while next_page <= total_pages and len(pending) < max(1, prefetch):
+                    pending.append(asyncio.ensure_future(fetch(next_page)))
+                    next_page += 1
+                sink.write(record_batch(response.get("data"), sink.schema))
+                response = await pending.popleft() if pending else None
+        finally:
+            cancel_tasks(pending)
+            sink.close()
+        return path
+
+    async def _get_framework_data_paged(self, framework_id, data_type, size, max_workers):
+        first = await self._fetch_framework_page(framework_id, 1, size, data_type)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(page: int) -> dict:
+            async with semaphore:
+                return await self._fetch_framework_page(framework_id, page, size, data_type)
+
+        rest = await asyncio.gather(
+            *(fetch(page) for page in range(2, (first.get("pages") or 1) + 1))
+        )
+        return _combine_framework_pages(first, rest, data_type)
+
+    async def stream_framework_data(
+        self,
+        framework_id: str,
+        data_type: Optional[Literal["dataframe", "timeseries"]] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+    ):
+        """
+        Async generator over the pages of a framework's data. See
+        :meth:`ExplorerAPIClient.stream_framework_data`; prefetched pages
+        download as tasks on the running loop.
+
+        Args:
+            framework_id: Framework ID.
+            data_type: Data type to yield ("dataframe" or "timeseries").
+            page_size: Number of items per page (default 100).
+            prefetch: Pages to download ahead of the consumer (default 1).
+
+        Yields:
+            Data for each page as a DataFrame, timeseries, or dictionary.
+        """
+        first = await self._fetch_framework_page(framework_id, 1, page_size, data_type)
+        if not first or not first.get("data"):
+            return
+        total_pages = first.get("pages") or 1
+        pending = deque()
+        next_page = 2
+        try:
+            while True:
+                if first is not None:
+                    response, first = first, None
+                elif pending:
+                    response = await pending.popleft()
+                elif next_page <= total_pages:
+                    response = await self._fetch_framework_page(
+                        framework_id, next_page, page_size, data_type
+                    )
+                    next_page += 1
+                else:
+                    break
+                # Top the window up before yielding so the next pages
+                # download while the caller handles this one.
+                while next_page <= total_pages and len(pending) < prefetch:
+                    pending.append(asyncio.ensure_future(
+                        self._fetch_framework_page(framework_id, next_page, page_size, data_type)
+                    ))
+                    next_page += 1
+                chunk = _format_framework_data(response, data_type)
+                del response
+                yield chunk
+                del chunk
+        finally:
+            cancel_tasks(pending)
+
+
+class AsyncHubAPIClient(AsyncAPIClientMixin, HubAPIClient):
+    """Async :class:`HubAPIClient`; every method returns an awaitable."""
+
+    async def stream_webcontent_to_file(
+        self,
+        webcontent_id: int,
+        webcontent_date=None,
+        directory: str = "./",
+        filename: Optional[str] = None,
+        file_format: Literal["json", "ndjson", "parquet"] = "ndjson",
+        batch_rows: int = 50_000,
+    ):
+        """See :meth:`HubAPIClient.stream_webcontent_to_file`."""
+        url, params = self._webcontent_stream_request(webcontent_id, webcontent_date)
+        writer = self._webcontent_file_writer(
+            webcontent_id, webcontent_date, directory, filename, file_format, batch_rows
+        )
+        try:
+            async for chunk in self._iter_bytes(url, params=params):
+                writer.feed(chunk)
+            return writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+
+    async def iter_webcontent_data(
+        self,
+        webcontent_id: int,
+        webcontent_date=None,
+        size: int = 1000,
+        max_workers: int = 4,
+        prefetch: Optional[int] = None,
+        data_type: Optional[Literal["arrow"]] = None,
+    ):
+        """See :meth:`HubAPIClient.iter_webcontent_data`; an async generator
+        with up to ``prefetch`` pages in flight as tasks."""
+        convert = _webcontent_page_converter(data_type)
+
+        async def fetch_page(page: int) -> dict:
+            return _with_webcontent_total(
+                await self.get_webcontent_data(webcontent_id, webcontent_date, page=page, size=size)
+            )
+
+        async for response in aiter_page_responses(
+            fetch_page, size, items_key="data", max_workers=max_workers, prefetch=prefetch
+        ):
+            yield convert(response)
+
+
+class AsyncPlatformAPIClient(AsyncAPIClientMixin, PlatformAPIClient):
+    """Async :class:`PlatformAPIClient`; every method returns an awaitable."""
+
+
+class AsyncOntologyAPIClient(AsyncAPIClientMixin, OntologyAPIClient):
+    """Async :class:`OntologyAPIClient`; every method returns an awaitable."""
+
+    async def build_index(
+        self,
+        source: Literal["map", "entities"] = "map",
+        representation: Optional[list] = None,
+        max_workers: int = 4,
+    ) -> OntologyIndex:
+        """See :meth:`OntologyAPIClient.build_index`; the entity and insight
+        listings are fetched concurrently."""
+        if source == "entities":
+            async def entities() -> list:
+                return [
+                    e async for e in self.iter_entities(
+                        representation=representation, max_workers=max_workers
+                    )
+                ]
+        else:
+            async def entities() -> list:
+                return records(await self.get_entity_map())
+        entity_rows, insight_map = await asyncio.gather(entities(), self.get_insight_map())
+        return OntologyIndex.from_records(entity_rows, records(insight_map))
+
+
+class AsyncTranscriptAPIClient(AsyncAPIClientMixin, TranscriptAPIClient):
+    """Async :class:`TranscriptAPIClient`; every method returns an awaitable."""
+
+
+class AsyncCarbonArcClient:
+    """
+    Asyncio counterpart of :class:`CarbonArcClient`.
+
+    Exposes the same sub-clients with the same methods, each returning an
+    awaitable, over one pooled ``httpx`` transport with bounded
+    concurrency. Requires the ``async`` extra (``pip install
+    'carbonarc[async]'``).
+
+    Example:
+        >>> async with AsyncCarbonArcClient(token="...") as client:
+        ...     infos = await asyncio.gather(*(
+        ...         client.ontology.get_entity_information(i, "brand")
+        ...         for i in entity_ids
+        ...     ))
+    """
+
+    def __init__(
+        self,
+        token: str,
+        host: str = "https://api.carbonarc.co",
+        cams_host: str = "https://app.carbonarc.co",
+        version: str = "v2",
+        max_concurrency: int = 64,
+        keepalive_expiry: float = 30.0,
+        timeout: Optional[float] = 60.0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
+    ):
+        """
+        Initialize AsyncCarbonArcClient.
+
+        Args:
+            token (str): The authentication token to be used for requests.
+            host (str): Base URL of the data API. See :class:`CarbonArcClient`.
+            cams_host (str): Base URL of the CAMS API (Block endpoints).
+            version (str): The data-API version to use.
+            max_concurrency (int): Maximum requests in flight at once across
+                all sub-clients; also the connection pool size. Extra
+                requests wait on the event loop.
+            keepalive_expiry (float): Seconds an idle connection stays open.
+            timeout (float): Per-request timeout in seconds.
+            retry (RetryPolicy): Retry policy, as for :class:`CarbonArcClient`.
+            rate_limiter (RateLimiter): Optional client-side limiter; can be
+                shared with sync clients.
+            json_loads (callable): Decoder for response bodies, as for
+                :class:`CarbonArcClient`.
+            cache (ResponseCache): Optional persistent metadata cache, as
+                for :class:`CarbonArcClient`.
+            conditional_requests (bool): Revalidate repeat GETs with their
+                validators, as for :class:`CarbonArcClient`.
+        """
+        self.request_manager = AsyncHttpRequestManager(
+            auth_token=TokenAuth(token),
+            max_concurrency=max_concurrency,
+            keepalive_expiry=keepalive_expiry,
+            timeout=timeout,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            json_loads=json_loads,
+            cache=cache,
+            conditional_requests=conditional_requests,
+        )
+        shared = {
+            "token": token,
+            "host": host,
+            "version": version,
+            "request_manager": self.request_manager,
+        }
+        self.block = AsyncBlockAPIClient(cams_host=cams_host, **shared)
+        self.catalog = AsyncCatalogAPIClient(**shared)
+        self.data = AsyncDataAPIClient(**shared)
+        self.explorer = AsyncExplorerAPIClient(**shared)
+        self.hub = AsyncHubAPIClient(**shared)
+        self.client = AsyncPlatformAPIClient(**shared)
+        self.ontology = AsyncOntologyAPIClient(**shared)
+        self.transcripts = AsyncTranscriptAPIClient(**shared)
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self.request_manager.aclose()
+
+    async def __aenter__(self) -> "AsyncCarbonArcClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
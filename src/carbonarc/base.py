@@ -1,3 +1,5 @@
+from typing import Any, Callable, Optional
+
 from carbonarc.block import BlockAPIClient
 from carbonarc.catalog import CatalogAPIClient
 from carbonarc.data import DataAPIClient
@@ -6,6 +8,11 @@ from carbonarc.hub import HubAPIClient
 from carbonarc.client import PlatformAPIClient
 from carbonarc.ontology import OntologyAPIClient
 from carbonarc.transcripts import TranscriptAPIClient
+from carbonarc.utils.auth import TokenAuth
+from carbonarc.utils.cache import ResponseCache
+from carbonarc.utils.manager import HttpRequestManager
+from carbonarc.utils.ratelimit import RateLimiter
+from carbonarc.utils.retry import RetryPolicy
 
 
 class CarbonArcClient:
@@ -19,6 +26,15 @@ class CarbonArcClient:
         host: str = "https://api.carbonarc.co",
         cams_host: str = "https://app.carbonarc.co",
         version: str = "v2",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
     ):
         """
         Initialize CarbonArcClient with an authentication token and user agent.
@@ -35,14 +51,74 @@ class CarbonArcClient:
                 :class:`BlockAPIClient`. The two backends live on separate
                 hostnames in every environment (prod, stage, dev, local).
             version (str): The data-API version to use.
+            pool_connections (int): Number of per-host connection pools kept
+                by the shared session (the data API and CAMS use one each).
+            pool_maxsize (int): Maximum keep-alive connections per host.
+                Raise this when calling the client from many threads.
+            pool_block (bool): Wait for a free pooled connection instead of
+                opening a throwaway one when a host pool is exhausted.
+            keep_alive (bool): Reuse connections between requests.
+            retry (RetryPolicy): Retry policy for throttling (429), gateway
+                errors (5xx) and dropped connections, shared by every
+                sub-client. Defaults to ``RetryPolicy()``. Individual calls
+                can still override it with ``retry=...``.
+            rate_limiter (RateLimiter): Optional client-side limiter. Budgets
+                are per host, so ``host`` and ``cams_host`` are throttled
+                separately; share one instance between clients (or give it a
+                ``state_dir``) to budget several workers together.
+            json_loads (callable): Decoder for response bodies (bytes in,
+                Python objects out). Defaults to orjson or simdjson when
+                installed, else the standard library.
+            cache (ResponseCache): Optional persistent cache for slowly
+                changing metadata (entity/insight maps, ontology tree,
+                subjects, topics, dataset listings, data dictionaries).
+                Calling ``ontology.get_ontology_version()`` or
+                ``data.get_library_version_changes()`` invalidates the
+                cached ontology / library entries when the version moves.
+            conditional_requests (bool): Revalidate repeat GETs with the
+                ``ETag`` / ``Last-Modified`` of the previous response, so an
+                unchanged payload costs a ``304`` header exchange. Off by
+                default; only small (metadata-sized) bodies are remembered.
+                Hit/miss counters: ``client.request_manager.validators.stats()``.
+
+        All sub-clients share one :class:`HttpRequestManager` (and therefore
+        one ``requests.Session``), so a workload mixing ontology, explorer
+        and hub calls reuses warm TLS connections instead of opening a cold
+        pool per sub-client.
         """
-        self.block = BlockAPIClient(
-            token=token, host=host, cams_host=cams_host, version=version
+        self.request_manager = HttpRequestManager(
+            auth_token=TokenAuth(token),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            json_loads=json_loads,
+            cache=cache,
+            conditional_requests=conditional_requests,
         )
-        self.catalog = CatalogAPIClient(token=token, host=host, version=version)
-        self.data = DataAPIClient(token=token, host=host, version=version)
-        self.explorer = ExplorerAPIClient(token=token, host=host, version=version)
-        self.hub = HubAPIClient(token=token, host=host, version=version)
-        self.client = PlatformAPIClient(token=token, host=host, version=version)
-        self.ontology = OntologyAPIClient(token=token, host=host, version=version)
-        self.transcripts = TranscriptAPIClient(token=token, host=host, version=version)
+        shared = {
+            "token": token,
+            "host": host,
+            "version": version,
+            "request_manager": self.request_manager,
+        }
+        self.block = BlockAPIClient(cams_host=cams_host, **shared)
+        self.catalog = CatalogAPIClient(**shared)
+        self.data = DataAPIClient(**shared)
+        self.explorer = ExplorerAPIClient(**shared)
+        self.hub = HubAPIClient(**shared)
+        self.client = PlatformAPIClient(**shared)
+        self.ontology = OntologyAPIClient(**shared)
+        self.transcripts = TranscriptAPIClient(**shared)
+
+    def close(self) -> None:
+        """Close the shared session and release its pooled connections."""
+        self.request_manager.close()
+
+    def __enter__(self) -> "CarbonArcClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
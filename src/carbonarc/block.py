@@ -1,8 +1,14 @@
 import re
-from typing import Iterable, Optional
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Union
 from uuid import UUID
 
+import pandas as pd
+
 from carbonarc.utils.client import BaseAPIClient
+from carbonarc.utils.manager import HttpRequestManager
 
 
 # Block lag literals are ``<n><unit>`` with unit in {d, m, y} where m=30d
@@ -116,10 +122,26 @@ def _strip_sku_fields(arn: dict) -> dict:
     }
 
 
+def _sku_key(dataset_id, cut, lag) -> tuple:
+    # Server rows use ``""`` / ``None`` interchangeably for "no cut" / "no
+    # lag"; fold both to ``None`` so either form lands on the same key.
+    return (str(dataset_id), cut or None, lag or None)
+
+
+def _index_arns(all_arns: list[dict]) -> dict[tuple, list[dict]]:
+    """Group block-scoped ARN rows by normalized ``(dataset_id, cut,
+    lag)`` in one pass, so each SKU's ARNs are a single dict lookup."""
+    index: dict[tuple, list[dict]] = defaultdict(list)
+    for arn in all_arns:
+        if arn.get("scope") == "block":
+            index[_sku_key(arn.get("dataset_id"), arn.get("cut"), arn.get("lag"))].append(arn)
+    return index
+
+
 def _reshape_cuts_with_arns(
     cuts: list[dict],
     dataset_id: str,
-    all_arns: list[dict],
+    arns_by_sku: dict[tuple, list[dict]],
 ) -> list[dict]:
     """Replace each cut's ``lags`` / ``request_statuses`` pair with a
     SKU-centric ``skus`` array. Each SKU carries its lag, current request
@@ -129,17 +151,14 @@ def _reshape_cuts_with_arns(
     is uniquely identified by ``(cut, lag)``. The no-lag variant is
     represented with ``lag == None`` (server keys it as ``""`` in
     ``request_statuses`` and stores ``lag = NULL`` on ARN rows).
+
+    ``arns_by_sku`` is the :func:`_index_arns` index of the caller's ARNs.
     """
-    def _arn_matches(arn: dict, cut_value, lag_value) -> bool:
-        if arn.get("scope") != "block":
-            return False
-        if str(arn.get("dataset_id")) != dataset_id:
-            return False
-        if (arn.get("cut") or None) != (cut_value or None):
-            return False
-        if (arn.get("lag") or None) != (lag_value or None):
-            return False
-        return True
+    def _arns_for(cut_value, lag_value) -> list[dict]:
+        return [
+            _strip_sku_fields(a)
+            for a in arns_by_sku.get(_sku_key(dataset_id, cut_value, lag_value), ())
+        ]
 
     new_cuts: list[dict] = []
     for cut in cuts or []:
@@ -155,11 +174,7 @@ def _reshape_cuts_with_arns(
             skus.append({
                 "lag_days": _lag_to_days(lag),
                 "request_status": statuses.get(lag_key),
-                "arns": [
-                    _strip_sku_fields(a)
-                    for a in all_arns
-                    if _arn_matches(a, cut_value, lag)
-                ],
+                "arns": _arns_for(cut_value, lag),
             })
         # Surface the no-lag variant when the server only reports a status
         # under the empty-string key (lags list will be empty in that case).
@@ -170,11 +185,7 @@ def _reshape_cuts_with_arns(
             skus.append({
                 "lag_days": _lag_to_days(lag_value),
                 "request_status": status,
-                "arns": [
-                    _strip_sku_fields(a)
-                    for a in all_arns
-                    if _arn_matches(a, cut_value, lag_value)
-                ],
+                "arns": _arns_for(cut_value, lag_value),
             })
 
         new_cut = {
@@ -195,6 +206,295 @@ def _dataset_has_status(dataset: dict, statuses: Iterable[str]) -> bool:
     return False
 
 
+_ACTIVE_STATUSES = _ACCESS_STATUSES | _PENDING_STATUSES | _DENIED_STATUSES
+
+
+def _filter_my_access(datasets: list[dict]) -> list[dict]:
+    return [d for d in datasets if _dataset_has_status(d, _ACCESS_STATUSES)]
+
+
+def _filter_pending(datasets: list[dict]) -> list[dict]:
+    return [d for d in datasets if _dataset_has_status(d, _PENDING_STATUSES)]
+
+
+def _filter_rejected(datasets: list[dict]) -> list[dict]:
+    return [d for d in datasets if _dataset_has_status(d, _DENIED_STATUSES)]
+
+
+def _filter_unrequested(datasets: list[dict], status: str) -> list[dict]:
+    """Datasets in catalog ``status`` with no access / pending / denied
+    request for the caller on any cut/lag."""
+    return [
+        d for d in datasets
+        if d.get("status") == status
+        and not _dataset_has_status(d, _ACTIVE_STATUSES)
+    ]
+
+
+def _find_dataset(datasets: list[dict], dataset_id: str) -> Optional[dict]:
+    return next(
+        (d for d in datasets if str(d.get("dataset_id")) == dataset_id),
+        None,
+    )
+
+
+def _prepare_datasets(response: dict, cams_host: str) -> dict:
+    for d in response.get("datasets", []):
+        _absolutize_tear_sheet(d, cams_host)
+    return response
+
+
+def _prepare_requests(response: dict, cams_host: str) -> dict:
+    # The server returns the rows under ``items``; rename to
+    # ``requests`` for the public SDK surface.
+    response["requests"] = [
+        _absolutize_tear_sheet(r, cams_host)
+        for r in (response.pop("items", None) or [])
+    ]
+    return response
+
+
+def _request_timeline(r: dict) -> dict:
+    """Flatten one Block request row into the ``request_history`` shape:
+    identifying fields plus an ordered ``events`` list with one entry per
+    populated lifecycle step."""
+    events: list[dict] = []
+
+    if r.get("requestor_email") or r.get("created_at"):
+        events.append({
+            "step": "submitted",
+            "actor": r.get("requestor_email"),
+            "at": r.get("created_at"),
+            "use_case": r.get("use_case"),
+        })
+
+    if r.get("approved_by_block_admin"):
+        events.append({
+            "step": "block_admin_approved",
+            "actor": r.get("approved_by_block_admin"),
+            "at": None,
+        })
+
+    if r.get("approved_by_compliance"):
+        events.append({
+            "step": "compliance_approved",
+            "actor": r.get("approved_by_compliance"),
+            "at": None,
+        })
+
+    if r.get("approved_at"):
+        events.append({
+            "step": "fully_approved",
+            "at": r.get("approved_at"),
+        })
+
+    if r.get("rejected_by") or r.get("rejection_message"):
+        events.append({
+            "step": "rejected",
+            "actor": r.get("rejected_by"),
+            "source": r.get("rejection_source"),
+            "reason": r.get("rejection_message"),
+            "at": r.get("updated_at"),
+        })
+
+    if r.get("cancellation_requested_at"):
+        events.append({
+            "step": "cancellation_requested",
+            "actor": r.get("cancellation_requested_by"),
+            "at": r.get("cancellation_requested_at"),
+            "reason": r.get("cancellation_request_reason"),
+        })
+
+    if r.get("trial_start_date"):
+        events.append({
+            "step": "trial_started",
+            "at": r.get("trial_start_date"),
+            "trigger": r.get("trial_start_trigger"),
+        })
+
+    if r.get("first_ingestion_at"):
+        events.append({
+            "step": "first_ingestion",
+            "at": r.get("first_ingestion_at"),
+        })
+
+    if r.get("trial_end_date"):
+        events.append({
+            "step": "trial_ends",
+            "at": r.get("trial_end_date"),
+        })
+
+    return {
+        "request_id": r.get("id"),
+        "dataset_id": r.get("dataset_id"),
+        "lag_days": _lag_to_days(r.get("lag")),
+        "cut": r.get("cut"),
+        "current_status": r.get("status"),
+        "internal_queue_step": _simplify_internal_queue_step(r),
+        "trial_duration_months": r.get("trial_duration_months"),
+        "annual_price": r.get("annual_price"),
+        "events": events,
+    }
+
+
+def _group_by_dataset(rows: list[dict]) -> dict[str, list[dict]]:
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for row in rows:
+        grouped[str(row.get("dataset_id"))].append(row)
+    return grouped
+
+
+_HISTORY_REQUEST_COLUMNS = [
+    "dataset_id", "request_id", "cut", "lag_days", "current_status",
+    "internal_queue_step", "trial_duration_months", "annual_price",
+]
+_HISTORY_EVENT_COLUMNS = ["step", "at", "actor", "use_case", "source", "reason", "trigger"]
+
+
+def _request_histories(
+    requests_by_dataset: dict[str, list[dict]],
+    dataset_ids: Optional[Iterable[str]],
+    as_dataframe: bool,
+):
+    """Build :meth:`BlockAPIClient.request_histories` from request rows
+    already grouped by ``dataset_id``."""
+    if dataset_ids is None:
+        dataset_ids = requests_by_dataset.keys()
+    histories = {
+        dataset_id: [_request_timeline(r) for r in requests_by_dataset.get(dataset_id, ())]
+        for dataset_id in dataset_ids
+    }
+    if not as_dataframe:
+        return histories
+    rows = []
+    for timelines in histories.values():
+        for timeline in timelines:
+            request = {k: timeline[k] for k in _HISTORY_REQUEST_COLUMNS}
+            # A request with no populated step still gets one row, so every
+            # request is represented in the frame.
+            for event in timeline["events"] or [{}]:
+                rows.append({**request, **event})
+    return pd.DataFrame(rows, columns=_HISTORY_REQUEST_COLUMNS + _HISTORY_EVENT_COLUMNS)
+
+
+def _build_dataset_status(
+    dataset_id: str,
+    catalog_entry: Optional[dict],
+    arns_by_sku: dict[tuple, list[dict]],
+    all_requests: list[dict],
+) -> dict:
+    """Assemble the :meth:`BlockAPIClient.dataset_status` payload from
+    already-fetched datasets, indexed ARNs and requests."""
+    # Strip the redundant ``dataset_id`` from the catalog dict — it's
+    # already echoed at the top level — and reshape each cut's lags +
+    # request_statuses into a per-SKU ``skus`` array with the
+    # registered ARNs attached. ARNs are per-(dataset_id, cut, lag),
+    # so the SKU axis is the natural place to surface them.
+    if catalog_entry is not None:
+        cuts = catalog_entry.get("cuts") or []
+        reshaped_cuts = _reshape_cuts_with_arns(cuts, dataset_id, arns_by_sku)
+        # Strip the redundant ``dataset_id`` and the freeform ``lag``
+        # string ("T + 7 Days") — both are echoed elsewhere in
+        # normalized form (``lag_days`` below).
+        lag_raw = catalog_entry.get("lag")
+        catalog_entry = {
+            k: v for k, v in catalog_entry.items()
+            if k not in {"dataset_id", "cuts", "lag"}
+        }
+        # Normalize the dataset-level lag label to integer days — same
+        # convention as the SKUs and request intake form.
+        catalog_entry["lag_days"] = _lag_to_days(lag_raw)
+        catalog_entry["cuts"] = reshaped_cuts
+    requests_for_dataset = []
+    for r in all_requests:
+        if str(r.get("dataset_id")) != dataset_id:
+            continue
+        simplified = {k: v for k, v in r.items() if k != "lag"}
+        simplified["lag_days"] = _lag_to_days(r.get("lag"))
+        simplified["internal_queue_step"] = _simplify_internal_queue_step(r)
+        requests_for_dataset.append(simplified)
+    return {
+        "dataset_id": dataset_id,
+        "catalog": catalog_entry,
+        "requests": requests_for_dataset,
+    }
+
+
+class BlockSnapshot:
+    """
+    Point-in-time view of the caller's Block catalog: the dataset listing,
+    request rows and registered ARNs fetched together, with the
+    :meth:`BlockAPIClient.my_access` / ``pending`` / ``available`` /
+    ``coming_soon`` / ``rejected`` buckets precomputed and rows indexed by
+    ``dataset_id``.
+
+    Pass it as ``snapshot=`` to those methods (and to ``dataset_status`` /
+    ``request_history``) to answer them without further CAMS calls. The
+    returned rows are shared with the snapshot; treat them as read-only.
+    """
+
+    def __init__(self, datasets: list[dict], requests: list[dict], arns: list[dict]):
+        self.datasets = datasets
+        self.requests = requests
+        self.arns = arns
+        self.fetched_at = time.monotonic()
+
+        self.datasets_by_id: dict[str, dict] = {}
+        for d in datasets:
+            # First entry wins, as with a linear ``_find_dataset`` scan.
+            self.datasets_by_id.setdefault(str(d.get("dataset_id")), d)
+        self.requests_by_dataset = _group_by_dataset(requests)
+        self.arns_by_sku = _index_arns(arns)
+
+        self.my_access = _filter_my_access(datasets)
+        self.pending = _filter_pending(datasets)
+        self.available = _filter_unrequested(datasets, "ready")
+        self.coming_soon = _filter_unrequested(datasets, "coming_soon")
+        self.rejected = _filter_rejected(datasets)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.monotonic() - self.fetched_at
+
+    def dataset(self, dataset_id: str) -> Optional[dict]:
+        return self.datasets_by_id.get(dataset_id)
+
+    def requests_for(self, dataset_id: str) -> list[dict]:
+        return self.requests_by_dataset.get(dataset_id, [])
+
+    def dataset_status(self, dataset_id: str) -> dict:
+        """See :meth:`BlockAPIClient.dataset_status`."""
+        return _build_dataset_status(
+            dataset_id,
+            self.dataset(dataset_id),
+            self.arns_by_sku,
+            self.requests_for(dataset_id),
+        )
+
+    def dataset_status_many(self, dataset_ids: Iterable[str]) -> dict[str, dict]:
+        """See :meth:`BlockAPIClient.dataset_status_many`."""
+        return {dataset_id: self.dataset_status(dataset_id) for dataset_id in dataset_ids}
+
+    def request_history(self, dataset_id: str) -> list[dict]:
+        """See :meth:`BlockAPIClient.request_history`."""
+        return [_request_timeline(r) for r in self.requests_for(dataset_id)]
+
+    def request_histories(
+        self, dataset_ids: Optional[Iterable[str]] = None, as_dataframe: bool = False
+    ):
+        """See :meth:`BlockAPIClient.request_histories`."""
+        return _request_histories(self.requests_by_dataset, dataset_ids, as_dataframe)
+
+
+def _build_snapshot(datasets: dict, requests: dict, arns: dict) -> BlockSnapshot:
+    return BlockSnapshot(
+        datasets.get("datasets", []),
+        requests.get("requests", []),
+        arns.get("items", []) or [],
+    )
+
+
 class BlockAPIClient(BaseAPIClient):
     """
     A client for Carbon Arc Block functionality:
@@ -208,6 +508,7 @@ class BlockAPIClient(BaseAPIClient):
         host: str = "https://api.carbonarc.co",
         cams_host: str = "https://app.carbonarc.co",
         version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
     ):
         """All Block functionality is served by the CAMS API
         under ``/api/v1/block/*`` — dataset discovery, request lifecycle,
@@ -215,9 +516,45 @@ class BlockAPIClient(BaseAPIClient):
         signature for parity with the other sub-clients but is unused;
         the data API hosts none of the Block endpoints today.
         """
-        super().__init__(token=token, host=host, version=version)
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
         self._cams_host = cams_host.rstrip('/')
         self._v1_url = f"{self._cams_host}/api/v1/block"
+        self._snapshot: Optional[BlockSnapshot] = None
+
+    def snapshot(self, max_age: Optional[float] = None) -> BlockSnapshot:
+        """
+        Fetch the datasets, requests and ARNs in parallel into a
+        :class:`BlockSnapshot`.
+
+        Args:
+            max_age: Reuse the snapshot taken by a previous call if it is at
+                most this many seconds old. ``None`` always fetches afresh.
+                Requests and ARN (de)registrations made through this client
+                discard the reusable snapshot.
+
+        Returns:
+            BlockSnapshot: The snapshot; pass it as ``snapshot=`` to the
+            bucket and status methods.
+        """
+        if (
+            max_age is not None
+            and self._snapshot is not None
+            and self._snapshot.age <= max_age
+        ):
+            return self._snapshot
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            datasets = pool.submit(self.list_datasets)
+            requests = pool.submit(self.list_requests)
+            arns = pool.submit(self.list_arns)
+            self._snapshot = _build_snapshot(
+                datasets.result(), requests.result(), arns.result()
+            )
+        return self._snapshot
 
     # ---- Phase 1: discovery -------------------------------------------------
 
@@ -234,67 +571,65 @@ class BlockAPIClient(BaseAPIClient):
             whose ``download_url`` is an absolute URL the caller can fetch
             directly.
         """
-        response = self._get(f"{self._v1_url}/datasets")
-        for d in response.get("datasets", []):
-            _absolutize_tear_sheet(d, self._cams_host)
-        return response
+        return self._then(
+            self._get(f"{self._v1_url}/datasets"),
+            lambda r: _prepare_datasets(r, self._cams_host),
+        )
 
-    def my_access(self) -> list[dict]:
+    def my_access(self, snapshot: Optional[BlockSnapshot] = None) -> list[dict]:
         """Datasets the caller has active access to (approved, trial active,
-        or contracted) on at least one cut/lag."""
-        return [
-            d for d in self.list_datasets().get("datasets", [])
-            if _dataset_has_status(d, _ACCESS_STATUSES)
-        ]
+        or contracted) on at least one cut/lag. With ``snapshot``, answered
+        from it without a request."""
+        if snapshot is not None:
+            return self._resolved(snapshot.my_access)
+        return self._then(
+            self.list_datasets(), lambda r: _filter_my_access(r.get("datasets", []))
+        )
 
-    def pending(self) -> list[dict]:
+    def pending(self, snapshot: Optional[BlockSnapshot] = None) -> list[dict]:
         """Datasets with an in-flight (pending) request on at least one
         cut/lag."""
-        return [
-            d for d in self.list_datasets().get("datasets", [])
-            if _dataset_has_status(d, _PENDING_STATUSES)
-        ]
+        if snapshot is not None:
+            return self._resolved(snapshot.pending)
+        return self._then(
+            self.list_datasets(), lambda r: _filter_pending(r.get("datasets", []))
+        )
 
-    def available(self) -> list[dict]:
+    def available(self, snapshot: Optional[BlockSnapshot] = None) -> list[dict]:
         """Datasets that are publicly visible (``status='ready'``) and have
         no active request status for the caller on any cut/lag — i.e.
         eligible to request."""
-        out = []
-        for d in self.list_datasets().get("datasets", []):
-            if d.get("status") != "ready":
-                continue
-            if _dataset_has_status(
-                d, _ACCESS_STATUSES | _PENDING_STATUSES | _DENIED_STATUSES
-            ):
-                continue
-            out.append(d)
-        return out
+        if snapshot is not None:
+            return self._resolved(snapshot.available)
+        return self._then(
+            self.list_datasets(),
+            lambda r: _filter_unrequested(r.get("datasets", []), "ready"),
+        )
 
-    def coming_soon(self) -> list[dict]:
+    def coming_soon(self, snapshot: Optional[BlockSnapshot] = None) -> list[dict]:
         """Datasets announced but not yet released (``status='coming_soon'``).
         Preview-only — visible in the catalog with metadata and pricing, but
         not yet requestable. Excludes any the caller already has an
         access / pending / denied request against, mirroring
         :meth:`available`."""
-        out = []
-        for d in self.list_datasets().get("datasets", []):
-            if d.get("status") != "coming_soon":
-                continue
-            if _dataset_has_status(
-                d, _ACCESS_STATUSES | _PENDING_STATUSES | _DENIED_STATUSES
-            ):
-                continue
-            out.append(d)
-        return out
+        if snapshot is not None:
+            return self._resolved(snapshot.coming_soon)
+        return self._then(
+            self.list_datasets(),
+            lambda r: _filter_unrequested(r.get("datasets", []), "coming_soon"),
+        )
 
-    def rejected(self) -> list[dict]:
+    def rejected(self, snapshot: Optional[BlockSnapshot] = None) -> list[dict]:
         """Datasets with a rejected request on at least one cut/lag."""
-        return [
-            d for d in self.list_datasets().get("datasets", [])
-            if _dataset_has_status(d, _DENIED_STATUSES)
-        ]
+        if snapshot is not None:
+            return self._resolved(snapshot.rejected)
+        return self._then(
+            self.list_datasets(), lambda r: _filter_rejected(r.get("datasets", []))
+        )
 
-    def request_history(self, dataset_id: str) -> list[dict]:
+    def request_history(
+        self, dataset_id: str, snapshot: Optional[BlockSnapshot] = None
+    ) -> list[dict]:
         """Per-request timeline of every Block request the caller's client
         has filed against ``dataset_id`` — whether the result is approved,
         in-flight, denied, contracted, or anything else. Works for any
@@ -333,91 +668,59 @@ class BlockAPIClient(BaseAPIClient):
         Args:
             dataset_id: CA-prefixed dataset identifier (e.g. ``"CA0031"``).
                 Matched exactly — case-sensitive.
+            snapshot: Optional :class:`BlockSnapshot` to answer from
+                instead of calling :meth:`list_requests`.
         """
-        out: list[dict] = []
-        for r in self.list_requests().get("requests", []):
-            if str(r.get("dataset_id")) != dataset_id:
-                continue
-            events: list[dict] = []
-
-            if r.get("requestor_email") or r.get("created_at"):
-                events.append({
-                    "step": "submitted",
-                    "actor": r.get("requestor_email"),
-                    "at": r.get("created_at"),
-                    "use_case": r.get("use_case"),
-                })
-
-            if r.get("approved_by_block_admin"):
-                events.append({
-                    "step": "block_admin_approved",
-                    "actor": r.get("approved_by_block_admin"),
-                    "at": None,
-                })
-
-            if r.get("approved_by_compliance"):
-                events.append({
-                    "step": "compliance_approved",
-                    "actor": r.get("approved_by_compliance"),
-                    "at": None,
-                })
-
-            if r.get("approved_at"):
-                events.append({
-                    "step": "fully_approved",
-                    "at": r.get("approved_at"),
-                })
-
-            if r.get("rejected_by") or r.get("rejection_message"):
-                events.append({
-                    "step": "rejected",
-                    "actor": r.get("rejected_by"),
-                    "source": r.get("rejection_source"),
-                    "reason": r.get("rejection_message"),
-                    "at": r.get("updated_at"),
-                })
-
-            if r.get("cancellation_requested_at"):
-                events.append({
-                    "step": "cancellation_requested",
-                    "actor": r.get("cancellation_requested_by"),
-                    "at": r.get("cancellation_requested_at"),
-                    "reason": r.get("cancellation_request_reason"),
-                })
-
-            if r.get("trial_start_date"):
-                events.append({
-                    "step": "trial_started",
-                    "at": r.get("trial_start_date"),
-                    "trigger": r.get("trial_start_trigger"),
-                })
-
-            if r.get("first_ingestion_at"):
-                events.append({
-                    "step": "first_ingestion",
-                    "at": r.get("first_ingestion_at"),
-                })
-
-            if r.get("trial_end_date"):
-                events.append({
-                    "step": "trial_ends",
-                    "at": r.get("trial_end_date"),
-                })
-
-            out.append({
-                "request_id": r.get("id"),
-                "dataset_id": r.get("dataset_id"),
-                "lag_days": _lag_to_days(r.get("lag")),
-                "cut": r.get("cut"),
-                "current_status": r.get("status"),
-                "internal_queue_step": _simplify_internal_queue_step(r),
-                "trial_duration_months": r.get("trial_duration_months"),
-                "annual_price": r.get("annual_price"),
-                "events": events,
-            })
-        return out
+        if snapshot is not None:
+            return self._resolved(snapshot.request_history(dataset_id))
+        return self._then(
+            self.list_requests(),
+            lambda r: [
+                _request_timeline(row)
+                for row in r.get("requests", [])
+                if str(row.get("dataset_id")) == dataset_id
+            ],
+        )
 
-    def dataset_status(self, dataset_id: str) -> dict:
+    def request_histories(
+        self,
+        dataset_ids: Optional[Iterable[str]] = None,
+        as_dataframe: bool = False,
+        snapshot: Optional[BlockSnapshot] = None,
+    ) -> Union[dict[str, list[dict]], pd.DataFrame]:
+        """:meth:`request_history` for many datasets from one
+        :meth:`list_requests` call, grouping the rows by ``dataset_id`` in a
+        single pass.
+
+        Args:
+            dataset_ids: Datasets to report on. ``None`` (the default)
+                reports every dataset the client has filed requests
+                against; listed datasets with no requests map to ``[]``.
+            as_dataframe: Return one flat DataFrame row per event
+                (request fields repeated on each row; a request with no
+                populated step gets a single row with empty event fields)
+                instead of a dict.
+            snapshot: Optional :class:`BlockSnapshot` to answer from.
+
+        Returns:
+            Dict mapping dataset_id to its list of request timelines, in
+            the :meth:`request_history` shape, or a DataFrame with columns
+            ``dataset_id, request_id, cut, lag_days, current_status,
+            internal_queue_step, trial_duration_months, annual_price, step,
+            at, actor, use_case, source, reason, trigger``.
+        """
+        if snapshot is not None:
+            return self._resolved(snapshot.request_histories(dataset_ids, as_dataframe))
+        return self._then(
+            self.list_requests(),
+            lambda r: _request_histories(
+                _group_by_dataset(r.get("requests", [])), dataset_ids, as_dataframe
+            ),
+        )
+
+    def dataset_status(
+        self, dataset_id: str, snapshot: Optional[BlockSnapshot] = None
+    ) -> dict:
         """One-call summary of the caller's Block access for ``dataset_id``.
 
         Joins :meth:`list_datasets` (catalog metadata + current per-cut /
@@ -430,6 +733,8 @@ class BlockAPIClient(BaseAPIClient):
         Args:
             dataset_id: CA-prefixed dataset identifier (e.g. ``"CA0031"``).
                 Matched exactly — case-sensitive.
+            snapshot: Optional :class:`BlockSnapshot` to answer from; use
+                one when building the status of many datasets.
 
         Returns:
             ::
@@ -468,48 +773,43 @@ class BlockAPIClient(BaseAPIClient):
                     ],
                 }
         """
-        catalog_entry = next(
-            (
-                d for d in self.list_datasets().get("datasets", [])
-                if str(d.get("dataset_id")) == dataset_id
-            ),
-            None,
-        )
-        # Strip the redundant ``dataset_id`` from the catalog dict — it's
-        # already echoed at the top level — and reshape each cut's lags +
-        # request_statuses into a per-SKU ``skus`` array with the
-        # registered ARNs attached. ARNs are per-(dataset_id, cut, lag),
-        # so the SKU axis is the natural place to surface them.
+        if snapshot is not None:
+            return snapshot.dataset_status(dataset_id)
+        datasets = self.list_datasets().get("datasets", [])
+        catalog_entry = _find_dataset(datasets, dataset_id)
+        arns_by_sku = {}
         if catalog_entry is not None:
-            all_arns = self.list_arns().get("items", []) or []
-            cuts = catalog_entry.get("cuts") or []
-            reshaped_cuts = _reshape_cuts_with_arns(cuts, dataset_id, all_arns)
-            # Strip the redundant ``dataset_id`` and the freeform ``lag``
-            # string ("T + 7 Days") — both are echoed elsewhere in
-            # normalized form (``lag_days`` below).
-            lag_raw = catalog_entry.get("lag")
-            catalog_entry = {
-                k: v for k, v in catalog_entry.items()
-                if k not in {"dataset_id", "cuts", "lag"}
-            }
-            # Normalize the dataset-level lag label to integer days — same
-            # convention as the SKUs and request intake form.
-            catalog_entry["lag_days"] = _lag_to_days(lag_raw)
-            catalog_entry["cuts"] = reshaped_cuts
-        all_requests = self.list_requests().get("requests", [])
-        requests_for_dataset = []
-        for r in all_requests:
-            if str(r.get("dataset_id")) != dataset_id:
-                continue
-            simplified = {k: v for k, v in r.items() if k != "lag"}
-            simplified["lag_days"] = _lag_to_days(r.get("lag"))
-            simplified["internal_queue_step"] = _simplify_internal_queue_step(r)
-            requests_for_dataset.append(simplified)
-        return {
-            "dataset_id": dataset_id,
-            "catalog": catalog_entry,
-            "requests": requests_for_dataset,
-        }
+            arns_by_sku = _index_arns(self.list_arns().get("items", []) or [])
+        return _build_dataset_status(
+            dataset_id,
+            catalog_entry,
+            arns_by_sku,
+            self.list_requests().get("requests", []),
+        )
+
+    def dataset_status_many(
+        self,
+        dataset_ids: Iterable[str],
+        snapshot: Optional[BlockSnapshot] = None,
+    ) -> dict[str, dict]:
+        """:meth:`dataset_status` for several datasets from a single fetch
+        of the datasets, requests and ARNs (or from ``snapshot``).
+
+        ARNs and requests are indexed once and shared by every dataset, so
+        the cost grows with the number of rows rather than with
+        datasets × SKUs × ARNs.
+
+        Args:
+            dataset_ids: CA-prefixed dataset identifiers.
+            snapshot: Optional :class:`BlockSnapshot` to answer from;
+                otherwise a fresh one is fetched.
+
+        Returns:
+            Dict mapping each dataset_id to its ``dataset_status`` payload.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        return snapshot.dataset_status_many(dataset_ids)
 
     # ---- Phase 2: trial-access lifecycle ------------------------------------
 
@@ -550,9 +850,10 @@ class BlockAPIClient(BaseAPIClient):
             body["additional_email_recipients"] = additional_email_recipients
         if accepted_block_tou_version_id is not None:
             body["accepted_block_tou_version_id"] = accepted_block_tou_version_id
-        return _absolutize_tear_sheet(
+        self._snapshot = None
+        return self._then(
             self._post(f"{self._v1_url}/requests", json=body),
-            self._cams_host,
+            lambda r: _absolutize_tear_sheet(r, self._cams_host),
         )
 
     def list_requests(self) -> dict:
@@ -562,20 +863,16 @@ class BlockAPIClient(BaseAPIClient):
             Dict with ``requests`` (list of request rows), ``total``, and
             ``users_by_email`` (lookup table of requestor / approver details).
         """
-        response = self._get(f"{self._v1_url}/requests")
-        # The server returns the rows under ``items``; rename to
-        # ``requests`` for the public SDK surface.
-        response["requests"] = [
-            _absolutize_tear_sheet(r, self._cams_host)
-            for r in (response.pop("items", None) or [])
-        ]
-        return response
+        return self._then(
+            self._get(f"{self._v1_url}/requests"),
+            lambda r: _prepare_requests(r, self._cams_host),
+        )
 
     def get_request(self, request_id: str) -> dict:
         """Fetch a single Block request by UUID."""
-        return _absolutize_tear_sheet(
+        return self._then(
             self._get(f"{self._v1_url}/requests/{request_id}"),
-            self._cams_host,
+            lambda r: _absolutize_tear_sheet(r, self._cams_host),
         )
 
     # ---- Phase 3: pre-approvals ---------------------------------------------
@@ -599,6 +896,7 @@ class BlockAPIClient(BaseAPIClient):
     def register_sample_arns(self, arns: list[str]) -> dict:
         """Register sample-scoped IAM ARN(s). Grants access to all sample
         datasets the client is entitled to (present and future)."""
+        self._snapshot = None
         return self._post(
             f"{self._v1_url}/arns/sample",
             json={"arns": arns},
@@ -618,6 +916,7 @@ class BlockAPIClient(BaseAPIClient):
             body["lag"] = lag
         if cut is not None:
             body["cut"] = cut
+        self._snapshot = None
         return self._post(f"{self._v1_url}/arns/block", json=body)
 
     def list_arns(self) -> dict:
@@ -643,4 +942,5 @@ class BlockAPIClient(BaseAPIClient):
 
     def deregister_arn(self, arn_id: str) -> dict:
         """Deregister a previously-registered ARN."""
+        self._snapshot = None
         return self._delete(f"{self._v1_url}/arns/{arn_id}")
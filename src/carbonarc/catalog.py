@@ -1,6 +1,7 @@
 from typing import Literal, Optional, Union
 
 from carbonarc.utils.client import BaseAPIClient
+from carbonarc.utils.manager import HttpRequestManager
 
 
 class CatalogAPIClient(BaseAPIClient):
@@ -13,8 +14,14 @@ class CatalogAPIClient(BaseAPIClient):
         token: str,
         host: str = "https://api.carbonarc.co",
         version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
     ):
-        super().__init__(token=token, host=host, version=version)
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
         self.base_catalog_url = self._build_base_url("catalog")
 
     def list_assets(
@@ -1,4 +1,7 @@
+from typing import Optional
+
 from carbonarc.utils.client import BaseAPIClient
+from carbonarc.utils.manager import HttpRequestManager
 
 class PlatformAPIClient(BaseAPIClient):
     """
@@ -9,7 +12,8 @@ class PlatformAPIClient(BaseAPIClient):
         self, 
         token: str,
         host: str = "https://api.carbonarc.co",
-        version: str = "v2"
+        version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
         ):
         """
         Initialize PlatformAPIClient.
@@ -18,8 +22,14 @@ class PlatformAPIClient(BaseAPIClient):
             token: Authentication token for requests.
             host: Base URL of the Carbon Arc API.
             version: API version to use.
+            request_manager: Optional shared transport to reuse.
         """
-        super().__init__(token=token, host=host, version=version)
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
         
         self.base_platform_url = self._build_base_url("clients")
 
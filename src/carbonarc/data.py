@@ -7,6 +7,7 @@ from datetime import datetime
 import base64
 
 from carbonarc.utils.client import BaseAPIClient
+from carbonarc.utils.manager import HttpRequestManager
 
 log = logging.getLogger(__name__)
 
@@ -21,6 +22,7 @@ class DataAPIClient(BaseAPIClient):
         token: str,
         host: str = "https://api.carbonarc.co",
         version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
     ):
         """
         Initialize DataAPIClient with an authentication token and user agent.
@@ -29,8 +31,14 @@ class DataAPIClient(BaseAPIClient):
             token: The authentication token to be used for requests.
             host: The base URL of the Carbon Arc API.
             version: The API version to use.
+            request_manager: Optional shared transport to reuse.
         """
-        super().__init__(token=token, host=host, version=version)
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
 
         self.base_data_url = self._build_base_url("library")
 
@@ -39,7 +47,7 @@ class DataAPIClient(BaseAPIClient):
     ) -> dict:
         url = f"{self.base_data_url}/data"
 
-        return self._get(url)
+        return self._get(url, cache="library.datasets")
 
     def get_dataset_information(self, dataset_id: str) -> dict:
         """
@@ -74,7 +82,7 @@ class DataAPIClient(BaseAPIClient):
         endpoint = f"data/{dataset_id}/tearsheet-pdf"
         url = f"{self.base_data_url}/{endpoint}"
 
-        return self._stream(url).content
+        return self._then(self._stream(url), lambda response: response.content)
 
     def download_tearsheet_pdf(self, dataset_id: str, directory: Optional[str] = None) -> str:
         """
@@ -99,15 +107,17 @@ class DataAPIClient(BaseAPIClient):
                 authentication token is missing or invalid.
             OSError: If there are file system errors (permissions, disk space, etc.).
         """
-        pdf_bytes = self.get_tearsheet_pdf(dataset_id)
         file_name = f"tearsheet_{dataset_id}.pdf"
         output_dir = os.path.abspath(directory if directory is not None else ".")
-        os.makedirs(output_dir, exist_ok=True)
-        file_path = os.path.join(output_dir, file_name)
-        with open(file_path, "wb") as f:
-            f.write(pdf_bytes)
 
-        return file_path
+        def write(pdf_bytes: bytes) -> str:
+            os.makedirs(output_dir, exist_ok=True)
+            file_path = os.path.join(output_dir, file_name)
+            with open(file_path, "wb") as f:
+                f.write(pdf_bytes)
+            return file_path
+
+        return self._then(self.get_tearsheet_pdf(dataset_id), write)
 
     def get_data_dictionary(self, 
                             dataset_id: str,
@@ -128,7 +138,7 @@ class DataAPIClient(BaseAPIClient):
         if entity_topic_id:
             params["entity_topic_id"] = entity_topic_id
 
-        return self._get(url, params=params)
+        return self._get(url, params=params, cache="library.data_dictionary")
 
     def get_data_sample(self, dataset_id: str, entity_topic_id: Optional[int] = None) -> dict:
         """
@@ -254,4 +264,12 @@ class DataAPIClient(BaseAPIClient):
             params["entity_representation"] = entity_representation
 
         url = f"{self.base_data_url}/data-library/version-changes"
-        return self._get(url, params=params)
\ No newline at end of file
+        # Each filter combination is tracked separately; any of them moving
+        # on invalidates the cached library metadata.
+        name = "library-version-changes:" + ",".join(
+            f"{k}={v}" for k, v in sorted(params.items()) if v is not None
+        )
+        return self._then(
+            self._get(url, params=params),
+            lambda r: self._note_version(name, "library.", r),
+        )
\ No newline at end of file
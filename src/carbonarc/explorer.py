@@ -1,13 +1,269 @@
+import itertools
 import pandas as pd
-from typing import Optional, Literal, Union, List, Dict, Any
+import requests
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Optional, Literal, Union, List, Dict, Any, Iterable, Iterator, Sequence, Tuple, Callable, NamedTuple
+)
 import logging
 
 from carbonarc.utils.timeseries import timeseries_response_to_pandas
+from carbonarc.utils.cache import fingerprint
+from carbonarc.utils.arrow import (
+    ParquetSink, infer_schema, record_batch, require_pyarrow, tables_from_pages, to_table
+)
 from carbonarc.utils.client import BaseAPIClient
-from carbonarc.utils.exceptions import InvalidConfigurationError
+from carbonarc.utils.decoding import JSONArrayStream
+from carbonarc.utils.manager import HttpRequestManager
+from carbonarc.utils.exceptions import (
+    CarbonArcException,
+    InvalidConfigurationError,
+    PartialOrderError,
+)
+from carbonarc.utils.pagination import iter_pages
 
 logger = logging.getLogger(__name__)
 
+# Page size used by the paged-parallel download when the caller gives none.
+_PARALLEL_PAGE_SIZE = 1000
+
+_ENTITY_ID_COLUMNS = ("carc_id", "entity_id", "id")
+_REPRESENTATION_COLUMNS = ("representation", "entity_representation")
+
+
+def _first_column(frame: pd.DataFrame, candidates: Sequence[str], what: str) -> str:
+    for column in candidates:
+        if column in frame.columns:
+            return column
+    raise InvalidConfigurationError(
+        f"{what} DataFrame needs one of the columns {', '.join(candidates)}."
+    )
+
+
+def _entity_list(entities: Union[pd.DataFrame, List[Dict], Dict]) -> List[Dict]:
+    """Clean entity payloads from a DataFrame (id and representation
+    columns only) or a list of ontology / framework entity dicts."""
+    if isinstance(entities, pd.DataFrame):
+        id_column = _first_column(entities, _ENTITY_ID_COLUMNS, "Entities")
+        rep_column = _first_column(entities, _REPRESENTATION_COLUMNS, "Entities")
+        frame = entities[[id_column, rep_column]].drop_duplicates()
+        return [
+            {"carc_id": carc_id, "representation": representation}
+            for carc_id, representation in zip(
+                frame[id_column].tolist(), frame[rep_column].tolist()
+            )
+        ]
+    if isinstance(entities, dict):
+        entities = [entities]
+    cleaned = []
+    for entity in ExplorerAPIClient._clean_entities(list(entities)):
+        if not isinstance(entity, dict):
+            raise InvalidConfigurationError("Each entity in the list must be a dictionary.")
+        if "representation" not in entity and "entity_representation" in entity:
+            representation = entity["entity_representation"]
+            entity = {k: v for k, v in entity.items() if k != "entity_representation"}
+            entity["representation"] = representation
+        if "carc_id" not in entity or "representation" not in entity:
+            raise InvalidConfigurationError(
+                "Each entity must have an id ('carc_id', 'entity_id' or 'id') and a 'representation'."
+            )
+        cleaned.append(entity)
+    return cleaned
+
+
+def _insight_list(insights: Union[pd.DataFrame, pd.Series, List, int, str, Dict]) -> List[Dict]:
+    """Clean insight payloads from a DataFrame (``insight_id`` / ``id``
+    column), a Series or list of ids, or insight dicts."""
+    if isinstance(insights, pd.DataFrame):
+        insights = insights[_first_column(insights, ("insight_id", "id", "carc_id"), "Insights")]
+    if isinstance(insights, pd.Series):
+        insights = insights.drop_duplicates().tolist()
+    if isinstance(insights, (int, str, dict)):
+        insights = [insights]
+    cleaned = []
+    for insight in insights:
+        if not isinstance(insight, (int, str, dict)):
+            raise InvalidConfigurationError(
+                f"insight must be an int, str, or dict (got {type(insight).__name__})."
+            )
+        insight = ExplorerAPIClient._clean_insight(insight)
+        if "insight_id" not in insight:
+            raise InvalidConfigurationError("Insight must have an 'insight_id' key.")
+        cleaned.append(insight)
+    return cleaned
+
+
+def _chunked(items: list, size: int) -> List[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _merge_order_responses(responses: List[dict]) -> dict:
+    """Fold the responses of a chunked order into one: lists are
+    concatenated and numbers (e.g. prices) summed; other values are taken
+    from the first chunk."""
+    merged: Dict[str, Any] = {}
+    for response in responses:
+        if not isinstance(response, dict):
+            continue
+        for key, value in response.items():
+            if key not in merged:
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list) and isinstance(merged[key], list):
+                merged[key].extend(value)
+            elif (
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                and isinstance(merged[key], (int, float)) and not isinstance(merged[key], bool)
+            ):
+                merged[key] += value
+    return merged
+
+
+def _settle_order(chunks: List[list], outcomes: List[Any]) -> dict:
+    """Merge the outcomes of the chunks of an order, raising if any failed."""
+    results = [o for o in outcomes if not isinstance(o, BaseException)]
+    failed = [(c, o) for c, o in zip(chunks, outcomes) if isinstance(o, BaseException)]
+    if not failed:
+        return _merge_order_responses(results)
+    if not results:
+        raise failed[0][1]
+    raise PartialOrderError(
+        f"{len(failed)} of {len(chunks)} order chunks failed; "
+        f"{sum(len(c) for c, _ in failed)} frameworks were not bought.",
+        results=results,
+        failed=failed,
+    )
+
+
+_COMPLETED_STATUSES = {"completed", "complete", "ready", "done", "success", "succeeded", "finished", "available"}
+_FAILED_STATUSES = {"failed", "failure", "error", "errored", "cancelled", "canceled", "rejected"}
+
+
+class FrameworkResult(NamedTuple):
+    """A framework that finished, as yielded by
+    :meth:`ExplorerAPIClient.wait_for_frameworks`. ``error`` holds the
+    exception raised while downloading a completed framework."""
+
+    framework_id: str
+    status: dict
+    data: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def completed(self) -> bool:
+        return _status_text(self.status) in _COMPLETED_STATUSES
+
+
+def _status_text(status: Optional[dict]) -> str:
+    if not isinstance(status, dict):
+        return ""
+    return str(status.get("status") or status.get("state") or "").lower()
+
+
+def _framework_statuses(response: Any) -> Dict[str, dict]:
+    """Map framework id -> status record for a framework-status response
+    (a record, a list of records, a wrapped list, or an ``{id: status}``
+    map)."""
+    if isinstance(response, dict):
+        for key in ("frameworks", "items", "data", "statuses"):
+            if isinstance(response.get(key), list):
+                response = response[key]
+                break
+    if isinstance(response, list):
+        return {
+            str(r.get("framework_id", r.get("id"))): r
+            for r in response if isinstance(r, dict)
+        }
+    if not isinstance(response, dict):
+        return {}
+    if "framework_id" in response or "id" in response:
+        return {str(response.get("framework_id", response.get("id"))): response}
+    return {
+        str(k): v if isinstance(v, dict) else {"framework_id": k, "status": v}
+        for k, v in response.items()
+    }
+
+
+def _is_finished(status: Optional[dict]) -> bool:
+    text = _status_text(status)
+    return text in _COMPLETED_STATUSES or text in _FAILED_STATUSES
+
+
+def _track_unreported(pending: List[str], statuses: Dict[str, dict], unreported: set) -> None:
+    """Update ``unreported`` to the pending ids the last status poll left
+    out, warning about ids that just went missing."""
+    missing = {i for i in pending if i not in statuses}
+    new = [i for i in pending if i in missing and i not in unreported]
+    if new:
+        logger.warning(f"Framework status response left out {len(new)} ids: {new[:10]}")
+    unreported.clear()
+    unreported.update(missing)
+
+
+def _pending_timeout(pending: List[str], unreported: set, timeout: float) -> TimeoutError:
+    message = f"{len(pending)} frameworks still pending after {timeout}s: {pending[:10]}"
+    missing = [i for i in pending if i in unreported]
+    if missing:
+        message += f"; not reported by the status endpoint: {missing[:10]}"
+    return TimeoutError(message)
+
+
+def _price_frame(hashes: List[str], prices: Dict[str, Any], errors: Dict[str, str]) -> pd.DataFrame:
+    """One row per quoted framework, in input order."""
+    return pd.DataFrame({
+        "framework_hash": hashes,
+        "price": [prices.get(h) for h in hashes],
+        "error": [errors.get(h) for h in hashes],
+    })
+
+
+def _combine_framework_pages(
+    first: dict,
+    rest: Iterable[dict],
+    data_type: Optional[Literal["dataframe", "timeseries", "arrow"]],
+) -> Union[pd.DataFrame, dict]:
+    """Assemble paged framework responses, in order, into the shape a
+    single ``fetch_all`` request would return. Each page is converted as
+    soon as it is consumed so its raw payload can be released."""
+    if data_type == "arrow":
+        return tables_from_pages(
+            page.get("data") for page in itertools.chain([first], rest)
+        )
+    if data_type in ("dataframe", "timeseries"):
+        frames = [_format_framework_data(first, data_type)]
+        frames.extend(_format_framework_data(page, data_type) for page in rest)
+        return pd.concat(frames, ignore_index=True)
+    data = list(first.get("data", []))
+    for page in rest:
+        data.extend(page.get("data", []))
+    combined = {k: v for k, v in first.items() if k not in ("page", "size")}
+    combined["data"] = data
+    return combined
+
+
+def _api_data_type(data_type: Optional[str]) -> Optional[str]:
+    """The ``data_type`` to request from the API; Arrow tables are built
+    client-side from the plain JSON body."""
+    return None if data_type == "arrow" else data_type
+
+
+def _format_framework_data(
+    response: dict, data_type: Optional[Literal["dataframe", "timeseries", "arrow"]]
+) -> Union[pd.DataFrame, dict]:
+    """Convert a framework data response to the requested ``data_type``."""
+    if data_type == "dataframe":
+        df = pd.DataFrame(response.get("data", {}))
+        if "date" in df.columns:
+            df["date"] = pd.to_datetime(df["date"]).dt.date
+        return df
+    elif data_type == "timeseries":
+        return timeseries_response_to_pandas(response=response)
+    elif data_type == "arrow":
+        return to_table(response.get("data"))
+    else:
+        return response
+
 
 class ExplorerAPIClient(BaseAPIClient):
     """Client for interacting with the Carbon Arc Builder API."""
@@ -16,7 +272,8 @@ class ExplorerAPIClient(BaseAPIClient):
         self,
         token: str,
         host: str = "https://api.carbonarc.co",
-        version: str = "v2"
+        version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
     ):
         """
         Initialize BuilderAPIClient.
@@ -25,9 +282,18 @@ class ExplorerAPIClient(BaseAPIClient):
             token: Authentication token for requests.
             host: Base URL of the Carbon Arc API.
             version: API version to use.
+            request_manager: Optional shared transport to reuse.
         """
-        super().__init__(token=token, host=host, version=version)
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
         self.base_framework_url = self._build_base_url("framework")
+        # framework hash -> (quoted at, price); see check_framework_prices.
+        self._quotes: Dict[str, Tuple[float, Any]] = {}
+        self._quotes_lock = threading.Lock()
 
     def build_framework(
         self,
@@ -79,22 +345,122 @@ class ExplorerAPIClient(BaseAPIClient):
             framework["events"] = self._clean_events(events)
         return framework
 
-    def _validate_framework(self, framework: dict):
+    def build_frameworks(
+        self,
+        entities: Union[pd.DataFrame, List[Dict], Dict, str],
+        insights: Union[pd.DataFrame, pd.Series, List[Union[int, str, Dict]], int, str],
+        filters: Dict[str, Any],
+        aggregate: Optional[Literal["sum", "mean"]] = None,
+        *,
+        events: Optional[List[Dict]] = None,
+        group_entities: bool = False,
+    ) -> List[dict]:
+        """
+        Build the frameworks of an entity x insight grid in one pass.
+
+        Entities, insights and events are cleaned and validated once, and
+        the resulting payloads are shared by the frameworks that use them
+        rather than copied per framework, so treat the returned frameworks
+        as read-only. Pass them straight to :meth:`buy_frameworks`.
+
+        Args:
+            entities: Entity dicts (ontology records or framework entities),
+                a DataFrame with an id column (``carc_id`` / ``entity_id``
+                / ``id``) and a representation column (``representation``
+                / ``entity_representation``), or a representation string
+                for an all-entities wildcard.
+            insights: Insight ids or dicts, or a Series / DataFrame of ids
+                (``insight_id`` / ``id`` column).
+            filters: Filters applied to every framework.
+            aggregate: Aggregation method ("sum" or "mean").
+            events: Optional events added to every framework, as for
+                :meth:`build_framework`.
+            group_entities: Build one framework per insight covering all the
+                entities, instead of one per (entity, insight) pair.
+
+        Returns:
+            List of framework dictionaries, entity-major.
+        """
+        if aggregate is not None and aggregate not in ("sum", "mean"):
+            raise InvalidConfigurationError(
+                f"aggregate must be 'sum', 'mean', or None (got {aggregate!r})."
+            )
+        if not isinstance(filters, dict):
+            raise InvalidConfigurationError("filters must be a dictionary.")
+        if isinstance(entities, str):
+            groups = [self._validate_entities(entities)]
+        else:
+            entity_list = _entity_list(entities)
+            groups = [entity_list] if group_entities else [[entity] for entity in entity_list]
+        insight_list = _insight_list(insights)
+        if events is not None:
+            events = self._validate_events(events)
+
+        frameworks = []
+        for group in groups:
+            for insight in insight_list:
+                framework: Dict[str, Any] = {
+                    "entities": group,
+                    "insight": insight,
+                    "filters": filters,
+                    "aggregate": aggregate,
+                }
+                if events is not None:
+                    framework["events"] = events
+                frameworks.append(framework)
+        return frameworks
+
+    def _validate_framework(self, framework: dict, _memo: Optional[dict] = None) -> dict:
         """
         Validate a framework dictionary for required structure.
 
         Args:
             framework: Framework dictionary.
 
+        Returns:
+            A cleaned copy of the framework; the argument is not modified.
+
         Raises:
             InvalidConfigurationError: If the framework is invalid.
         """
         
         if not isinstance(framework, dict):
             raise InvalidConfigurationError("Framework must be a dictionary. Use build_framework().")
-        framework["entities"] = self._clean_entities(framework.get("entities"))
-        framework["insight"] = self._clean_insight(framework["insight"])
-        entities = framework["entities"]
+        if "insight" not in framework:
+            raise InvalidConfigurationError("Framework must have an 'insight'.")
+        # Frameworks of one order often share their entity list and insight
+        # (see build_frameworks); ``_memo`` checks each shared part once.
+        memo = {} if _memo is None else _memo
+        entities = self._validated_part(memo, framework.get("entities"), self._validate_entities)
+        validated = {
+            **framework,
+            "entities": entities,
+            "insight": self._validated_part(memo, framework["insight"], self._validate_insight),
+        }
+        if framework.get("events") is not None:
+            validated["events"] = self._validated_part(
+                memo, framework["events"], self._validate_events
+            )
+
+        has_entities = bool(entities) if isinstance(entities, list) else entities is not None
+        has_events = bool(validated.get("events"))
+        if not has_entities and not has_events:
+            raise InvalidConfigurationError("Framework must have at least one entity or event.")
+
+        return validated
+
+    @staticmethod
+    def _validated_part(memo: dict, part: Any, validate) -> Any:
+        if part is None or isinstance(part, (int, str)):
+            return validate(part)
+        key = id(part)
+        if key not in memo:
+            # Keep ``part`` referenced so its id stays unique for the memo's life.
+            memo[key] = (part, validate(part))
+        return memo[key][1]
+
+    def _validate_entities(self, entities: Optional[Union[List[Dict], Dict, str]]) -> Union[List[Dict], Dict]:
+        entities = self._clean_entities(entities)
         if isinstance(entities, list):
             if not all(isinstance(entity, dict) for entity in entities):
                 raise InvalidConfigurationError("Each entity in the list must be a dictionary.")
@@ -105,34 +471,38 @@ class ExplorerAPIClient(BaseAPIClient):
                 )
         else:
             raise InvalidConfigurationError("Entities must be a list of dicts or a wildcard dictionary.")
-        if not isinstance(framework["insight"], dict):
+        return entities
+
+    def _validate_insight(self, insight: Union[int, str, dict]) -> dict:
+        insight = self._clean_insight(insight)
+        if not isinstance(insight, dict):
             raise InvalidConfigurationError("Insight must be a dictionary.")
-        if "insight_id" not in framework["insight"]:
+        if "insight_id" not in insight:
             raise InvalidConfigurationError("Insight must have an 'insight_id' key.")
+        return insight
 
-        if "events" in framework and framework["events"] is not None:
-            if not isinstance(framework["events"], list):
-                raise InvalidConfigurationError("Events must be a list of dicts.")
-            framework["events"] = self._clean_events(framework["events"])
-            events = framework["events"]
-            for event in events:
-                if not isinstance(event, dict):
-                    raise InvalidConfigurationError("Each event must be a dictionary.")
-                has_event_id = event.get("event_id") is not None
-                has_event_category_id = event.get("event_category_id") is not None
-                if not has_event_id and not has_event_category_id:
-                    raise InvalidConfigurationError(
-                        "Each event must have a non-null 'event_id' or 'event_category_id'."
-                    )
-                if "representation" not in event:
-                    raise InvalidConfigurationError("Each event must have a 'representation' key.")
-
-        has_entities = bool(entities) if isinstance(entities, list) else entities is not None
-        has_events = bool(framework.get("events"))
-        if not has_entities and not has_events:
-            raise InvalidConfigurationError("Framework must have at least one entity or event.")
+    def _validate_events(self, events: List[Dict]) -> List[Dict]:
+        if not isinstance(events, list):
+            raise InvalidConfigurationError("Events must be a list of dicts.")
+        for event in events:
+            if not isinstance(event, dict):
+                raise InvalidConfigurationError("Each event must be a dictionary.")
+        events = self._clean_events(events)
+        for event in events:
+            has_event_id = event.get("event_id") is not None
+            has_event_category_id = event.get("event_category_id") is not None
+            if not has_event_id and not has_event_category_id:
+                raise InvalidConfigurationError(
+                    "Each event must have a non-null 'event_id' or 'event_category_id'."
+                )
+            if "representation" not in event:
+                raise InvalidConfigurationError("Each event must have a 'representation' key.")
+        return events
 
-        return framework
+    def _validate_order(self, order: List[dict]) -> List[dict]:
+        """Validate every framework of an order, checking shared parts once."""
+        memo: dict = {}
+        return [self._validate_framework(framework, memo) for framework in order]
         
     @staticmethod
     def _clean_events(events: Optional[List[Dict]]) -> Optional[List[Dict]]:
@@ -149,7 +519,8 @@ class ExplorerAPIClient(BaseAPIClient):
     @staticmethod
     def _clean_entities(entities: Optional[Union[List[Dict], Dict, str]]) -> Union[List[Dict], Dict]:
         """
-        Clean the entities list.
+        Clean the entities list. Entities using ``id`` / ``entity_id`` are
+        copied with the key renamed to ``carc_id``; the input is not modified.
         """
         if entities is None:
             return []
@@ -166,20 +537,17 @@ class ExplorerAPIClient(BaseAPIClient):
         elif isinstance(entities, dict):
             entities = [entities]
 
+        cleaned = []
         for entity in entities:
-            if "id" in entity:
-                entity["carc_id"] = entity["id"]
-            elif "entity_id" in entity:
-                entity["carc_id"] = entity["entity_id"]
-                
-        # clean up extra keys
-        for entity in entities:
-            if "id" in entity:
-                del entity["id"]
-            elif "entity_id" in entity:
-                del entity["entity_id"]
-        
-        return entities
+            if isinstance(entity, dict):
+                for key in ("id", "entity_id"):
+                    if key in entity:
+                        carc_id = entity[key]
+                        entity = {k: v for k, v in entity.items() if k != key}
+                        entity["carc_id"] = carc_id
+                        break
+            cleaned.append(entity)
+        return cleaned
     
     @staticmethod
     def _clean_insight(insight: Union[int, str, dict]) -> dict:
@@ -191,12 +559,12 @@ class ExplorerAPIClient(BaseAPIClient):
         elif isinstance(insight, str):
             return {"insight_id": int(insight)}
         elif isinstance(insight, dict):
-            if "id" in insight:
-                insight["insight_id"] = insight["id"]
-                del insight["id"]
-            elif "carc_id" in insight:
-                insight["insight_id"] = insight["carc_id"]
-                del insight["carc_id"]
+            for key in ("id", "carc_id"):
+                if key in insight:
+                    insight_id = insight[key]
+                    insight = {k: v for k, v in insight.items() if k != key}
+                    insight["insight_id"] = insight_id
+                    break
             return insight
 
     def collect_framework_filters(self, framework: dict) -> dict:
@@ -211,7 +579,7 @@ class ExplorerAPIClient(BaseAPIClient):
         """
         framework = self._validate_framework(framework)
         url = f"{self.base_framework_url}/filters"
-        return self._post(url, json={"framework": framework})
+        return self._post(url, json={"framework": framework}, idempotent=True)
     
     def check_framework_price(self, framework: dict) -> dict:
         """
@@ -223,11 +591,82 @@ class ExplorerAPIClient(BaseAPIClient):
         Returns:
             Dictionary of available filters.
         """
-        framework = self._validate_framework(framework)
+        return self._quote(self._validate_framework(framework))
+
+    def _quote(self, framework: dict):
         url = f"{self.base_framework_url}/order"
-        price = self._post(url, json={"framework": framework}).get("price", None)
-        
-        return price
+        # Quoting is read-only, so it is safe to retry on 5xx like a GET.
+        return self._then(
+            self._post(url, json={"framework": framework}, idempotent=True),
+            lambda r: r.get("price", None),
+        )
+
+    def _quotes_to_fetch(
+        self, frameworks: Iterable[dict], ttl: float
+    ) -> Tuple[List[str], Dict[str, Any], Dict[str, dict]]:
+        """Hash the validated frameworks and split them into fresh cached
+        prices and the unique frameworks still to quote."""
+        validated = self._validate_order(list(frameworks))
+        hashes = [fingerprint(framework) for framework in validated]
+        now = time.monotonic()
+        prices: Dict[str, Any] = {}
+        missing: Dict[str, dict] = {}
+        with self._quotes_lock:
+            for key, quoted in list(self._quotes.items()):
+                if now - quoted[0] > ttl:
+                    del self._quotes[key]
+            for key, framework in zip(hashes, validated):
+                if key in self._quotes:
+                    prices[key] = self._quotes[key][1]
+                elif key not in missing:
+                    missing[key] = framework
+        return hashes, prices, missing
+
+    def _store_quote(self, key: str, price: Any) -> None:
+        with self._quotes_lock:
+            self._quotes[key] = (time.monotonic(), price)
+
+    def check_framework_prices(
+        self,
+        frameworks: Iterable[dict],
+        max_workers: int = 8,
+        ttl: float = 300.0,
+    ) -> pd.DataFrame:
+        """
+        Quote many frameworks concurrently.
+
+        Frameworks are deduplicated by a hash of their validated payload, so
+        identical frameworks are quoted once; quotes are kept for ``ttl``
+        seconds and reused by later calls on this client. A framework whose
+        quote is rejected by the API (an HTTP error, or the SDK's
+        ``ForbiddenError`` / ``RateLimitError`` / ``AuthenticationError``)
+        gets no price and the error message instead of failing the whole
+        batch.
+
+        Args:
+            frameworks: Framework dictionaries, e.g. from
+                :meth:`build_frameworks`.
+            max_workers: Number of quotes requested concurrently (default 8).
+            ttl: Seconds a quote is reused for (default 300); 0 always
+                requotes.
+
+        Returns:
+            DataFrame with one row per framework, in input order, and the
+            columns ``framework_hash``, ``price`` and ``error``.
+        """
+        hashes, prices, missing = self._quotes_to_fetch(frameworks, ttl)
+        errors: Dict[str, str] = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+                futures = {key: pool.submit(self._quote, fw) for key, fw in missing.items()}
+                for key, future in futures.items():
+                    try:
+                        prices[key] = future.result()
+                    except (requests.exceptions.HTTPError, CarbonArcException) as e:
+                        errors[key] = str(e)
+                    else:
+                        self._store_quote(key, prices[key])
+        return _price_frame(hashes, prices, errors)
 
     def collect_framework_filter_options(self, framework: dict, filter_key: str) -> dict:
         """
@@ -242,34 +681,64 @@ class ExplorerAPIClient(BaseAPIClient):
         """
         framework = self._validate_framework(framework)
         url = f"{self.base_framework_url}/filters/{filter_key}/options"
-        return self._post(url, json={"framework": framework})
+        return self._post(url, json={"framework": framework}, idempotent=True)
 
-    def buy_frameworks(self, order: Union[List[dict], dict]) -> dict:
+    def buy_frameworks(
+        self,
+        order: Union[List[dict], dict],
+        chunk_size: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> dict:
         """
         Purchase one or more frameworks.
 
         Args:
             order: List of framework dictionaries to purchase.
+            chunk_size: Maximum frameworks per purchase request. Larger
+                orders are split into chunks bought concurrently and their
+                responses merged (lists concatenated, numbers summed).
+                ``None`` sends the whole order in one request.
+            max_workers: Number of chunks bought concurrently (default 4).
 
         Returns:
             Dictionary with purchase information.
+
+        Raises:
+            PartialOrderError: If some chunks were bought and others failed;
+                it carries the successful responses and the failed chunks.
         """
         if isinstance(order, dict):
             order = [order]
         
-        validated_order = []
-        for framework in order:
-            validated_order.append(self._validate_framework(framework))
+        validated_order = self._validate_order(order)
         url = f"{self.base_framework_url}/buy"
-        return self._post(url, json={"order": {"frameworks": validated_order}})
+        if not chunk_size or len(validated_order) <= chunk_size:
+            return self._post(url, json={"order": {"frameworks": validated_order}})
+
+        # Purchases are not retried on 5xx, so every chunk is attempted and
+        # failures are reported together instead of abandoning the rest.
+        chunks = _chunked(validated_order, chunk_size)
+        outcomes: List[Any] = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            futures = [
+                pool.submit(self._post, url, json={"order": {"frameworks": chunk}})
+                for chunk in chunks
+            ]
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+        return _settle_order(chunks, outcomes)
 
     def get_framework_data(
         self,
         framework_id: str,
-        data_type: Optional[Literal["dataframe", "timeseries"]] = None,
+        data_type: Optional[Literal["dataframe", "timeseries", "arrow"]] = None,
         page: Optional[int] = None,
         size: Optional[int] = None,
         fetch_all: bool = True,
+        max_workers: Optional[int] = None,
     ) -> Union[pd.DataFrame, dict]:
         """
         Retrieve data for a specific framework.
@@ -278,35 +747,102 @@ class ExplorerAPIClient(BaseAPIClient):
             framework_id: Framework ID.
             page: Page number (default 1).
             size: Number of items per page (default 100).
-            data_type: Data type to retrieve ("dataframe" or "timeseries").
+            data_type: Data type to retrieve ("dataframe", "timeseries" or
+                "arrow" for a ``pyarrow.Table``).
+            fetch_all: Retrieve every page (default True).
+            max_workers: With ``fetch_all``, download the framework page by
+                page on this many concurrent workers instead of asking the
+                server for one ``fetch_all`` body. The page count is read
+                from the first page; pages of ``size`` items (default
+                1000) are converted as they arrive and assembled in page
+                order, which keeps large downloads fast and bounds peak
+                memory.
 
         Returns:
-            Data as a DataFrame, dictionary, or timeseries, depending on data_type.
+            Data as a DataFrame, dictionary, timeseries or Arrow table,
+            depending on data_type.
         """
         endpoint = f"{framework_id}/data"
+        if fetch_all and max_workers:
+            if page:
+                logger.warning("Page is ignored when fetch_all is True")
+            return self._get_framework_data_paged(
+                framework_id, data_type, size or _PARALLEL_PAGE_SIZE, max_workers
+            )
         if fetch_all:
             if page or size:
                 logger.warning("Page and size are ignored when fetch_all is True")
-            url = f"{self.base_framework_url}/{endpoint}?fetch_all=true"
-        else:
-            url = f"{self.base_framework_url}/{endpoint}?page={page}&size={size}"
-        if data_type:
+            return self._then(
+                self.get_raw_framework_data(framework_id, data_type),
+                lambda r: _format_framework_data(r, data_type),
+            )
+        url = f"{self.base_framework_url}/{endpoint}?page={page}&size={size}"
+        if _api_data_type(data_type):
             url += f"&data_type={data_type}"
-        if data_type == "dataframe":
-            df = pd.DataFrame(self._get(url).get("data", {}))
-            if "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"]).dt.date
-            return df
-        elif data_type == "timeseries":
-            return timeseries_response_to_pandas(response=self._get(url))
-        else:
-            return self._get(url)
+        return self._then(
+            self._get(url), lambda r: _format_framework_data(r, data_type)
+        )
+
+    def get_raw_framework_data(
+        self, framework_id: str, data_type: Optional[Literal["dataframe", "timeseries", "arrow"]] = None
+    ) -> dict:
+        """
+        Retrieve all data for a framework as the API's JSON body, without
+        converting it to ``data_type``.
+
+        :meth:`get_framework_data` is this call followed by the conversion;
+        use this one to download and convert in separate steps (e.g. on
+        different threads, as :class:`~carbonarc.pipeline.FrameworkPipeline`
+        does).
+
+        Args:
+            framework_id: Framework ID.
+            data_type: Data type the body will be converted to; requested
+                from the API except for "arrow", which is built client-side.
+
+        Returns:
+            The ``fetch_all`` response body.
+        """
+        url = f"{self.base_framework_url}/{framework_id}/data?fetch_all=true"
+        if _api_data_type(data_type):
+            url += f"&data_type={data_type}"
+        return self._get(url)
+
+    def _fetch_framework_page(
+        self,
+        framework_id: str,
+        page: int,
+        size: int,
+        data_type: Optional[Literal["dataframe", "timeseries", "arrow"]] = None,
+    ) -> dict:
+        params = {"page": page, "size": size}
+        if _api_data_type(data_type):
+            params["data_type"] = data_type
+        return self._get(f"{self.base_framework_url}/{framework_id}/data", params=params)
+
+    def _get_framework_data_paged(
+        self,
+        framework_id: str,
+        data_type: Optional[Literal["dataframe", "timeseries", "arrow"]],
+        size: int,
+        max_workers: int,
+    ) -> Union[pd.DataFrame, dict]:
+        first = self._fetch_framework_page(framework_id, 1, size, data_type)
+        pages = iter_pages(
+            lambda page: self._fetch_framework_page(framework_id, page, size, data_type),
+            first_page=2,
+            last_page=first.get("pages") or 1,
+            max_workers=max_workers,
+            head=[first],
+        )
+        # Taking the first page back starts the downloads of the rest.
+        return _combine_framework_pages(next(pages), pages, data_type)
 
     def get_framework_panel_debias_data(
         self,
         framework_id: str,
         insight_id: Optional[int] = None,
-        data_type: Optional[Literal["dataframe", "timeseries"]] = None,
+        data_type: Optional[Literal["dataframe", "timeseries", "arrow"]] = None,
         page: Optional[int] = None,
         size: Optional[int] = None,
         fetch_all: bool = True,
@@ -316,7 +852,8 @@ class ExplorerAPIClient(BaseAPIClient):
         Args:
             framework_id: Framework ID.
             insight_id: Insight ID to use as the reference for panel debiasing.
-            data_type: Data type to retrieve ("dataframe" or "timeseries").
+            data_type: Data type to retrieve ("dataframe", "timeseries" or
+                "arrow" for a ``pyarrow.Table``).
             page: Page number (default None).
             size: Number of items per page (default None).
             fetch_all: Whether to fetch all data (default True).
@@ -333,20 +870,13 @@ class ExplorerAPIClient(BaseAPIClient):
                 params["size"] = size
         if insight_id is not None:
             params["insight_id"] = insight_id
-        if data_type is not None:
+        if _api_data_type(data_type) is not None:
             params["data_type"] = data_type
 
-        response = self._get(url, params=params)
-
-        if data_type == "dataframe":
-            df = pd.DataFrame(response.get("data", {}))
-            if "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"]).dt.date
-            return df
-        elif data_type == "timeseries":
-            return timeseries_response_to_pandas(response=response)
-        else:
-            return response
+        return self._then(
+            self._get(url, params=params),
+            lambda r: _format_framework_data(r, data_type),
+        )
     
     def get_valid_insights_for_framework_panel_debias(self, framework_id: str) -> List[int]:
         """
@@ -359,38 +889,157 @@ class ExplorerAPIClient(BaseAPIClient):
     def stream_framework_data(
         self,
         framework_id: str,
-        data_type: Optional[Literal["dataframe", "timeseries"]] = None,
+        data_type: Optional[Literal["dataframe", "timeseries", "arrow"]] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
     ):
         """
         Iterate over all data for a framework, yielding each page.
 
+        Pages are requested one at a time with ``page``/``size``; while the
+        caller processes a page, up to ``prefetch`` following pages are
+        downloaded on a background thread. Each chunk is dropped by the
+        iterator once yielded, so memory tracks the pages in flight rather
+        than the framework size.
+
         Args:
             framework_id: Framework ID.
+            data_type: Data type to yield ("dataframe", "timeseries" or
+                "arrow").
             page_size: Number of items per page (default 100).
-            data_type: Data type to yield ("dataframe" or "timeseries").
+            prefetch: Pages to download ahead of the consumer (default 1);
+                ``0`` fetches each page only when it is requested.
 
         Yields:
             Data for each page as a DataFrame, timeseries, or dictionary.
         """
-        page = 1
-        while True:
-            response = self.get_framework_data(
-                framework_id=framework_id,
-                fetch_all=True,
+        pages = self._iter_raw_framework_pages(
+            lambda page: self._fetch_framework_page(framework_id, page, page_size, data_type),
+            prefetch,
+        )
+        for response in pages:
+            chunk = _format_framework_data(response, data_type)
+            del response
+            yield chunk
+            del chunk
+
+    def _iter_raw_framework_pages(
+        self,
+        fetch: Callable[[int], dict],
+        prefetch: int,
+    ) -> Iterator[dict]:
+        """Framework responses page by page, ``prefetch`` pages ahead of
+        the consumer (``0`` fetches each page when it is requested); the
+        page count is read from the first page."""
+        first = fetch(1)
+        if not first or not first.get("data"):
+            return
+        total_pages = first.get("pages") or 1
+        if prefetch > 0:
+            pages = iter_pages(
+                fetch, 2, total_pages, max_workers=1, prefetch=prefetch, head=[first]
             )
-            if not response:
-                break
-            total_pages = response.get("pages", 0)
-            if page > total_pages:
-                break
-            if data_type == "dataframe":
-                yield pd.DataFrame(response.get("data", {}))
-            elif data_type == "timeseries":
-                yield timeseries_response_to_pandas(response=response)
-            else:
-                yield response
-            page += 1
-    
+            del first
+            yield from pages
+        else:
+            yield first
+            del first
+            yield from (fetch(page) for page in range(2, total_pages + 1))
+
+    def _parquet_page_fetcher(
+        self, framework_id: str, page_size: int, panel_debias_insight_id: Optional[int]
+    ) -> Callable[[int], dict]:
+        if panel_debias_insight_id is None:
+            return lambda page: self._fetch_framework_page(framework_id, page, page_size)
+        return lambda page: self._get(
+            f"{self.base_framework_url}/{framework_id}/panel-debias",
+            params={"page": page, "size": page_size, "insight_id": panel_debias_insight_id},
+        )
+
+    def download_framework_to_parquet(
+        self,
+        framework_id: str,
+        path: str,
+        partition_by: Optional[str] = None,
+        page_size: int = _PARALLEL_PAGE_SIZE,
+        prefetch: int = 2,
+        compression: str = "snappy",
+        panel_debias_insight_id: Optional[int] = None,
+        schema: Optional["pa.Schema"] = None,
+    ) -> str:
+        """
+        Download a framework's data straight to Parquet, page by page.
+
+        Each page is converted to an Arrow record batch and written before
+        the next is read, so memory is bounded by the pages in flight, not
+        the framework size. Unless ``schema`` is given it is inferred from
+        the first page (see :func:`~carbonarc.utils.arrow.infer_schema`):
+        name columns dictionary-encoded, plain dates as ``date32``, whole
+        numbers and ids as ``int64``; a column a later page does not fit is
+        widened (see :class:`~carbonarc.utils.arrow.ParquetSink`).
+        Requires ``pyarrow``
+        (``pip install 'carbonarc[arrow]'``).
+
+        Args:
+            framework_id: Framework ID.
+            path: Parquet file to write, or the dataset directory when
+                ``partition_by`` is given.
+            partition_by: Column to partition the output by (e.g.
+                ``"entity_representation"`` or ``"date"``), written
+                hive-style as ``path/<column>=<value>/part-0.parquet``.
+            page_size: Rows per page request (default 1000).
+            prefetch: Pages downloaded ahead of the writer (default 2).
+            compression: Parquet compression codec (default "snappy").
+            panel_debias_insight_id: Write the panel-debias data for this
+                reference insight (see
+                :meth:`get_framework_panel_debias_data`) instead of the
+                framework data.
+            schema: Arrow schema of the output, e.g. from an earlier
+                download of the same framework. Columns it lacks are
+                dropped; values that do not fit a column still widen it.
+
+        Returns:
+            The path written.
+        """
+        require_pyarrow()
+        fetch = self._parquet_page_fetcher(framework_id, page_size, panel_debias_insight_id)
+        sink = None
+        try:
+            for response in self._iter_raw_framework_pages(fetch, prefetch):
+                data = response.get("data")
+                del response
+                if sink is None:
+                    sink = ParquetSink(path, schema or infer_schema(data), partition_by, compression)
+                sink.write(record_batch(data, sink.schema))
+                del data
+        finally:
+            if sink is not None:
+                sink.close()
+        if sink is None:
+            logger.warning(f"Framework {framework_id} has no data; nothing written to {path}")
+        return path
+
+    def iter_framework_records(self, framework_id: str) -> JSONArrayStream:
+        """
+        Iterate over every record of a framework as the response streams in.
+
+        Requests the whole framework (``fetch_all``) in one response but
+        parses its ``data`` array incrementally, so records are available
+        as soon as they arrive and the raw body is never held in memory.
+        The remaining top-level fields (e.g. ``total``) are on ``.meta``
+        once iteration has passed them.
+
+        Args:
+            framework_id: Framework ID.
+
+        Returns:
+            Iterable of record dictionaries.
+        """
+        return self._iter_json_items(
+            f"{self.base_framework_url}/{framework_id}/data",
+            params={"fetch_all": "true"},
+        )
+
     def get_framework_metadata(self, framework_id: str) -> dict:
         """
         Retrieve metadata for a specific framework.
@@ -413,4 +1062,113 @@ class ExplorerAPIClient(BaseAPIClient):
         url = f"{self.base_framework_url}/{endpoint}"
         params = {"framework_id": framework_id}
         return self._get(url, params=params)
+
+    def _framework_downloader(
+        self,
+        download: Union[bool, Callable[[str], Any]],
+        data_type: Optional[Literal["dataframe", "timeseries", "arrow"]],
+    ) -> Optional[Callable[[str], Any]]:
+        if callable(download):
+            return download
+        if download:
+            return lambda framework_id: self.get_framework_data(framework_id, data_type=data_type)
+        return None
+
+    def wait_for_frameworks(
+        self,
+        framework_ids: Iterable[str],
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        timeout: Optional[float] = None,
+        batch_size: int = 100,
+        download: Union[bool, Callable[[str], Any]] = False,
+        data_type: Optional[Literal["dataframe", "timeseries", "arrow"]] = None,
+        download_workers: int = 4,
+    ) -> Iterator[FrameworkResult]:
+        """
+        Wait for purchased frameworks to finish, yielding each as soon as
+        it does.
+
+        All pending ids are polled together, ``batch_size`` ids per
+        :meth:`get_framework_status` call. The poll interval starts at
+        ``poll_interval``, grows by ``backoff`` after each poll in which
+        nothing finished (up to ``max_interval``) and resets when something
+        does. With ``download``, completed frameworks are downloaded in the
+        background while polling continues, and are yielded once their data
+        is in.
+
+        Args:
+            framework_ids: Framework IDs, e.g. from :meth:`buy_frameworks`.
+            poll_interval: Initial seconds between polls (default 2).
+            max_interval: Longest seconds between polls (default 30).
+            backoff: Interval growth factor while nothing finishes.
+            timeout: Give up after this many seconds; ``None`` waits for as
+                long as it takes.
+            batch_size: Framework ids per status request (default 100).
+            download: ``True`` to fetch each completed framework with
+                :meth:`get_framework_data`, or a callable taking a framework
+                id whose return value becomes ``data``.
+            data_type: ``data_type`` for the default download.
+            download_workers: Concurrent downloads (default 4).
+
+        Yields:
+            :class:`FrameworkResult` (``framework_id``, ``status``,
+            ``data``, ``error``) per finished framework, failed ones
+            included; check ``result.completed``. A download that raises
+            does not stop the others: its result carries the exception in
+            ``error``.
+
+        Raises:
+            TimeoutError: If frameworks are still pending after ``timeout``;
+                the message names ids the status endpoint never reported.
+        """
+        pending = list(dict.fromkeys(str(i) for i in framework_ids))
+        downloader = self._framework_downloader(download, data_type)
+        pool = ThreadPoolExecutor(max_workers=download_workers) if downloader else None
+        downloads: Dict[Any, Tuple[str, dict]] = {}
+        unreported: set = set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+        next_poll = time.monotonic()
+        try:
+            while pending or downloads:
+                now = time.monotonic()
+                if pending and now >= next_poll:
+                    statuses: Dict[str, dict] = {}
+                    for start in range(0, len(pending), batch_size):
+                        statuses.update(_framework_statuses(
+                            self.get_framework_status(pending[start:start + batch_size])
+                        ))
+                    _track_unreported(pending, statuses, unreported)
+                    finished = [i for i in pending if _is_finished(statuses.get(i))]
+                    pending = [i for i in pending if not _is_finished(statuses.get(i))]
+                    for framework_id in finished:
+                        result = FrameworkResult(framework_id, statuses[framework_id])
+                        if downloader and result.completed:
+                            downloads[pool.submit(downloader, framework_id)] = result[:2]
+                        else:
+                            yield result
+                    interval = poll_interval if finished else min(interval * backoff, max_interval)
+                    next_poll = time.monotonic() + interval
+                if pending and deadline is not None and time.monotonic() >= deadline:
+                    raise _pending_timeout(pending, unreported, timeout)
+                wake = min(next_poll, deadline) if deadline is not None else next_poll
+                delay = max(0.0, wake - time.monotonic()) if pending else None
+                if downloads:
+                    done, _ = wait(downloads, timeout=delay, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        framework_id, status = downloads.pop(future)
+                        try:
+                            data = future.result()
+                        except Exception as e:
+                            logger.warning(f"Download of framework {framework_id} failed: {e}")
+                            yield FrameworkResult(framework_id, status, error=e)
+                        else:
+                            yield FrameworkResult(framework_id, status, data)
+                elif delay:
+                    time.sleep(delay)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
     
@@ -1,15 +1,141 @@
-from typing import Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from typing import Literal
 import logging
 import json
 import os
+import tempfile
 
+from carbonarc.utils.arrow import ParquetSink, infer_schema, record_batch, require_pyarrow, to_table
 from carbonarc.utils.client import BaseAPIClient
+from carbonarc.utils.decoding import JSONArrayParser, JSONArrayStream
+from carbonarc.utils.manager import HttpRequestManager
+from carbonarc.utils.pagination import iter_page_responses
 PAGE = 1
 SIZE = 25
 logger = logging.getLogger(__name__)
 
+_DATE_OPERATOR_NAMES = {"<": "lt", "<=": "lte", ">": "gt", ">=": "gte", "==": "eq"}
+_FILE_EXTENSIONS = {"json": "json", "ndjson": "ndjson", "parquet": "parquet"}
+
+
+def _webcontent_filename(webcontent_id: int, webcontent_date, file_format: str) -> str:
+    name = f"webcontent_{webcontent_id}"
+    if webcontent_date:
+        operator, value = webcontent_date
+        if isinstance(value, datetime):
+            value = value.date().isoformat()
+        name += f"_{_DATE_OPERATOR_NAMES.get(operator, 'on')}_{value}"
+    return f"{name}.{_FILE_EXTENSIONS[file_format]}"
+
+
+def _with_webcontent_total(response: dict) -> dict:
+    """Expose ``query_metadata.total_records`` as ``total`` so the page
+    count is known from the first page."""
+    total = (response.get("query_metadata") or {}).get("total_records")
+    if response.get("total") is None and total is not None:
+        response = {**response, "total": total}
+    return response
+
+
+def _webcontent_page_converter(data_type: Optional[str]):
+    """Turn a page response into its batch: the ``data`` records, or a
+    ``pyarrow.Table`` with the schema of the pages before it (widened when a
+    page does not fit) for "arrow"."""
+    if data_type is None:
+        return lambda response: response["data"]
+    if data_type != "arrow":
+        raise ValueError(f"Unsupported data_type: {data_type!r}")
+    require_pyarrow()
+    schema = []
+
+    def convert(response: dict):
+        if not schema:
+            schema.append(infer_schema(response["data"]))
+        table = to_table(response["data"], schema[0])
+        schema[0] = table.schema
+        return table
+
+    return convert
+
+
+class _WebcontentFileWriter:
+    """
+    Write a streamed ``{"data": [...], ...}`` webcontent body to ``path``,
+    counting its records. Output goes to a temporary file in the same
+    directory that :meth:`commit` renames into place, so readers never see
+    a partial file.
+    """
+
+    def __init__(self, path: str, file_format: str, batch_rows: int):
+        if file_format == "parquet":
+            require_pyarrow()
+        self.path = path
+        self.file_format = file_format
+        self.batch_rows = batch_rows
+        self.count = 0
+        self._parser = JSONArrayParser("data")
+        self._rows: List[dict] = []
+        self._sink: Optional[ParquetSink] = None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".part"
+        )
+        if file_format == "parquet":
+            os.close(fd)
+            self._file = None
+        else:
+            self._file = os.fdopen(fd, "wb")
+
+    def feed(self, chunk: bytes) -> None:
+        records = self._parser.feed(chunk)
+        self.count += len(records)
+        if self.file_format == "json":
+            # The body is already JSON; keep it byte for byte.
+            self._file.write(chunk)
+        elif self.file_format == "ndjson":
+            self._file.write(b"".join(
+                json.dumps(record, separators=(",", ":")).encode() + b"\n" for record in records
+            ))
+        else:
+            self._rows.extend(records)
+            if len(self._rows) >= self.batch_rows:
+                self._flush_rows()
+
+    def _flush_rows(self) -> None:
+        if not self._rows:
+            return
+        if self._sink is None:
+            self._sink = ParquetSink(self._tmp, infer_schema(self._rows))
+        self._sink.write(record_batch(self._rows, self._sink.schema))
+        self._rows = []
+
+    def commit(self) -> Tuple[str, int]:
+        tail = self._parser.close()
+        self.count += len(tail)
+        if self.file_format == "ndjson":
+            self._file.writelines(
+                json.dumps(record, separators=(",", ":")).encode() + b"\n" for record in tail
+            )
+        elif self.file_format == "parquet":
+            self._rows.extend(tail)
+            self._flush_rows()
+            if self._sink is None:
+                self._sink = ParquetSink(self._tmp, infer_schema([]))
+            self._sink.close()
+        if self._file is not None:
+            self._file.close()
+        os.replace(self._tmp, self.path)
+        return self.path, self.count
+
+    def abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self._sink is not None:
+            self._sink.close()
+        if os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
 
 class HubAPIClient(BaseAPIClient):
     """
@@ -41,7 +167,8 @@ class HubAPIClient(BaseAPIClient):
         self, 
         token: str,
         host: str = "https://api.carbonarc.co",
-        version: str = "v2"
+        version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
         ):
         """
         Initialize HubAPIClient with authentication and configuration settings.
@@ -58,6 +185,8 @@ class HubAPIClient(BaseAPIClient):
                 different API environment.
             version (str, optional): API version to use. Defaults to "v2". This
                 should match the API version your token is authorized for.
+            request_manager (HttpRequestManager, optional): Shared transport to
+                reuse. When omitted the client opens its own session.
 
         Raises:
             ValueError: If token is empty or invalid.
@@ -68,7 +197,12 @@ class HubAPIClient(BaseAPIClient):
             different API endpoints (hub, webcontent) using the provided host
             and version.
         """
-        super().__init__(token=token, host=host, version=version)
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
         
         self.base_hub_url = self._build_base_url("hub")
         self.base_webcontent_url = self._build_base_url("webcontent")
@@ -174,7 +308,7 @@ class HubAPIClient(BaseAPIClient):
             url += f"?page={page}&size={size}"
         return self._get(url)
     
-    def get_webcontent_data(self, webcontent_id: int, webcontent_date: Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]] = None, page: Optional[int] = None, size: Optional[int] = None, fetch_all=None) -> dict:
+    def get_webcontent_data(self, webcontent_id: int, webcontent_date: Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]] = None, page: Optional[int] = None, size: Optional[int] = None, fetch_all=None, data_type: Optional[Literal["arrow"]] = None) -> dict:
         """
         Retrieve web content data for a specific feed by ID and optional date filter.
 
@@ -189,6 +323,8 @@ class HubAPIClient(BaseAPIClient):
                 The date can be provided as either a datetime object or a string in
                 ISO format (YYYY-MM-DD). For example: (">=", "2025-01-01") or
                 ("<=", datetime(2025, 12, 31)).
+            data_type (Optional[Literal["arrow"]], optional): "arrow" to return
+                the records as a ``pyarrow.Table`` (without the metadata).
 
         Returns:
             dict: A dictionary containing the feed data and metadata
@@ -229,7 +365,163 @@ class HubAPIClient(BaseAPIClient):
                 params['page'] = page if page else PAGE
                 params['size'] = size if size else SIZE
 
-        return self._get(url, params=params)
+        response = self._get(url, params=params)
+        if data_type == "arrow":
+            return self._then(response, lambda r: to_table(r.get("data")))
+        return response
+
+    def iter_webcontent_records(self, webcontent_id: int, webcontent_date: Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]] = None) -> JSONArrayStream:
+        """
+        Iterate over every record of a web content feed as the response streams in.
+
+        Requests all matching data in one response, like
+        ``get_webcontent_data(..., fetch_all=True)``, but parses the ``data``
+        array incrementally instead of decoding the whole body at once.
+
+        Args:
+            webcontent_id (int): The unique identifier of the web content feed.
+            webcontent_date (Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]], optional):
+                A comparison operator and a date value to filter the data, as
+                for get_webcontent_data().
+
+        Returns:
+            JSONArrayStream: Iterable of record dictionaries. Top-level fields
+            such as ``query_metadata`` are available on ``.meta`` once
+            iteration has passed them.
+
+        Example:
+            >>> records = client.iter_webcontent_records(123, (">=", "2025-01-01"))
+            >>> for record in records:
+            ...     print(record['timestamp'])
+        """
+        url, params = self._webcontent_stream_request(webcontent_id, webcontent_date)
+        return self._iter_json_items(url, params=params)
+
+    def iter_webcontent_data(
+        self,
+        webcontent_id: int,
+        webcontent_date: Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]] = None,
+        size: int = 1000,
+        max_workers: int = 4,
+        prefetch: Optional[int] = None,
+        data_type: Optional[Literal["arrow"]] = None,
+    ) -> Iterator[Union[List[dict], "pa.Table"]]:
+        """
+        Iterate over a web content feed page by page, fetching pages concurrently.
+
+        Instead of requesting the whole feed in one ``fetch_all`` response,
+        pages of ``size`` records are requested on a thread pool, at most
+        ``prefetch`` ahead of the consumer, and yielded in order as each
+        arrives. Memory stays bounded by the in-flight window. When the
+        response does not report the record count, pages are requested
+        speculatively and iteration ends at the first short page (or a page
+        the API refuses as out of range).
+
+        Args:
+            webcontent_id (int): The unique identifier of the web content feed.
+            webcontent_date (Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]], optional):
+                Comparison operator and date to filter the data, as for
+                :meth:`get_webcontent_data`.
+            size (int, optional): Records per page. Defaults to 1000.
+            max_workers (int, optional): Pages fetched concurrently.
+            prefetch (Optional[int], optional): Pages requested ahead of the
+                consumer. Defaults to ``max_workers``.
+            data_type (Optional[Literal["arrow"]], optional): "arrow" to yield
+                each page as a ``pyarrow.Table``, with the schema inferred
+                from the first page and widened where a later page needs it.
+
+        Returns:
+            Iterator over each page's records (a list of dictionaries, or a
+            ``pyarrow.Table``), in page order.
+
+        Example:
+            >>> for batch in client.iter_webcontent_data(123, (">=", "2025-01-01"), size=5000):
+            ...     process(batch)
+        """
+        convert = _webcontent_page_converter(data_type)
+
+        def fetch_page(page: int) -> dict:
+            return _with_webcontent_total(
+                self.get_webcontent_data(webcontent_id, webcontent_date, page=page, size=size)
+            )
+
+        pages = iter_page_responses(
+            fetch_page, size, items_key="data", max_workers=max_workers, prefetch=prefetch
+        )
+        return (convert(response) for response in pages)
+
+    def _webcontent_stream_request(self, webcontent_id: int, webcontent_date) -> Tuple[str, dict]:
+        url = f"{self.base_webcontent_url}/{webcontent_id}/data"
+        params = {"fetch_all": True}
+        if webcontent_date:
+            params['webcontent_date_operator'] = webcontent_date[0]
+            params["webcontent_date"] = webcontent_date[1]
+        return url, params
+
+    def _webcontent_file_writer(
+        self, webcontent_id: int, webcontent_date, directory: str, filename: Optional[str],
+        file_format: str, batch_rows: int,
+    ) -> _WebcontentFileWriter:
+        if file_format not in _FILE_EXTENSIONS:
+            raise ValueError(f"file_format must be one of {sorted(_FILE_EXTENSIONS)} (got {file_format!r})")
+        path = os.path.join(
+            os.path.abspath(directory),
+            filename or _webcontent_filename(webcontent_id, webcontent_date, file_format),
+        )
+        return _WebcontentFileWriter(path, file_format, batch_rows)
+
+    def stream_webcontent_to_file(
+        self,
+        webcontent_id: int,
+        webcontent_date: Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]] = None,
+        directory: str = "./",
+        filename: Optional[str] = None,
+        file_format: Literal["json", "ndjson", "parquet"] = "ndjson",
+        batch_rows: int = 50_000,
+    ) -> Tuple[str, int]:
+        """
+        Download a web content feed to disk as the response streams in.
+
+        Unlike :meth:`download_webcontent_file`, the feed is never held in
+        memory: the body is written chunk by chunk ("json", the response
+        as sent), one record per line ("ndjson") or in Parquet row groups of
+        ``batch_rows`` records ("parquet", requires pyarrow). Output goes to
+        a temporary file renamed into place once the download completes, so
+        an interrupted download never leaves a partial file at the path.
+
+        Args:
+            webcontent_id (int): The unique identifier of the web content feed.
+            webcontent_date (Optional[Tuple[Literal["<", "<=", ">", ">=", "=="], Union[datetime, str]]], optional):
+                Comparison operator and date to filter the data, as for
+                :meth:`get_webcontent_data`.
+            directory (str, optional): Directory to write to, created if
+                missing. Defaults to the current directory.
+            filename (Optional[str], optional): Output file name. Defaults to
+                ``webcontent_<id>[_<op>_<date>].<format>``, e.g.
+                ``webcontent_123_gte_2025-01-01.ndjson``.
+            file_format (Literal["json", "ndjson", "parquet"], optional):
+                Output format (default "ndjson").
+            batch_rows (int, optional): Records per Parquet row group.
+
+        Returns:
+            Tuple[str, int]: The path written and the number of records.
+
+        Example:
+            >>> path, count = client.stream_webcontent_to_file(
+            ...     123, (">=", "2025-01-01"), directory="downloads", file_format="parquet"
+            ... )
+        """
+        url, params = self._webcontent_stream_request(webcontent_id, webcontent_date)
+        writer = self._webcontent_file_writer(
+            webcontent_id, webcontent_date, directory, filename, file_format, batch_rows
+        )
+        try:
+            for chunk in self._iter_bytes(url, params=params):
+                writer.feed(chunk)
+            return writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
 
 
     def download_webcontent_file(self, webcontent_id: int, 
@@ -284,16 +576,19 @@ class HubAPIClient(BaseAPIClient):
             - The method creates the target directory if it doesn't exist
             - The file is saved with pretty-printing (indentation) for readability
             - The method returns the data dictionary for immediate use in code
+            - For large feeds, use stream_webcontent_to_file, which writes the
+              data as it downloads instead of holding it in memory
         """
 
-        data = self.get_webcontent_data(webcontent_id, webcontent_date)
-        file_name = filename if filename else f"{data['webcontent_name']}_{webcontent_date[0]}_{webcontent_date[1]}.json"
-        # Get full path of directory and ensure it exists
-        output_dir = os.path.abspath(directory)
-        os.makedirs(output_dir, exist_ok=True)
-        print(f"Uploading file {file_name} to {output_dir}")
-        with open(os.path.join(output_dir, file_name), 'w') as f:
-            json.dump(data, f, indent=2)
-
-        return data
+        def write(data: dict) -> dict:
+            file_name = filename if filename else f"{data['webcontent_name']}_{webcontent_date[0]}_{webcontent_date[1]}.json"
+            # Get full path of directory and ensure it exists
+            output_dir = os.path.abspath(directory)
+            os.makedirs(output_dir, exist_ok=True)
+            logger.info(f"Writing file {file_name} to {output_dir}")
+            with open(os.path.join(output_dir, file_name), 'w') as f:
+                json.dump(data, f, indent=2)
+            return data
+
+        return self._then(self.get_webcontent_data(webcontent_id, webcontent_date), write)
 
@@ -1,6 +1,18 @@
-from typing import Optional, List, Literal, Dict, Any, Union
+from typing import Optional, List, Literal, Dict, Any, Iterator, Union
 
+import pandas as pd
+
+from carbonarc.utils.arrow import to_table
 from carbonarc.utils.client import BaseAPIClient
+from carbonarc.utils.manager import HttpRequestManager
+from carbonarc.utils.ontology_index import OntologyIndex, records
+
+def _strip_insight_sources(response: Dict[str, Any]) -> Dict[str, Any]:
+    for insight in response["items"]:
+        if "sources" in insight:
+            insight.pop("sources")
+    return response
+
 
 class OntologyAPIClient(BaseAPIClient):
     """
@@ -11,7 +23,8 @@ class OntologyAPIClient(BaseAPIClient):
         self, 
         token: str,
         host: str = "https://api.carbonarc.co",
-        version: str = "v2"
+        version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
         ):
         """
         Initialize OntologyAPIClient with an authentication token and user agent.
@@ -20,8 +33,14 @@ class OntologyAPIClient(BaseAPIClient):
             token: The authentication token to be used for requests.
             host: The base URL of the Carbon Arc API.
             version: The API version to use.
-        """
-        super().__init__(token=token, host=host, version=version)
+            request_manager: Optional shared transport to reuse.
+        """
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
         
         self.base_ontology_url = self._build_base_url("ontology")
     
@@ -30,14 +49,14 @@ class OntologyAPIClient(BaseAPIClient):
         Retrieve the entity map.
         """
         url = f"{self.base_ontology_url}/entity-map"
-        return self._get(url)
+        return self._get(url, cache="ontology.entity_map")
     
     def get_insight_map(self) -> dict:
         """
         Retrieve the insight map.
         """
         url = f"{self.base_ontology_url}/insight-map"
-        return self._get(url)
+        return self._get(url, cache="ontology.insight_map")
 
     def get_entities(
         self,
@@ -55,7 +74,8 @@ class OntologyAPIClient(BaseAPIClient):
         page: int = 1,
         size: int = 100,
         sort_by: str = "label",
-        order: str = "asc"
+        order: str = "asc",
+        data_type: Optional[Literal["arrow"]] = None,
     ) -> Dict[str, Any]:
         """
         Retrieve entities with filtering and pagination.
@@ -77,6 +97,8 @@ class OntologyAPIClient(BaseAPIClient):
             size: Number of results per page (default 100).
             sort_by: Field to sort by.
             order: Sort direction ("asc" or "desc").
+            data_type: "arrow" to return the page's entities as a
+                ``pyarrow.Table`` instead.
 
         Returns:
             Dictionary containing paginated entities.
@@ -110,7 +132,10 @@ class OntologyAPIClient(BaseAPIClient):
         if version:
             params["version"] = version
         url = f"{self.base_ontology_url}/entities"
-        return self._get(url, params=params)
+        response = self._get(url, params=params)
+        if data_type == "arrow":
+            return self._then(response, lambda r: to_table(records(r)))
+        return response
 
     def get_entity_information(self, entity_id: int, representation: str) -> dict:
         """
@@ -195,13 +220,150 @@ class OntologyAPIClient(BaseAPIClient):
             params["event_representation"] = event_representation
 
         url = f"{self.base_ontology_url}/insights"
-        response = self._get(url, params=params)
+        return self._then(self._get(url, params=params), _strip_insight_sources)
 
-        for insight in response["items"]:
-            if "sources" in insight:
-                insight.pop("sources")
+    def iter_entities(
+        self,
+        representation: Optional[List[str]] = None,
+        domain: Optional[Union[str, List[str]]] = None,
+        entity: Optional[List[Literal["brand", "company", "people", "location"]]] = None,
+        subject_ids: Optional[List[int]] = None,
+        topic_ids: Optional[List[int]] = None,
+        insight_types: Optional[List[Literal["metric", "event", "kpi", "marketshare", "cohort"]]] = None,
+        insight_id: Optional[int] = None,
+        event_id: Optional[int] = None,
+        event_representation: Optional[str] = None,
+        search: Optional[str] = None,
+        version: Optional[str] = "latest",
+        size: int = 100,
+        sort_by: str = "label",
+        order: str = "asc",
+        max_workers: int = 4,
+        as_dataframe: bool = False,
+    ) -> Union[Iterator[Dict[str, Any]], pd.DataFrame]:
+        """
+        Iterate over every entity matching the filters, across all pages.
 
-        return response
+        The first page gives the total; the following pages are requested
+        ahead of the consumer, up to ``max_workers`` at a time, and items
+        are yielded in order as their page arrives.
+
+        Args:
+            representation, domain, entity, subject_ids, topic_ids,
+            insight_types, insight_id, event_id, event_representation,
+            search, version, sort_by, order: Filters, as for
+                :meth:`get_entities`.
+            size: Number of results per request (default 100).
+            max_workers: Number of pages fetched concurrently (default 4).
+            as_dataframe: Collect every entity into a DataFrame instead of
+                returning an iterator.
+
+        Returns:
+            Iterator of entity dictionaries, or a DataFrame.
+        """
+        def fetch(page: int) -> Dict[str, Any]:
+            return self.get_entities(
+                representation=representation,
+                domain=domain,
+                entity=entity,
+                subject_ids=subject_ids,
+                topic_ids=topic_ids,
+                insight_types=insight_types,
+                insight_id=insight_id,
+                event_id=event_id,
+                event_representation=event_representation,
+                search=search,
+                version=version,
+                page=page,
+                size=size,
+                sort_by=sort_by,
+                order=order,
+            )
+
+        return self._paginate(fetch, size, max_workers=max_workers, as_dataframe=as_dataframe)
+
+    def iter_insights(
+        self,
+        subject_ids: Optional[List[int]] = None,
+        topic_ids: Optional[List[int]] = None,
+        insight_types: Optional[List[Literal["metric", "event", "kpi", "marketshare", "cohort"]]] = None,
+        entity_id: Optional[int] = None,
+        entity_representation: Optional[str] = None,
+        entity_domain: Optional[Union[str, List[str]]] = None,
+        entity: Optional[Literal["brand", "company", "people", "location"]] = None,
+        event_id: Optional[int] = None,
+        event_representation: Optional[str] = None,
+        search: Optional[str] = None,
+        size: int = 100,
+        sort_by: str = "insight_label",
+        order: str = "asc",
+        max_workers: int = 4,
+        as_dataframe: bool = False,
+    ) -> Union[Iterator[Dict[str, Any]], pd.DataFrame]:
+        """
+        Iterate over every insight matching the filters, across all pages.
+        Pages are prefetched as in :meth:`iter_entities`.
+
+        Args:
+            subject_ids, topic_ids, insight_types, entity_id,
+            entity_representation, entity_domain, entity, event_id,
+            event_representation, search, sort_by, order: Filters, as for
+                :meth:`get_insights`.
+            size: Number of results per request (default 100).
+            max_workers: Number of pages fetched concurrently (default 4).
+            as_dataframe: Collect every insight into a DataFrame instead of
+                returning an iterator.
+
+        Returns:
+            Iterator of insight dictionaries, or a DataFrame.
+        """
+        def fetch(page: int) -> Dict[str, Any]:
+            return self.get_insights(
+                subject_ids=subject_ids,
+                topic_ids=topic_ids,
+                insight_types=insight_types,
+                entity_id=entity_id,
+                entity_representation=entity_representation,
+                entity_domain=entity_domain,
+                entity=entity,
+                event_id=event_id,
+                event_representation=event_representation,
+                search=search,
+                page=page,
+                size=size,
+                sort_by=sort_by,
+                order=order,
+            )
+
+        return self._paginate(fetch, size, max_workers=max_workers, as_dataframe=as_dataframe)
+
+    def build_index(
+        self,
+        source: Literal["map", "entities"] = "map",
+        representation: Optional[List[str]] = None,
+        max_workers: int = 4,
+    ) -> OntologyIndex:
+        """
+        Build a local :class:`OntologyIndex` for resolving names and tickers
+        to ``carc_id`` without further requests.
+
+        Args:
+            source: Where entities come from: ``"map"`` (default) uses one
+                :meth:`get_entity_map` call; ``"entities"`` pages through
+                :meth:`iter_entities`, which carries full labels.
+            representation: With ``source="entities"``, only index these
+                entity representations.
+            max_workers: With ``source="entities"``, pages fetched
+                concurrently.
+
+        Returns:
+            OntologyIndex: The index; ``save()`` it to reuse across runs.
+        """
+        if source == "entities":
+            entities = self.iter_entities(representation=representation, max_workers=max_workers)
+        else:
+            entities = records(self.get_entity_map())
+        return OntologyIndex.from_records(entities, records(self.get_insight_map()))
 
     def get_insight_information(self, insight_id: int) -> dict:
         """
@@ -243,14 +405,14 @@ class OntologyAPIClient(BaseAPIClient):
         Retrieve all subjects.
         """
         url = f"{self.base_ontology_url}/subjects"
-        return self._get(url)
+        return self._get(url, cache="ontology.subjects")
     
     def get_topics(self) -> dict:
         """
         Retrieve all topics.
         """
         url = f"{self.base_ontology_url}/topics"
-        return self._get(url)
+        return self._get(url, cache="ontology.topics")
     
     def get_insights_for_subject(self, subject_id: int) -> dict:
         """
@@ -271,21 +433,25 @@ class OntologyAPIClient(BaseAPIClient):
         Retrieve the current ontology version.
         """
         url = f"{self.base_ontology_url}/ontology-versions"
-        return self._get(url)
+        return self._then(
+            self._get(url), lambda r: self._note_version("ontology-versions", "ontology.", r)
+        )
     
     def get_ontology_tree(self) -> dict:
         """
         Retrieve the ontology tree.
         """
         url = f"{self.base_ontology_url}/ontology-tree"
-        return self._get(url)
+        return self._get(url, cache="ontology.tree")
 
     def get_ontology_versions(self) -> Dict[str, Any]:
         """
         Retrieve the available ontology versions.
         """
         url = f"{self.base_ontology_url}/ontology-versions"
-        return self._get(url)
+        return self._then(
+            self._get(url), lambda r: self._note_version("ontology-versions", "ontology.", r)
+        )
     
     def get_event_types(self) -> dict:
         """
@@ -0,0 +1,378 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+from carbonarc.explorer import (
+    _chunked,
+    _format_framework_data,
+    _framework_statuses,
+    _is_finished,
+    _status_text,
+    _track_unreported,
+    _COMPLETED_STATUSES,
+)
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class PipelineResult(NamedTuple):
+    """Outcome of :meth:`FrameworkPipeline.run`."""
+
+    # framework id -> value returned by ``persist`` (the converted data
+    # when no ``persist`` is given)
+    outputs: Dict[str, Any]
+    # (stage, item, exception) per item a stage failed on
+    errors: List[Tuple[str, Any, BaseException]]
+    # frameworks dropped by the price stage, with their quote
+    skipped: List[Tuple[dict, Any]]
+    # one row per stage: items, errors, busy / wall seconds, mean / max
+    # seconds per item
+    metrics: pd.DataFrame
+
+
+def _purchased_ids(response: Any) -> List[str]:
+    """Framework ids named by a ``buy_frameworks`` response."""
+    if isinstance(response, dict):
+        for key in ("framework_ids", "frameworks", "items", "data"):
+            if isinstance(response.get(key), list):
+                response = response[key]
+                break
+        else:
+            response = [response] if "framework_id" in response else []
+    ids = []
+    for item in response if isinstance(response, list) else []:
+        if isinstance(item, dict):
+            item = item.get("framework_id", item.get("id"))
+        if item is not None:
+            ids.append(str(item))
+    return ids
+
+
+class _StageStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.slowest = 0.0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, started: float, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self.items += 1
+            self.errors += failed
+            self.busy += seconds
+            self.slowest = max(self.slowest, seconds)
+            self.started = started if self.started is None else min(self.started, started)
+            self.finished = max(self.finished or 0.0, started + seconds)
+
+    def row(self) -> dict:
+        wall = (self.finished - self.started) if self.started is not None else 0.0
+        return {
+            "stage": self.name,
+            "items": self.items,
+            "errors": self.errors,
+            "busy_seconds": self.busy,
+            "wall_seconds": wall,
+            "mean_seconds": self.busy / self.items if self.items else 0.0,
+            "max_seconds": self.slowest,
+        }
+
+
+class FrameworkPipeline:
+    """
+    Run the quote -> buy -> wait -> download -> convert -> persist job for
+    many frameworks as concurrent stages.
+
+    Each stage has its own worker threads and hands its output to the
+    next through a bounded queue, so downloading one framework overlaps
+    with waiting on another and converting a third, and a slow stage holds
+    back the ones before it instead of letting work pile up in memory.
+    Failures are recorded per item and do not stop the other frameworks.
+
+    Example:
+        >>> pipeline = FrameworkPipeline(client, data_type="dataframe",
+        ...                              persist=lambda fid, df: df.to_csv(f"{fid}.csv"))
+        >>> result = pipeline.run(client.explorer.build_frameworks(entities, insights, filters))
+        >>> result.metrics
+    """
+
+    def __init__(
+        self,
+        client,
+        data_type: Optional[str] = "dataframe",
+        persist: Optional[Callable[[str, Any], Any]] = None,
+        max_price: Optional[float] = None,
+        chunk_size: int = 100,
+        buy_workers: int = 2,
+        download_workers: int = 4,
+        convert_workers: int = 2,
+        persist_workers: int = 1,
+        queue_size: int = 8,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        status_batch_size: int = 100,
+        timeout: Optional[float] = 3600.0,
+    ):
+        """
+        Args:
+            client: A :class:`CarbonArcClient`.
+            data_type: ``data_type`` the frameworks are converted to
+                ("dataframe", "timeseries", or ``None`` for the raw body).
+            persist: Called as ``persist(framework_id, data)`` for each
+                converted framework; its return value is kept in
+                :attr:`PipelineResult.outputs`. ``None`` keeps the data.
+            max_price: Quote each chunk before buying and drop frameworks
+                quoted above this price (or that could not be quoted).
+                ``None`` buys without quoting.
+            chunk_size: Frameworks per quote / purchase request.
+            buy_workers, download_workers, convert_workers,
+            persist_workers: Threads per stage.
+            queue_size: Capacity of each queue between stages.
+            poll_interval, max_interval, backoff: Status polling schedule,
+                as for :meth:`ExplorerAPIClient.wait_for_frameworks`.
+            status_batch_size: Framework ids per status request.
+            timeout: Seconds after its purchase to give up waiting on a
+                framework, recorded as a ``("wait", id, TimeoutError)``
+                error. ``None`` waits for as long as it takes.
+        """
+        self.explorer = client.explorer
+        self.data_type = data_type
+        self.persist = persist
+        self.max_price = max_price
+        self.chunk_size = chunk_size
+        self.buy_workers = buy_workers
+        self.download_workers = download_workers
+        self.convert_workers = convert_workers
+        self.persist_workers = persist_workers
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.status_batch_size = status_batch_size
+        self.timeout = timeout
+
+    def run(self, frameworks: Iterable[dict]) -> PipelineResult:
+        """
+        Push ``frameworks`` through every stage and wait for all of them.
+
+        Args:
+            frameworks: Framework dictionaries, e.g. from
+                :meth:`ExplorerAPIClient.build_frameworks`.
+
+        Returns:
+            :class:`PipelineResult`.
+        """
+        errors: List[Tuple[str, Any, BaseException]] = []
+        skipped: List[Tuple[dict, Any]] = []
+        outputs: Dict[str, Any] = {}
+        # Guards the three results above, which every stage's workers add to.
+        results_lock = threading.Lock()
+        stats: List[_StageStats] = []
+        threads: List[threading.Thread] = []
+
+        def fail(name: str, item: Any, error: BaseException) -> None:
+            with results_lock:
+                errors.append((name, item, error))
+
+        def stage(name: str, fn: Callable[[Any], Iterable[Any]], workers: int, inbox, outbox):
+            record = _StageStats(name)
+            stats.append(record)
+            remaining = [workers]
+            lock = threading.Lock()
+
+            def work():
+                while True:
+                    item = inbox.get()
+                    if item is _DONE:
+                        inbox.put(_DONE)  # let the sibling workers see it too
+                        break
+                    started = time.perf_counter()
+                    failed = False
+                    try:
+                        results = list(fn(item))
+                    except Exception as e:
+                        logger.warning(f"Pipeline stage {name} failed: {e}")
+                        fail(name, item, e)
+                        results, failed = [], True
+                    record.record(started, time.perf_counter() - started, failed)
+                    if outbox is not None:
+                        for result in results:
+                            outbox.put(result)
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last and outbox is not None:
+                    outbox.put(_DONE)
+
+            for i in range(workers):
+                threads.append(threading.Thread(
+                    target=work, name=f"carbonarc-{name}-{i}", daemon=True
+                ))
+
+        def bounded() -> queue.Queue:
+            return queue.Queue(maxsize=self.queue_size)
+
+        chunks, to_buy, to_wait, to_download, to_convert, to_persist = (
+            bounded(), bounded(), bounded(), bounded(), bounded(), bounded()
+        )
+
+        def quote(chunk: List[dict]):
+            prices = self.explorer.check_framework_prices(chunk)
+            keep = []
+            for framework, price in zip(chunk, prices["price"].tolist()):
+                if price is None or pd.isna(price) or price > self.max_price:
+                    with results_lock:
+                        skipped.append((framework, price))
+                else:
+                    keep.append(framework)
+            return [keep] if keep else []
+
+        def buy(chunk: List[dict]):
+            bought = time.perf_counter()
+            return [(i, bought) for i in _purchased_ids(self.explorer.buy_frameworks(chunk))]
+
+        def download(item: Tuple[str, float]):
+            framework_id, _ = item
+            yield framework_id, self.explorer.get_raw_framework_data(framework_id, self.data_type)
+
+        def convert(item: Tuple[str, Any]):
+            framework_id, raw = item
+            yield framework_id, _format_framework_data(raw, self.data_type)
+
+        def persist(item: Tuple[str, Any]):
+            framework_id, data = item
+            output = data if self.persist is None else self.persist(framework_id, data)
+            with results_lock:
+                outputs[framework_id] = output
+            return ()
+
+        if self.max_price is not None:
+            stage("quote", quote, 1, chunks, to_buy)
+        else:
+            to_buy = chunks
+        stage("buy", buy, self.buy_workers, to_buy, to_wait)
+        wait_stats = _StageStats("wait")
+        stats.append(wait_stats)
+        threads.append(threading.Thread(
+            target=self._wait_stage,
+            args=(to_wait, to_download, wait_stats, fail),
+            name="carbonarc-wait",
+            daemon=True,
+        ))
+        stage("download", download, self.download_workers, to_download, to_convert)
+        stage("convert", convert, self.convert_workers, to_convert, to_persist)
+        stage("persist", persist, self.persist_workers, to_persist, None)
+
+        for thread in threads:
+            thread.start()
+        for chunk in _chunked(list(frameworks), self.chunk_size):
+            chunks.put(chunk)
+        chunks.put(_DONE)
+        for thread in threads:
+            thread.join()
+
+        # Report stages in pipeline order (the wait stage is created after
+        # the ones before it, so ``stats`` already is).
+        return PipelineResult(
+            outputs=outputs,
+            errors=errors,
+            skipped=skipped,
+            metrics=pd.DataFrame([s.row() for s in stats]),
+        )
+
+    def _wait_stage(
+        self,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        stats: _StageStats,
+        fail: Callable[[str, Any, BaseException], None],
+    ):
+        """Poll every bought framework in batches, adding new purchases as
+        they arrive, and pass completed ones on. ``stats`` times each
+        framework from purchase to completion and failures are reported
+        through ``fail``. Frameworks still pending ``timeout`` seconds after
+        purchase are given up on; a run of failed polls is recorded once,
+        not once per poll."""
+        pending: Dict[str, float] = {}
+        unreported: set = set()
+        poll_error: Optional[BaseException] = None
+        closed = False
+        interval = self.poll_interval
+        next_poll = time.monotonic()
+        while not closed or pending:
+            # Take in new purchases; block only while there is nothing to poll.
+            while not closed:
+                try:
+                    timeout = max(0.0, next_poll - time.monotonic()) if pending else None
+                    item = inbox.get(timeout=timeout) if timeout != 0.0 else inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    closed = True
+                else:
+                    framework_id, bought = item
+                    pending[framework_id] = bought
+            if not pending:
+                continue
+            if time.monotonic() < next_poll:
+                time.sleep(max(0.0, next_poll - time.monotonic()))
+            ids = list(pending)
+            statuses: Dict[str, dict] = {}
+            try:
+                for start in range(0, len(ids), self.status_batch_size):
+                    statuses.update(_framework_statuses(
+                        self.explorer.get_framework_status(ids[start:start + self.status_batch_size])
+                    ))
+            except Exception as e:
+                logger.warning(f"Pipeline stage wait failed to poll: {e}")
+                if poll_error is None:
+                    fail("wait", ids, e)
+                poll_error = e
+            else:
+                poll_error = None
+                _track_unreported(ids, statuses, unreported)
+            finished = [i for i in ids if _is_finished(statuses.get(i))]
+            for framework_id in finished:
+                bought = pending.pop(framework_id)
+                now = time.perf_counter()
+                if _status_text(statuses[framework_id]) in _COMPLETED_STATUSES:
+                    stats.record(bought, now - bought)
+                    outbox.put((framework_id, bought))
+                else:
+                    stats.record(bought, now - bought, failed=True)
+                    fail("wait", framework_id, RuntimeError(
+                        f"Framework {framework_id} finished as {statuses[framework_id]}"
+                    ))
+            if self.timeout is not None:
+                now = time.perf_counter()
+                for framework_id in [i for i, bought in pending.items() if now - bought >= self.timeout]:
+                    bought = pending.pop(framework_id)
+                    stats.record(bought, now - bought, failed=True)
+                    reason = (
+                        "not reported by the status endpoint" if framework_id in unreported
+                        else f"last poll failed: {poll_error}" if poll_error is not None
+                        else f"last status {statuses.get(framework_id)}"
+                    )
+                    fail("wait", framework_id, TimeoutError(
+                        f"Framework {framework_id} still pending after {self.timeout}s ({reason})"
+                    ))
+            interval = (
+                self.poll_interval if finished
+                else min(interval * self.backoff, self.max_interval)
+            )
+            next_poll = time.monotonic() + interval
+            if self.timeout is not None and pending:
+                # Wake up in time to give up on the oldest purchase.
+                give_up = min(pending.values()) + self.timeout - time.perf_counter()
+                next_poll = min(next_poll, time.monotonic() + max(0.0, give_up))
+        outbox.put(_DONE)
@@ -0,0 +1,716 @@
+import json
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from carbonarc.utils.arrow import ParquetSink, infer_schema, record_batch, require_pyarrow
+from carbonarc.utils.cache import fingerprint
+from carbonarc.utils.ontology_index import OntologyIndex, records
+from carbonarc.utils.pagination import iter_paged_items
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    entity_id TEXT NOT NULL,
+    representation TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (entity_id, representation)
+);
+CREATE TABLE IF NOT EXISTS datasets (
+    dataset_id TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS state (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Status codes with which a change feed refuses to diff from a version it
+# no longer keeps; the sync then rebuilds from the full listings.
+_GAP_STATUSES = {400, 404, 410, 422}
+_REMOVAL_ACTIONS = {"removed", "remove", "deleted", "delete", "dropped", "retired"}
+_ACTION_FIELDS = ("change_type", "action", "operation", "change", "type")
+_VERSION_FIELDS = ("latest_version", "current_version", "to_version", "version", "latest")
+
+
+def _version_key(version: str) -> Tuple[int, ...]:
+    return tuple(int(n) for n in re.findall(r"\d+", version))
+
+
+def _version_of(payload: Any) -> Optional[str]:
+    """Latest version named by a version endpoint or change-feed body."""
+    if isinstance(payload, (str, int)):
+        return str(payload)
+    if isinstance(payload, dict):
+        for field in _VERSION_FIELDS:
+            if isinstance(payload.get(field), (str, int)):
+                return str(payload[field])
+    versions = [v for v in (_version_of(r) for r in records(payload)) if v]
+    return max(versions, key=_version_key) if versions else None
+
+
+_ENTITY_ENVELOPES = ("data", "entity", "item", "result")
+
+
+def _entity_id(row: dict) -> Any:
+    return next(
+        (row[f] for f in ("entity_id", "carc_id", "id") if row.get(f) is not None), None
+    )
+
+
+def _entity_key(row: dict) -> Optional[Tuple[str, str]]:
+    entity_id = _entity_id(row)
+    if entity_id is None:
+        return None
+    representation = row.get("entity_representation") or row.get("representation") or ""
+    return str(entity_id), str(representation)
+
+
+def _entity_record(body: Any, entity_id: Any, representation: str) -> dict:
+    """
+    The form every mirrored entity is stored in, whether it came from the
+    entity listing or the entity detail endpoint: the entity's own fields,
+    unwrapped from a ``data`` / ``entity`` envelope, with ``entity_id`` and
+    ``entity_representation`` always set.
+    """
+    if isinstance(body, dict):
+        for field in _ENTITY_ENVELOPES:
+            if isinstance(body.get(field), dict):
+                body = body[field]
+                break
+    record = dict(body) if isinstance(body, dict) else {}
+    record.setdefault("entity_id", entity_id)
+    record.setdefault("entity_representation", representation)
+    return record
+
+
+def _is_removal(change: dict) -> bool:
+    return any(
+        str(change.get(field, "")).lower() in _REMOVAL_ACTIONS for field in _ACTION_FIELDS
+    )
+
+
+def _is_gap(error: requests.exceptions.HTTPError) -> bool:
+    return error.response is not None and error.response.status_code in _GAP_STATUSES
+
+
+class OntologySync:
+    """
+    Keep a local SQLite mirror of ontology entities and the data library
+    current by applying version-change feeds.
+
+    The first :meth:`sync` downloads the full entity and dataset listings.
+    Later calls page through
+    :meth:`OntologyAPIClient.get_ontology_version_changes_for_entities` and
+    :meth:`DataAPIClient.get_library_version_changes` from the last
+    version seen, delete removed rows and refetch only the entities /
+    datasets that changed (concurrently). Entities are stored in one form
+    whichever path fetched them (see :func:`_entity_record`). A full
+    rebuild happens only when
+    no previous version is recorded, the feed refuses to diff from it
+    (the version has aged out), or there are more than
+    ``max_incremental_changes`` changes.
+
+    Example:
+        >>> mirror = OntologySync(client, "ontology-mirror.sqlite3")
+        >>> mirror.sync()
+        {'ontology': {'mode': 'incremental', 'changes': 12, ...}, 'library': {...}}
+        >>> index = mirror.build_index()
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str,
+        representations: Optional[List[str]] = None,
+        page_size: int = 500,
+        max_workers: int = 8,
+        max_incremental_changes: Optional[int] = 50_000,
+    ):
+        """
+        Args:
+            client: A :class:`CarbonArcClient`.
+            path: SQLite file holding the mirror (created if missing).
+            representations: Only mirror these entity representations.
+            page_size: Page size for listings and change feeds.
+            max_workers: Concurrent requests for pages and refetches.
+            max_incremental_changes: Rebuild instead of applying more
+                changes than this in one sync. ``None`` never rebuilds for
+                size.
+        """
+        self.client = client
+        self.path = path
+        self.representations = representations
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.max_incremental_changes = max_incremental_changes
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # ---- state -----------------------------------------------------------
+
+    def _get_state(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def ontology_version(self) -> Optional[str]:
+        """Ontology version the mirror is current with."""
+        return self._get_state("ontology_version")
+
+    @property
+    def library_version(self) -> Optional[str]:
+        """Library version the mirror is current with."""
+        return self._get_state("library_version")
+
+    # ---- sync ------------------------------------------------------------
+
+    def sync(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Bring the mirror up to date.
+
+        Returns:
+            Per part (``"ontology"``, ``"library"``): ``mode`` (``"noop"``,
+            ``"incremental"`` or ``"full"``), ``from`` / ``to`` versions,
+            ``changes`` applied and ``rows`` refetched.
+        """
+        return {"ontology": self.sync_ontology(), "library": self.sync_library()}
+
+    def sync_ontology(self) -> Dict[str, Any]:
+        """Bring the entity mirror up to date; see :meth:`sync`."""
+        since = self.ontology_version
+        latest = _version_of(self.client.ontology.get_ontology_version())
+        if since is not None and latest is not None and since == latest:
+            return {"mode": "noop", "from": since, "to": latest, "changes": 0, "rows": 0}
+        if since is None:
+            return self._rebuild_ontology(since, latest)
+
+        changes = []
+        try:
+            for representation in self.representations or [None]:
+                changes.extend(self._changes(
+                    lambda page, rep=representation: (
+                        self.client.ontology.get_ontology_version_changes_for_entities(
+                            version=since,
+                            entity_representation=rep,
+                            page=page,
+                            size=self.page_size,
+                            order="asc",
+                        )
+                    )
+                ))
+        except requests.exceptions.HTTPError as e:
+            if not _is_gap(e):
+                raise
+            logger.info(f"Ontology changes since {since} unavailable; rebuilding")
+            return self._rebuild_ontology(since, latest)
+        if self._too_many(changes):
+            return self._rebuild_ontology(since, latest)
+
+        # Ids are passed back to the API as the change feed gave them.
+        removed: set = set()
+        changed: Dict[Tuple[str, str], Any] = {}
+        for change in changes:
+            key = _entity_key(change)
+            if key is None:
+                continue
+            if self.representations and key[1] not in self.representations:
+                continue
+            if _is_removal(change):
+                removed.add(key)
+                changed.pop(key, None)
+            else:
+                changed[key] = _entity_id(change)
+                removed.discard(key)
+
+        fetched = self._fetch_all(
+            lambda key: self.client.ontology.get_entity_information(changed[key], key[1]),
+            sorted(changed),
+        )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM entities WHERE entity_id = ? AND representation = ?", sorted(removed)
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?)",
+                [
+                    (k[0], k[1], json.dumps(_entity_record(body, changed[k], k[1])))
+                    for k, body in fetched
+                ],
+            )
+            self._set_state("ontology_version", latest or since)
+        return {
+            "mode": "incremental", "from": since, "to": latest,
+            "changes": len(changes), "rows": len(fetched),
+        }
+
+    def sync_library(self) -> Dict[str, Any]:
+        """Bring the dataset mirror up to date; see :meth:`sync`."""
+        since = self.library_version
+        if since is None:
+            return self._rebuild_library(since)
+
+        first: Dict[str, Any] = {}
+
+        def fetch(page: int) -> dict:
+            response = self.client.data.get_library_version_changes(
+                version=since, page=page, size=self.page_size, order="asc"
+            )
+            if page == 1:
+                first.update(response)
+            return response
+
+        try:
+            changes = self._changes(fetch)
+        except requests.exceptions.HTTPError as e:
+            if not _is_gap(e):
+                raise
+            logger.info(f"Library changes since {since} unavailable; rebuilding")
+            return self._rebuild_library(since)
+        latest = _version_of(first) or _version_of(changes) or since
+        if not changes:
+            self._store_library_version(latest)
+            return {"mode": "noop", "from": since, "to": latest, "changes": 0, "rows": 0}
+        if self._too_many(changes):
+            return self._rebuild_library(since)
+
+        removed, changed = set(), set()
+        for change in changes:
+            dataset_id = change.get("dataset_id") or change.get("id")
+            if dataset_id is None:
+                continue
+            (removed if _is_removal(change) else changed).add(str(dataset_id))
+            (changed if _is_removal(change) else removed).discard(str(dataset_id))
+
+        fetched = self._fetch_all(self.client.data.get_dataset_information, sorted(changed))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM datasets WHERE dataset_id = ?", [(d,) for d in sorted(removed)]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO datasets VALUES (?, ?)",
+                [(d, json.dumps(body)) for d, body in fetched],
+            )
+            self._set_state("library_version", latest)
+        return {
+            "mode": "incremental", "from": since, "to": latest,
+            "changes": len(changes), "rows": len(fetched),
+        }
+
+    # ---- helpers ---------------------------------------------------------
+
+    def _changes(self, fetch_page: Callable[[int], dict]) -> List[dict]:
+        def normalized(page: int) -> dict:
+            response = fetch_page(page)
+            return {
+                "items": records(response),
+                "pages": response.get("pages"),
+                "total": response.get("total"),
+            }
+
+        return list(iter_paged_items(
+            normalized, self.page_size, max_workers=self.max_workers
+        ))
+
+    def _too_many(self, changes: list) -> bool:
+        if self.max_incremental_changes is not None and len(changes) > self.max_incremental_changes:
+            logger.info(f"{len(changes)} changes exceed max_incremental_changes; rebuilding")
+            return True
+        return False
+
+    def _fetch_all(self, fetch: Callable[[Any], dict], keys: list) -> List[Tuple[Any, dict]]:
+        if not keys:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(zip(keys, pool.map(fetch, keys)))
+
+    def _set_state(self, name: str, value: Optional[str]) -> None:
+        # Callers hold the lock and the transaction.
+        self._conn.execute("INSERT OR REPLACE INTO state VALUES (?, ?)", (name, value))
+
+    def _store_library_version(self, version: Optional[str]) -> None:
+        with self._lock, self._conn:
+            self._set_state("library_version", version)
+
+    def _rebuild_ontology(self, since: Optional[str], latest: Optional[str]) -> Dict[str, Any]:
+        rows = []
+        for representation in self.representations or [None]:
+            for entity in self.client.ontology.iter_entities(
+                representation=[representation] if representation else None,
+                size=self.page_size,
+                max_workers=self.max_workers,
+            ):
+                key = _entity_key(entity)
+                if key is not None:
+                    record = _entity_record(entity, _entity_id(entity), key[1])
+                    rows.append((key[0], key[1], json.dumps(record)))
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entities")
+            self._conn.executemany("INSERT OR REPLACE INTO entities VALUES (?, ?, ?)", rows)
+            self._set_state("ontology_version", latest)
+        return {"mode": "full", "from": since, "to": latest, "changes": 0, "rows": len(rows)}
+
+    def _rebuild_library(self, since: Optional[str]) -> Dict[str, Any]:
+        # Read the current version first, so changes landing during the
+        # rebuild are picked up (again) by the next incremental sync.
+        latest = _version_of(self.client.data.get_library_version_changes(version="latest"))
+        rows = []
+        for dataset in records(self.client.data.get_datasets()):
+            dataset_id = dataset.get("dataset_id") or dataset.get("id")
+            if dataset_id is not None:
+                rows.append((str(dataset_id), json.dumps(dataset)))
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM datasets")
+            self._conn.executemany("INSERT OR REPLACE INTO datasets VALUES (?, ?)", rows)
+            self._set_state("library_version", latest)
+        return {"mode": "full", "from": since, "to": latest, "changes": 0, "rows": len(rows)}
+
+    # ---- reading the mirror ----------------------------------------------
+
+    def entities(self, representation: Optional[str] = None) -> Iterator[dict]:
+        """Iterate the mirrored entities, optionally of one representation."""
+        with self._lock:
+            if representation is None:
+                rows = self._conn.execute("SELECT body FROM entities").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT body FROM entities WHERE representation = ?", (representation,)
+                ).fetchall()
+        return (json.loads(body) for (body,) in rows)
+
+    def entity(self, entity_id: int, representation: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM entities WHERE entity_id = ? AND representation = ?",
+                (str(entity_id), representation),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def datasets(self) -> List[dict]:
+        """The mirrored dataset entries."""
+        with self._lock:
+            rows = self._conn.execute("SELECT body FROM datasets ORDER BY dataset_id").fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    def dataset(self, dataset_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM datasets WHERE dataset_id = ?", (dataset_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def build_index(self, insights: Optional[List[dict]] = None) -> OntologyIndex:
+        """An :class:`OntologyIndex` over the mirrored entities."""
+        return OntologyIndex.from_records(self.entities(), insights or ())
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Partition for records without a usable date.
+_UNDATED = "__HIVE_DEFAULT_PARTITION__"
+_FEED_FORMATS = ("ndjson", "parquet")
+_DAY = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Fingerprints of the records stored in a partition, one per line, kept in
+# the partition; the leading underscore keeps dataset readers from picking
+# it up.
+_PARTITION_KEYS = "_keys.txt"
+
+
+def _record_day(record: dict, date_field: str) -> str:
+    value = record.get(date_field)
+    match = _DAY.match(str(value)) if value is not None else None
+    return match.group(0) if match else _UNDATED
+
+
+def _feed_ids(response: Any) -> List[int]:
+    """Feed ids listed by :meth:`HubAPIClient.get_subscribed_feeds`."""
+    if isinstance(response, dict):
+        response = next(
+            (response[k] for k in ("feeds", "items", "data") if isinstance(response.get(k), list)),
+            [],
+        )
+    ids = []
+    for feed in response if isinstance(response, list) else []:
+        feed_id = feed.get("webcontent_id", feed.get("id")) if isinstance(feed, dict) else feed
+        if feed_id is not None:
+            ids.append(feed_id)
+    return ids
+
+
+class WebcontentSync:
+    """
+    Keep local copies of web content feeds current by pulling only the
+    records dated on or after each feed's high-water mark.
+
+    Records are stored hive-partitioned by feed and day
+    (``root/feed=<id>/date=<YYYY-MM-DD>/part-<n>.<ndjson|parquet>``), which
+    DuckDB, Polars and pyarrow datasets read directly. Each sync streams
+    ``(">=", high_water)`` from :meth:`HubAPIClient.iter_webcontent_records`
+    and appends the records a partition doesn't hold yet, compared by
+    content. The high-water day is fetched again, so records added to it
+    later are not missed, and none are duplicated. Partitions are never
+    replaced: the API filters on its own web content date, which need not
+    agree with ``date_field``, so a received day may be missing records
+    stored by earlier syncs. A record whose content changes upstream is
+    kept in both versions. New parts are staged next to the data and moved
+    in once a feed's download completes, and the mark only advances after
+    that. Feeds are synced concurrently.
+
+    Example:
+        >>> feeds = WebcontentSync(client, "webcontent")
+        >>> feeds.sync()          # every subscribed feed
+        {123: {'since': '2025-03-01', 'high_water': '2025-03-02', 'records': 812, ...}}
+    """
+
+    def __init__(
+        self,
+        client,
+        root: str,
+        file_format: str = "ndjson",
+        date_field: str = "timestamp",
+        max_workers: int = 4,
+        flush_rows: int = 50_000,
+    ):
+        """
+        Args:
+            client: A :class:`CarbonArcClient`.
+            root: Directory holding the partitions and ``_state.json``.
+            file_format: "ndjson" or "parquet" (requires pyarrow).
+            date_field: Record field holding the record's date or
+                timestamp (ISO format); its ``YYYY-MM-DD`` prefix names the
+                partition. A sync fails if no record it receives carries
+                it. Records without it go to the
+                ``date=__HIVE_DEFAULT_PARTITION__`` partition.
+            max_workers: Feeds synced concurrently.
+            flush_rows: Records buffered per feed before they are written
+                out as part files.
+        """
+        if file_format not in _FEED_FORMATS:
+            raise ValueError(f"file_format must be one of {_FEED_FORMATS} (got {file_format!r})")
+        if file_format == "parquet":
+            require_pyarrow()
+        self.client = client
+        self.root = os.path.abspath(root)
+        self.file_format = file_format
+        self.date_field = date_field
+        self.max_workers = max_workers
+        self.flush_rows = flush_rows
+        self._lock = threading.Lock()
+        self._state_path = os.path.join(self.root, "_state.json")
+        os.makedirs(self.root, exist_ok=True)
+        if os.path.exists(self._state_path):
+            with open(self._state_path) as f:
+                self._state: Dict[str, dict] = json.load(f)
+        else:
+            self._state = {}
+
+    # ---- state -----------------------------------------------------------
+
+    @property
+    def state(self) -> Dict[str, dict]:
+        """Per feed: ``high_water`` day, ``records`` stored by the last sync
+        and ``synced_at`` (epoch seconds)."""
+        with self._lock:
+            return {k: dict(v) for k, v in self._state.items()}
+
+    def high_water(self, webcontent_id: int) -> Optional[str]:
+        """Latest record day stored for a feed, or ``None`` before its
+        first sync."""
+        with self._lock:
+            return self._state.get(str(webcontent_id), {}).get("high_water")
+
+    def _save_state(self, webcontent_id: int, entry: dict) -> None:
+        with self._lock:
+            self._state[str(webcontent_id)] = entry
+            fd, tmp = tempfile.mkstemp(dir=self.root, prefix="._state.", suffix=".part")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._state, f, indent=2, sort_keys=True)
+            os.replace(tmp, self._state_path)
+
+    def feed_path(self, webcontent_id: int) -> str:
+        """Directory holding a feed's partitions."""
+        return os.path.join(self.root, f"feed={webcontent_id}")
+
+    # ---- sync ------------------------------------------------------------
+
+    def sync(self, webcontent_ids: Optional[Iterable[int]] = None) -> Dict[Any, dict]:
+        """
+        Sync several feeds concurrently.
+
+        Args:
+            webcontent_ids: Feeds to sync; defaults to every feed from
+                :meth:`HubAPIClient.get_subscribed_feeds`.
+
+        Returns:
+            Per feed id, the stats of :meth:`sync_feed`, or ``{"error": ...}``
+            for a feed that failed (its mark is left unchanged).
+        """
+        if webcontent_ids is None:
+            webcontent_ids = _feed_ids(self.client.hub.get_subscribed_feeds())
+        webcontent_ids = list(webcontent_ids)
+        results: Dict[Any, dict] = {}
+        if not webcontent_ids:
+            return results
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(webcontent_ids))) as pool:
+            futures = {i: pool.submit(self.sync_feed, i) for i in webcontent_ids}
+            for webcontent_id, future in futures.items():
+                try:
+                    results[webcontent_id] = future.result()
+                except Exception as e:
+                    logger.warning(f"Syncing web content feed {webcontent_id} failed: {e}")
+                    results[webcontent_id] = {"error": str(e)}
+        return results
+
+    def sync_feed(self, webcontent_id: int) -> dict:
+        """
+        Pull a feed's records since its high-water mark.
+
+        Returns:
+            ``since`` (previous mark), ``high_water`` (new mark), ``records``
+            transferred, ``undated`` records among them, ``stored`` records
+            that were new and ``partitions`` appended to.
+
+        Raises:
+            ValueError: If records were received but none carries
+                ``date_field``; nothing is stored and the mark is unchanged.
+        """
+        since = self.high_water(webcontent_id)
+        os.makedirs(self.feed_path(webcontent_id), exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.feed_path(webcontent_id), prefix=".staging-")
+        buffers: Dict[str, List[dict]] = defaultdict(list)
+        parts: Dict[str, int] = defaultdict(int)
+        keys: Dict[str, set] = {}
+        buffered = 0
+        count = 0
+        undated = 0
+        stored = 0
+        high = since
+
+        def flush() -> None:
+            for day, rows in buffers.items():
+                self._write_part(os.path.join(staging, f"date={day}"), parts[day], rows)
+                parts[day] += 1
+            buffers.clear()
+
+        try:
+            for record in self.client.hub.iter_webcontent_records(
+                webcontent_id, (">=", since) if since else None
+            ):
+                day = _record_day(record, self.date_field)
+                count += 1
+                if day == _UNDATED:
+                    undated += 1
+                elif high is None or day > high:
+                    high = day
+                if day not in keys:
+                    keys[day] = self._partition_keys(webcontent_id, day)
+                key = fingerprint(record)
+                if key in keys[day]:
+                    continue
+                keys[day].add(key)
+                buffers[day].append(record)
+                buffered += 1
+                stored += 1
+                if buffered >= self.flush_rows:
+                    flush()
+                    buffered = 0
+            if count and undated == count:
+                raise ValueError(
+                    f"None of the {count} records of web content feed {webcontent_id} "
+                    f"has a date in {self.date_field!r}; pass the feed's date field "
+                    f"as date_field (record fields: {sorted(record)[:20]})"
+                )
+            if undated:
+                logger.warning(
+                    f"{undated} of {count} records of web content feed {webcontent_id} "
+                    f"have no date in {self.date_field!r}"
+                )
+            flush()
+            for day in parts:
+                with open(os.path.join(staging, f"date={day}", _PARTITION_KEYS), "w") as f:
+                    f.writelines(key + "\n" for key in sorted(keys[day]))
+            self._publish(webcontent_id, staging)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        self._save_state(webcontent_id, {
+            "high_water": high,
+            "records": count,
+            "synced_at": time.time(),
+        })
+        return {
+            "since": since,
+            "high_water": high,
+            "records": count,
+            "undated": undated,
+            "stored": stored,
+            "partitions": len(parts),
+        }
+
+    def _partition_keys(self, webcontent_id: int, day: str) -> set:
+        path = os.path.join(self.feed_path(webcontent_id), f"date={day}", _PARTITION_KEYS)
+        if not os.path.exists(path):
+            return set()
+        with open(path) as f:
+            return {line.strip() for line in f if line.strip()}
+
+    def _write_part(self, directory: str, index: int, rows: List[dict]) -> None:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{index}.{self.file_format}")
+        if self.file_format == "parquet":
+            with ParquetSink(path, infer_schema(rows)) as sink:
+                sink.write(record_batch(rows, sink.schema))
+        else:
+            with open(path, "w") as f:
+                f.writelines(json.dumps(row, separators=(",", ":")) + "\n" for row in rows)
+
+    def _publish(self, webcontent_id: int, staging: str) -> None:
+        """Move staged partitions into place: new days whole, parts for
+        existing days after the ones they hold, then their record keys."""
+        feed_dir = self.feed_path(webcontent_id)
+        for name in sorted(os.listdir(staging)):
+            staged = os.path.join(staging, name)
+            target = os.path.join(feed_dir, name)
+            if not os.path.isdir(target):
+                os.replace(staged, target)
+                continue
+            offset = _next_part(target)
+            staged_parts = sorted(
+                (p for p in os.listdir(staged) if p != _PARTITION_KEYS),
+                key=_part_index,
+            )
+            for i, part in enumerate(staged_parts):
+                os.replace(
+                    os.path.join(staged, part),
+                    os.path.join(target, f"part-{offset + i}.{self.file_format}"),
+                )
+            # Keys last: an interrupted publish re-adds records rather than
+            # losing them.
+            os.replace(os.path.join(staged, _PARTITION_KEYS), os.path.join(target, _PARTITION_KEYS))
+
+
+def _part_index(name: str) -> int:
+    match = re.match(r"part-(\d+)\.", name)
+    return int(match.group(1)) if match else -1
+
+
+def _next_part(directory: str) -> int:
+    return max((_part_index(name) for name in os.listdir(directory)), default=-1) + 1
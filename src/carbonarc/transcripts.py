@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 
+from carbonarc.utils.arrow import to_table
 from carbonarc.utils.client import BaseAPIClient
+from carbonarc.utils.manager import HttpRequestManager
 
 
 class TranscriptAPIClient(BaseAPIClient):
@@ -14,8 +16,19 @@ class TranscriptAPIClient(BaseAPIClient):
     Transcripts for your account.
     """
 
-    def __init__(self, token: str, host: str, version: str):
-        super().__init__(token=token, host=host, version=version)
+    def __init__(
+        self,
+        token: str,
+        host: str,
+        version: str,
+        request_manager: Optional[HttpRequestManager] = None,
+    ):
+        super().__init__(
+            token=token,
+            host=host,
+            version=version,
+            request_manager=request_manager,
+        )
         self._base_url = f"{host.rstrip('/')}/{version}/transcripts"
 
     def list_transcripts(
@@ -32,6 +45,7 @@ class TranscriptAPIClient(BaseAPIClient):
         order: str = "desc",
         page: int = 1,
         size: int = 20,
+        data_type: Optional[Literal["arrow"]] = None,
     ) -> dict:
         """List available transcripts for your account.
 
@@ -52,6 +66,8 @@ class TranscriptAPIClient(BaseAPIClient):
             order: Sort direction — ``"desc"`` (default) or ``"asc"``.
             page: Page number, 1-indexed (default ``1``).
             size: Page size, 1–100 (default ``20``).
+            data_type: ``"arrow"`` to return the page's transcripts as a
+                ``pyarrow.Table`` instead.
 
         Returns:
             Dict with ``transcripts`` (list), ``total`` (int), ``page`` (int), and ``size`` (int).
@@ -71,7 +87,10 @@ class TranscriptAPIClient(BaseAPIClient):
             params["entity"] = entity
         if is_purchased is not None:
             params["is_purchased"] = is_purchased
-        return self._get(self._base_url, params=params)
+        response = self._get(self._base_url, params=params)
+        if data_type == "arrow":
+            return self._then(response, lambda r: to_table(r.get("transcripts")))
+        return response
 
     def get_transcript(self, transcript_id: str) -> dict:
         """Get metadata for a single transcript.
@@ -0,0 +1,451 @@
+import datetime
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Id columns besides ``*_id``; stored as int64 when their values are integral.
+_ID_NAMES = {"id", "carc_id"}
+# Name columns besides ``*_<name>``; always dictionary-encoded.
+_NAME_NAMES = ("name", "label", "representation", "unit")
+_PLAIN_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Arrow and Parquet output require pyarrow. Install it with "
+            "`pip install 'carbonarc[arrow]'`."
+        )
+
+
+def columns(data: Union[List[dict], Dict[str, list], None]) -> Dict[str, list]:
+    """Column lists from a page's ``data``, given as records or columns."""
+    if not data:
+        return {}
+    if isinstance(data, dict):
+        return {str(k): list(v) if isinstance(v, list) else [v] for k, v in data.items()}
+    names: Dict[str, None] = {}
+    for record in data:
+        names.update(dict.fromkeys(record))
+    return {name: [record.get(name) for record in data] for name in names}
+
+
+def _is_date_column(name: str) -> bool:
+    return name == "date" or name.endswith("_date")
+
+
+def _is_id_column(name: str) -> bool:
+    return name in _ID_NAMES or name.endswith("_id")
+
+
+def _is_name_column(name: str) -> bool:
+    return name in _NAME_NAMES or name.endswith(tuple(f"_{n}" for n in _NAME_NAMES))
+
+
+def _is_plain_date(value: Any) -> bool:
+    if isinstance(value, datetime.datetime):
+        return False
+    if isinstance(value, datetime.date):
+        return True
+    if not isinstance(value, str) or _PLAIN_DATE.match(value) is None:
+        return False
+    try:
+        datetime.date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_datetime(value: Any) -> datetime.datetime:
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day)
+    if not isinstance(value, str):
+        raise ValueError(f"Not a timestamp: {value!r}")
+    text = value.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(text)
+
+
+def _temporal_type(present: list) -> Optional["pa.DataType"]:
+    """``date32`` when every value is a plain date, a timestamp type when
+    every value parses as a date-time (``tz="UTC"`` when all carry an
+    offset), else ``None``."""
+    if all(_is_plain_date(v) for v in present):
+        return pa.date32()
+    try:
+        aware = {_parse_datetime(v).tzinfo is not None for v in present}
+    except (TypeError, ValueError):
+        return None
+    if aware == {True}:
+        return pa.timestamp("us", tz="UTC")
+    if aware == {False}:
+        return pa.timestamp("us")
+    return None
+
+
+def _field_type(name: str, values: list) -> "pa.DataType":
+    present = [v for v in values if v is not None]
+    if not present:
+        # Nothing to go by yet; the first page with values widens it.
+        return pa.null()
+    if _is_name_column(name):
+        # Names repeat on every row of an entity, so they are always
+        # dictionary-encoded; any value can be stored as its text.
+        return pa.dictionary(pa.int32(), pa.string())
+    if _is_date_column(name):
+        temporal = _temporal_type(present)
+        if temporal is not None:
+            return temporal
+    if all(isinstance(v, bool) for v in present):
+        return pa.bool_()
+    if _is_id_column(name) and all(
+        (isinstance(v, int) and not isinstance(v, bool))
+        or (isinstance(v, str) and v.lstrip("-").isdigit())
+        for v in present
+    ):
+        return pa.int64()
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+        return pa.int64()
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return pa.float64()
+    if all(isinstance(v, (list, dict)) for v in present):
+        try:
+            return pa.array(present).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.string()
+    return pa.string()
+
+
+def _wider(a: "pa.DataType", b: "pa.DataType") -> "pa.DataType":
+    """Narrowest type holding values of both ``a`` and ``b``."""
+    if a == b or pa.types.is_null(b):
+        return a
+    if pa.types.is_null(a):
+        return b
+    numeric = (pa.types.is_integer, pa.types.is_floating)
+    if any(t(a) for t in numeric) and any(t(b) for t in numeric):
+        return pa.float64()
+    if pa.types.is_temporal(a) and pa.types.is_temporal(b):
+        zones = {t.tz for t in (a, b) if pa.types.is_timestamp(t)}
+        if len(zones) == 1:
+            return pa.timestamp("us", tz=zones.pop())
+    return pa.string()
+
+
+def infer_schema(data: Union[List[dict], Dict[str, list]]) -> "pa.Schema":
+    """
+    Arrow schema for a framework's rows, inferred from its first page:
+    name columns (``name``, ``label``, ``representation``, ``unit`` and
+    ``*_name`` etc.) dictionary-encoded, ``date`` / ``*_date`` columns as
+    ``date32`` when every value is a plain date (a timestamp type when they
+    carry a time), ids (``id``, ``carc_id``, ``*_id``) as ``int64`` when
+    integral, other whole numbers as ``int64`` and numbers with a fraction
+    as ``float64``, nested values as the list / struct type Arrow infers,
+    all-null columns as ``null``, and other text as strings.
+    :func:`record_batch` widens a column when a later page does not fit.
+    """
+    require_pyarrow()
+    return pa.schema([
+        pa.field(name, _field_type(name, values)) for name, values in columns(data).items()
+    ])
+
+
+def widen_schema(schema: "pa.Schema", other: "pa.Schema") -> "pa.Schema":
+    """``schema`` with each field widened to also hold ``other``'s type for
+    the same column; columns only in ``other`` are appended."""
+    fields = [
+        f.with_type(_wider(f.type, other.field(f.name).type)) if f.name in other.names else f
+        for f in schema
+    ]
+    fields += [f for f in other if f.name not in schema.names]
+    return pa.schema(fields)
+
+
+def _date(value: Any) -> Optional[datetime.date]:
+    if value is None:
+        return None
+    if not _is_plain_date(value):
+        raise ValueError(f"Not a plain date: {value!r}")
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value)
+
+
+def _timestamp(value: Any, tz: Optional[str]) -> Optional[datetime.datetime]:
+    if value is None:
+        return None
+    parsed = _parse_datetime(value)
+    if tz is None:
+        if parsed.tzinfo is not None:
+            raise ValueError(f"Time zone in a naive timestamp column: {value!r}")
+        return parsed
+    if parsed.tzinfo is None:
+        # A plain date in a UTC column is its midnight; a naive date-time
+        # is ambiguous.
+        if not _is_plain_date(value):
+            raise ValueError(f"Naive timestamp in a UTC column: {value!r}")
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def _int(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Not an integer: {value!r}")
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, int) or (isinstance(value, str) and value.lstrip("-").isdigit()):
+        return int(value)
+    raise ValueError(f"Not an integer: {value!r}")
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _array(values: list, type_: "pa.DataType") -> "pa.Array":
+    if pa.types.is_date32(type_):
+        return pa.array([_date(v) for v in values], type=type_)
+    if pa.types.is_timestamp(type_):
+        return pa.array([_timestamp(v, type_.tz) for v in values], type=type_)
+    if pa.types.is_dictionary(type_) or pa.types.is_string(type_):
+        text = pa.array([_text(v) for v in values], type=pa.string())
+        return text.dictionary_encode() if pa.types.is_dictionary(type_) else text
+    if pa.types.is_integer(type_):
+        return pa.array([_int(v) for v in values], type=type_)
+    if pa.types.is_floating(type_) and any(isinstance(v, (bool, str)) for v in values):
+        # Arrow would otherwise read "1.5" (or True) into a float column.
+        raise ValueError("Non-numeric value in a float column")
+    return pa.array(values, type=type_)
+
+
+_CONVERSION_ERRORS = (ValueError, TypeError, OverflowError)
+if pa is not None:
+    _CONVERSION_ERRORS += (pa.ArrowInvalid, pa.ArrowTypeError)
+
+
+def _fitted_array(name: str, values: list, type_: "pa.DataType") -> Tuple["pa.Array", "pa.DataType"]:
+    """Convert ``values`` to ``type_``, widening the type when they do not fit."""
+    try:
+        return _array(values, type_), type_
+    except _CONVERSION_ERRORS:
+        pass
+    wider = _wider(type_, _field_type(name, values))
+    try:
+        array = _array(values, wider)
+    except _CONVERSION_ERRORS:
+        wider = pa.string()
+        array = _array(values, wider)
+    logger.info(f"Widening column {name!r} from {type_} to {wider}")
+    return array, wider
+
+
+def record_batch(data: Union[List[dict], Dict[str, list]], schema: "pa.Schema") -> "pa.RecordBatch":
+    """Convert a page's ``data`` to a record batch of ``schema``. Columns the
+    schema lacks are dropped; columns the page lacks are null. A column
+    whose values do not fit its type is widened (integers to ``float64``,
+    dates to timestamps, anything else to string), so the batch's schema
+    can be wider than ``schema``."""
+    require_pyarrow()
+    cols = columns(data)
+    extra = set(cols) - set(schema.names)
+    if extra:
+        logger.debug(f"Dropping columns not in the schema: {sorted(extra)}")
+    rows = len(next(iter(cols.values()))) if cols else 0
+    arrays, fields = [], []
+    for field in schema:
+        array, type_ = _fitted_array(field.name, cols.get(field.name, [None] * rows), field.type)
+        arrays.append(array)
+        fields.append(field.with_type(type_))
+    return pa.record_batch(arrays, schema=pa.schema(fields, metadata=schema.metadata))
+
+
+def cast_batch(batch: "pa.RecordBatch", schema: "pa.Schema") -> "pa.RecordBatch":
+    """Convert ``batch`` to a wider ``schema`` (from :func:`widen_schema`)."""
+    if batch.schema == schema:
+        return batch
+    arrays = []
+    for field in schema:
+        if field.name not in batch.schema.names:
+            arrays.append(pa.nulls(batch.num_rows, field.type))
+        elif batch.schema.field(field.name).type == field.type:
+            arrays.append(batch.column(field.name))
+        else:
+            arrays.append(_array(batch.column(field.name).to_pylist(), field.type))
+    return pa.record_batch(arrays, schema=schema)
+
+
+def to_table(
+    data: Union[List[dict], Dict[str, list], None],
+    schema: Optional["pa.Schema"] = None,
+) -> "pa.Table":
+    """Build a ``pyarrow.Table`` straight from decoded JSON records or
+    columns, with :func:`infer_schema` unless ``schema`` is given (widened
+    where the records do not fit it)."""
+    require_pyarrow()
+    if not data:
+        return pa.table({}) if schema is None else schema.empty_table()
+    batch = record_batch(data, schema or infer_schema(data))
+    return pa.Table.from_batches([batch], schema=batch.schema)
+
+
+def tables_from_pages(pages: Iterable[Union[List[dict], Dict[str, list], None]]) -> "pa.Table":
+    """One table from the ``data`` of consecutive pages, using the schema of
+    the first page with rows for all of them, widened as later pages need."""
+    require_pyarrow()
+    schema = None
+    batches = []
+    for data in pages:
+        if not data:
+            continue
+        batch = record_batch(data, schema or infer_schema(data))
+        schema = batch.schema
+        batches.append(batch)
+    if schema is None:
+        return pa.table({})
+    return pa.Table.from_batches([cast_batch(b, schema) for b in batches], schema=schema)
+
+
+class ParquetSink:
+    """
+    Write record batches to a Parquet file, or to a hive-partitioned
+    directory (``path/<column>=<value>/part-0.parquet``) when
+    ``partition_by`` is given. One writer stays open per partition, each
+    batch is written as it arrives, and nothing is buffered beyond the
+    writers' current row groups. A batch with a wider schema (see
+    :func:`record_batch`) widens :attr:`schema`: the row groups written so
+    far are rewritten to it, since a Parquet file has a single schema.
+    Types only ever widen (``null`` to a type, ``int64`` to ``float64``,
+    ``date32`` to a timestamp, anything to string), so each column causes
+    at most a few rewrites however many batches are written; a schema
+    declared up front avoids them. Use as a context manager.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: "pa.Schema",
+        partition_by: Optional[str] = None,
+        compression: str = "snappy",
+    ):
+        require_pyarrow()
+        if partition_by is not None and partition_by not in schema.names:
+            raise ValueError(f"Cannot partition by {partition_by!r}: not in {schema.names}")
+        self.path = path
+        self.partition_by = partition_by
+        self.compression = compression
+        self.rows = 0
+        self.files: List[str] = []
+        self._writers: Dict[Optional[str], "pq.ParquetWriter"] = {}
+        # partition key -> file currently written (a temporary one after a
+        # rewrite, moved to its final path on close)
+        self._current: Dict[Optional[str], str] = {}
+        self._rewrites = 0
+        self._set_schema(schema)
+
+    def _set_schema(self, schema: "pa.Schema") -> None:
+        self.schema = schema
+        if self.partition_by is not None:
+            self._file_schema = schema.remove(schema.get_field_index(self.partition_by))
+        else:
+            self._file_schema = schema
+
+    def _final_path(self, key: Optional[str]) -> str:
+        if key is None:
+            return self.path
+        return os.path.join(self.path, f"{self.partition_by}={key}", "part-0.parquet")
+
+    def _writer(self, key: Optional[str]) -> "pq.ParquetWriter":
+        if key not in self._writers:
+            path = self._final_path(key)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._writers[key] = pq.ParquetWriter(
+                path, self._file_schema, compression=self.compression
+            )
+            self._current[key] = path
+            self.files.append(path)
+        return self._writers[key]
+
+    def _widen(self, schema: "pa.Schema") -> None:
+        """Move every open file to ``schema`` by copying its row groups into
+        a new file of the wider schema."""
+        self._set_schema(widen_schema(self.schema, schema))
+        self._rewrites += 1
+        logger.info(f"Rewriting {len(self._writers)} Parquet file(s) for a widened schema")
+        for key, writer in list(self._writers.items()):
+            writer.close()
+            old = self._current[key]
+            new = f"{self._final_path(key)}.{self._rewrites}.tmp"
+            rewritten = pq.ParquetWriter(new, self._file_schema, compression=self.compression)
+            source = pq.ParquetFile(old)
+            for batch in source.iter_batches():
+                rewritten.write_batch(cast_batch(batch, self._file_schema))
+            source.close()
+            os.remove(old)
+            self._writers[key] = rewritten
+            self._current[key] = new
+
+    def write(self, batch: "pa.RecordBatch") -> None:
+        if batch.num_rows == 0:
+            return
+        if batch.schema != self.schema:
+            wider = widen_schema(self.schema, batch.schema)
+            if wider != self.schema:
+                self._widen(wider)
+            batch = cast_batch(batch, self.schema)
+        self.rows += batch.num_rows
+        if self.partition_by is None:
+            self._writer(None).write_batch(batch)
+            return
+        column = batch.column(self.partition_by)
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(pa.string())
+        rest = batch.drop_columns([self.partition_by])
+        for value in pc.unique(column).to_pylist():
+            mask = pc.is_null(column) if value is None else pc.equal(column, pa.scalar(value, column.type))
+            key = "__HIVE_DEFAULT_PARTITION__" if value is None else str(value)
+            self._writer(key).write_batch(rest.filter(mask))
+
+    def write_all(self, batches: Iterable["pa.RecordBatch"]) -> None:
+        for batch in batches:
+            self.write(batch)
+
+    def close(self) -> None:
+        if not self._writers and self.partition_by is None:
+            # Nothing was written: still leave a valid, empty file.
+            self._writer(None)
+        for key, writer in self._writers.items():
+            writer.close()
+            if self._current[key] != self._final_path(key):
+                os.replace(self._current[key], self._final_path(key))
+        self._writers.clear()
+        self._current.clear()
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,92 @@
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Callable, Optional
+
+import pandas as pd
+
+from carbonarc.utils.decoding import JSONArrayParser
+from carbonarc.utils.pagination import aiter_paged_items
+
+
+class AsyncAPIClientMixin:
+    """
+    Swap the blocking transport helpers of :class:`BaseAPIClient` for
+    coroutines backed by an :class:`AsyncHttpRequestManager`.
+
+    Mixed in ahead of a sync sub-client, it makes every inherited method
+    return an awaitable: methods that ``return self._get(...)`` hand back
+    the coroutine directly, and methods that post-process through
+    ``self._then`` have the step chained onto it. Only methods that await
+    several dependent calls need an explicit async override.
+    """
+
+    async def _get(self, url: str, cache: Optional[str] = None, **kwargs) -> dict:
+        # See BaseAPIClient._get for ``cache``.
+        if cache is not None and self.request_manager.cache is not None:
+            key = self._cache_key(url, kwargs.get("params"))
+            body = self.request_manager.cache.get(cache, key)
+            if body is None:
+                body = (await self.request_manager.get(url, **kwargs)).content
+                self.request_manager.cache.set(cache, key, body)
+            return self.request_manager.json_loads(body)
+        return self._decode(await self.request_manager.get(url, **kwargs))
+
+    async def _post(self, url: str, **kwargs) -> dict:
+        return self._decode(await self.request_manager.post(url, **kwargs))
+
+    async def _delete(self, url: str, **kwargs) -> dict:
+        response = await self.request_manager.delete(url, **kwargs)
+        # See BaseAPIClient._delete: a 204 / empty body is an empty result.
+        if response.status_code == HTTPStatus.NO_CONTENT or not response.content:
+            return {}
+        return self._decode(response)
+
+    async def _stream(self, url: str, **kwargs):
+        return await self.request_manager.get_stream(url, **kwargs)
+
+    async def _iter_json_items(self, url: str, key: str = "data", **kwargs) -> AsyncIterator[Any]:
+        # Async generator form of BaseAPIClient._iter_json_items.
+        response = await self.request_manager.get(url, stream=True, **kwargs)
+        parser = JSONArrayParser(key)
+        try:
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        finally:
+            await response.aclose()
+
+    async def _iter_bytes(self, url: str, **kwargs) -> AsyncIterator[bytes]:
+        # Async generator form of BaseAPIClient._iter_bytes.
+        response = await self.request_manager.get(url, stream=True, **kwargs)
+        try:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+        finally:
+            await response.aclose()
+
+    def _paginate(
+        self,
+        fetch_page,
+        size: int,
+        items_key: str = "items",
+        max_workers: int = 4,
+        as_dataframe: bool = False,
+    ):
+        # An async iterator of items, or an awaitable DataFrame.
+        items = aiter_paged_items(fetch_page, size, items_key, max_workers=max_workers)
+        if as_dataframe:
+            async def collect() -> pd.DataFrame:
+                return pd.DataFrame([item async for item in items])
+
+            return collect()
+        return items
+
+    async def _resolved(self, value: Any) -> Any:
+        return value
+
+    def _then(self, result: Any, fn: Callable[[Any], Any]) -> Any:
+        async def chained():
+            return fn(await result)
+
+        return chained()
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import weakref
+from typing import Any, Callable, Optional
+
+from requests.auth import AuthBase
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from carbonarc import __version__
+from carbonarc.utils.cache import ResponseCache
+from carbonarc.utils.decoding import loads
+from carbonarc.utils.manager import log_error_body, status_error
+from carbonarc.utils.ratelimit import RateLimiter
+from carbonarc.utils.retry import IDEMPOTENT_METHODS, RetryPolicy
+from carbonarc.utils.validators import ValidatorCache
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            "The async client requires httpx. Install it with "
+            "`pip install 'carbonarc[async]'`."
+        )
+
+
+class AsyncHttpRequestManager:
+    """
+    Async counterpart of :class:`HttpRequestManager`, built on a pooled
+    ``httpx.AsyncClient``. Applies the same retry policy, rate limiter and
+    error mapping, and caps the number of requests in flight at once.
+    """
+
+    def __init__(
+        self,
+        auth_token: AuthBase,
+        user_agent: str = f"Python-APIClient/{__version__}",
+        max_concurrency: int = 64,
+        max_keepalive: Optional[int] = None,
+        keepalive_expiry: float = 30.0,
+        timeout: Optional[float] = 60.0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
+    ):
+        """
+        Initialize the AsyncHttpRequestManager.
+        :param auth_token: The authentication token to be used for requests.
+        :param user_agent: The user agent string to be used for requests.
+        :param max_concurrency: Maximum requests in flight at once; also the
+            size of the connection pool.
+        :param max_keepalive: Idle connections kept open for reuse. Defaults
+            to ``max_concurrency``.
+        :param keepalive_expiry: Seconds an idle connection is kept alive.
+        :param timeout: Per-request timeout in seconds (``None`` disables).
+        :param retry: Retry policy. Defaults to ``RetryPolicy()``.
+        :param rate_limiter: Optional client-side limiter, awaited before
+            every attempt.
+        :param json_loads: Decoder applied to response bodies. Defaults to
+            the fastest installed decoder.
+        :param cache: Optional persistent cache for metadata responses.
+        :param conditional_requests: Revalidate repeat GETs with their
+            ``ETag`` / ``Last-Modified``, as :class:`HttpRequestManager` does.
+        """
+        _require_httpx()
+        if not isinstance(auth_token, AuthBase):
+            raise ValueError("auth_token must be an instance of requests.auth.AuthBase")
+
+        self.auth_token = auth_token
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.json_loads = json_loads if json_loads is not None else loads
+        self.cache = cache
+        self.validators = ValidatorCache() if conditional_requests else None
+        self.max_concurrency = max_concurrency
+        self._logger = logging.getLogger(__name__)
+        # Created lazily so it binds to the loop the requests run on.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.client = httpx.AsyncClient(
+            auth=_AuthAdapter(auth_token),
+            headers={
+                "User-Agent": user_agent,
+                "Accept": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_keepalive or max_concurrency,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self.client.aclose()
+
+    async def post(self, url, data=None, json=None, **kwargs) -> "httpx.Response":
+        return await self._request("POST", url, data=data, json=json, **kwargs)
+
+    async def patch(self, url, data=None, json=None, **kwargs) -> "httpx.Response":
+        return await self._request("PATCH", url, data=data, json=json, **kwargs)
+
+    async def get(self, url, **kwargs) -> "httpx.Response":
+        if self.validators is None or kwargs.get("stream"):
+            return await self._request("GET", url, **kwargs)
+        key = self.validators.key(url, kwargs.get("params"))
+        conditional = self.validators.request_headers(key)
+        if not conditional:
+            response = await self._request("GET", url, **kwargs)
+        else:
+            headers = {**(kwargs.get("headers") or {}), **conditional}
+            response = await self._request("GET", url, **{**kwargs, "headers": headers})
+            if response.status_code == 304:
+                entry = self.validators.not_modified(key)
+                if entry is None:
+                    return await self._request("GET", url, **kwargs)
+                return httpx.Response(
+                    200, headers=entry.headers, content=entry.body, request=response.request
+                )
+        self.validators.store(key, response.headers, response.content)
+        return response
+
+    async def put(self, url, data=None, **kwargs) -> "httpx.Response":
+        return await self._request("PUT", url, data=data, **kwargs)
+
+    async def delete(self, url, **kwargs) -> "httpx.Response":
+        return await self._request("DELETE", url, **kwargs)
+
+    async def get_stream(self, url, **kwargs) -> "httpx.Response":
+        headers = {**(kwargs.pop("headers", None) or {}), "Accept": "application/octet-stream"}
+        return await self._request("GET", url, headers=headers, **kwargs)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        retry: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ) -> "httpx.Response":
+        # With ``stream=True`` the body of a successful response is left
+        # unread for ``aiter_bytes()``; the caller must ``aclose()`` it.
+        stream = kwargs.pop("stream", False)
+        policy = retry if retry is not None else self.retry
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._send(method, url, stream, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= policy.max_retries or not (
+                    idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                ):
+                    raise
+                delay = policy.backoff(attempt)
+                self._logger.warning(
+                    f"{method} {url} failed ({e.__class__.__name__}); "
+                    f"retry {attempt + 1}/{policy.max_retries} in {delay:.2f}s"
+                )
+            else:
+                if not policy.should_retry_response(response, attempt, idempotent):
+                    if stream and response.is_error:
+                        await response.aread()
+                    return self._raise_for_status(response)
+                delay = policy.backoff(attempt, response)
+                if self.rate_limiter is not None and response.status_code == 429:
+                    self.rate_limiter.pause(url, delay)
+                self._logger.warning(
+                    f"{method} {url} returned {response.status_code}; "
+                    f"retry {attempt + 1}/{policy.max_retries} in {delay:.2f}s"
+                )
+                if stream:
+                    await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method: str, url: str, stream: bool, **kwargs) -> "httpx.Response":
+        request = self.client.build_request(method, url, **kwargs)
+        if self.rate_limiter is None:
+            return await self.client.send(request, stream=stream)
+        release = await self.rate_limiter.aacquire(url)
+        try:
+            response = await self.client.send(request, stream=stream)
+        except BaseException:
+            release()
+            raise
+        if not stream:
+            release()
+            return response
+        # See HttpRequestManager._send: hold the slot until the body is
+        # read or the response closed. httpx closes it after the last chunk.
+        finalizer = weakref.finalize(response, release)
+        aclose = response.aclose
+
+        async def aclose_and_release() -> None:
+            try:
+                await aclose()
+            finally:
+                finalizer()
+
+        response.aclose = aclose_and_release
+        return response
+
+    def _raise_for_status(self, response: "httpx.Response") -> "httpx.Response":
+        if response.is_error:
+            error = status_error(response)
+            if error is not None:
+                raise error
+            log_error_body(self._logger, response.text)
+            response.raise_for_status()
+        return response
+
+
+if httpx is not None:
+
+    class _AuthAdapter(httpx.Auth):
+        """Apply a ``requests`` auth object (e.g. :class:`TokenAuth`) to
+        httpx requests — both only touch ``request.headers``."""
+
+        def __init__(self, auth: AuthBase):
+            self._auth = auth
+
+        def auth_flow(self, request):
+            self._auth(request)
+            yield request
@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Seconds a cached body stays fresh, looked up by namespace and then by its
+# prefix before the first dot (``ontology.entity_map`` -> ``ontology``).
+DEFAULT_TTLS: Dict[str, float] = {
+    "ontology": 24 * 3600,
+    "library": 6 * 3600,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+CREATE INDEX IF NOT EXISTS responses_namespace ON responses (namespace);
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+);
+"""
+
+
+def _default_path() -> str:
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "carbonarc", "responses.sqlite3")
+
+
+def fingerprint(payload: Any) -> str:
+    """Stable hash of a decoded JSON payload."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Persistent cache of raw response bodies for slowly-changing metadata
+    (entity/insight maps, the ontology tree, dataset listings, data
+    dictionaries), stored in a single SQLite file.
+
+    Entries are keyed by URL, query parameters and a hash of the API token,
+    so clients with different entitlements never share entries. Each entry
+    belongs to a namespace (``"ontology.entity_map"``) whose TTL comes from
+    ``ttls`` (falling back to the prefix before the first dot, then
+    ``default_ttl``). When the stored bodies exceed ``max_bytes`` the least
+    recently read entries are evicted. The file can be shared by several
+    processes; SQLite serialises the writers.
+
+    Reads don't write: the last-read time used for eviction is buffered in
+    memory and flushed in batches (on ``set``, every ``touch_batch`` hits,
+    and on ``close``), so LRU order across processes is approximate.
+
+    Version checks only happen when the caller hits a version endpoint
+    (``get_ontology_version`` / ``get_library_version_changes``); until
+    then, entries are bounded by their TTL alone. The first check against a
+    namespace with no recorded version drops whatever was cached under it,
+    since those entries can't be tied to a version.
+
+    Example:
+        >>> client = CarbonArcClient(token, cache=ResponseCache())
+        >>> client.ontology.get_ontology_version()   # invalidates on change
+        >>> client.ontology.get_entity_map()         # served from disk
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 3600.0,
+        touch_batch: int = 64,
+    ):
+        """
+        Args:
+            path: SQLite file to use. Defaults to
+                ``$XDG_CACHE_HOME/carbonarc/responses.sqlite3`` (``~/.cache``
+                when unset); ``":memory:"`` keeps the cache in-process.
+            max_bytes: Total size of cached bodies before LRU eviction.
+            ttls: Per-namespace TTLs in seconds, merged over
+                :data:`DEFAULT_TTLS`.
+            default_ttl: TTL for namespaces with no configured TTL.
+            touch_batch: Buffered read times to collect before writing them
+                back for LRU eviction.
+        """
+        self.path = path or _default_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.touch_batch = touch_batch
+        self._touched: Dict[str, float] = {}
+        self._pending_touches = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None, scope: str = "") -> str:
+        """Cache key for a GET of ``url`` with ``params`` under ``scope``."""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        return hashlib.sha256(json.dumps([scope, url, items]).encode()).hexdigest()
+
+    def ttl(self, namespace: str) -> float:
+        if namespace in self.ttls:
+            return self.ttls[namespace]
+        return self.ttls.get(namespace.split(".", 1)[0], self.default_ttl)
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Return the cached body, or ``None`` if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl(namespace):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._touched[key] = now
+            self._pending_touches += 1
+            if self._pending_touches >= self.touch_batch:
+                self._flush_touches()
+                self._conn.commit()
+            return bytes(row[0])
+
+    def _flush_touches(self) -> None:
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+        self._pending_touches = 0
+
+    def set(self, namespace: str, key: str, body: bytes) -> None:
+        """Store a body and evict least recently read entries over budget."""
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, body, len(body), now, now),
+            )
+            self._touched.pop(key, None)
+            self._flush_touches()
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every entry whose namespace starts with ``prefix`` (all
+        entries when empty)."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM responses WHERE substr(namespace, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every entry and every recorded version."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM versions")
+            self._conn.commit()
+
+    def check_version(self, name: str, prefix: str, value: Any) -> bool:
+        """
+        Record the latest ``value`` reported by a version endpoint under
+        ``name``; when it differs from the one seen before, or none was
+        recorded yet, invalidate the ``prefix`` namespaces.
+
+        Returns:
+            True if cached entries were invalidated.
+        """
+        current = fingerprint(value)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM versions WHERE name = ?", (name,)
+            ).fetchone()
+            if row is not None and row[0] == current:
+                return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO versions VALUES (?, ?)", (name, current)
+            )
+            # Without a baseline the cached entries are of unknown vintage.
+            deleted = self._conn.execute(
+                "DELETE FROM responses WHERE substr(namespace, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).rowcount
+            self._conn.commit()
+        return row is not None or deleted > 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
@@ -1,9 +1,17 @@
+import hashlib
 import logging
 from http import HTTPStatus
-from typing import Literal
+from typing import Any, Callable, Iterator, Literal, Optional
+
+import pandas as pd
 
 from carbonarc.utils.auth import TokenAuth
+from carbonarc.utils.decoding import JSONArrayStream
 from carbonarc.utils.manager import HttpRequestManager
+from carbonarc.utils.pagination import iter_paged_items
+
+# Bytes read from the socket per step when parsing a body incrementally.
+_STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class BaseAPIClient:
@@ -15,13 +23,18 @@ class BaseAPIClient:
         self, 
         token: str,
         host: str = "https://api.carbonarc.co",
-        version: str = "v2"
+        version: str = "v2",
+        request_manager: Optional[HttpRequestManager] = None,
         ):
         """
         Initialize APIClient with an authentication token and user agent.
         :param auth_token: The authentication token to be used for requests.
         :param host: The base URL of the Carbon Arc API.
         :param version: The API version to use.
+        :param request_manager: Optional shared transport. When given, the
+            client reuses its session (and connection pools) instead of
+            opening its own; ``token`` is then ignored in favour of the
+            manager's auth.
         """
         
         self.host = host
@@ -29,8 +42,12 @@ class BaseAPIClient:
         
         self._logger = logging.getLogger(__name__)
         
-        self.auth_token = TokenAuth(token)
-        self.request_manager = HttpRequestManager(auth_token=self.auth_token)
+        if request_manager is None:
+            self.auth_token = TokenAuth(token)
+            self.request_manager = HttpRequestManager(auth_token=self.auth_token)
+        else:
+            self.auth_token = request_manager.auth_token
+            self.request_manager = request_manager
 
     def _build_base_url(
         self,
@@ -41,11 +58,42 @@ class BaseAPIClient:
         
         return url
     
-    def _get(self, url: str, **kwargs) -> dict:
-        return self.request_manager.get(url, **kwargs).json()
+    def _decode(self, response) -> Any:
+        # Decode the raw bytes directly: ``response.json()`` first builds a
+        # ``str`` copy of the body and always uses the stdlib decoder.
+        return self.request_manager.json_loads(response.content)
+
+    def _get(self, url: str, cache: Optional[str] = None, **kwargs) -> dict:
+        """
+        GET and decode ``url``. ``cache`` names the response-cache namespace
+        (e.g. ``"ontology.entity_map"``) for metadata worth keeping across
+        runs; it is ignored unless the transport has a cache configured.
+        """
+        if cache is not None and self.request_manager.cache is not None:
+            key = self._cache_key(url, kwargs.get("params"))
+            body = self.request_manager.cache.get(cache, key)
+            if body is None:
+                body = self.request_manager.get(url, **kwargs).content
+                self.request_manager.cache.set(cache, key, body)
+            return self.request_manager.json_loads(body)
+        return self._decode(self.request_manager.get(url, **kwargs))
+
+    def _cache_key(self, url: str, params: Optional[dict]) -> str:
+        # Scope entries by token so differently-entitled clients sharing a
+        # cache file never see each other's responses.
+        token = getattr(self.auth_token, "auth_token", "") or ""
+        scope = hashlib.sha256(token.encode()).hexdigest()[:16]
+        return self.request_manager.cache.key(url, params, scope)
+
+    def _note_version(self, name: str, prefix: str, response: Any) -> Any:
+        """Invalidate cached ``prefix`` namespaces when a version endpoint
+        reports something new; returns ``response`` unchanged."""
+        if self.request_manager.cache is not None:
+            self.request_manager.cache.check_version(name, prefix, response)
+        return response
 
     def _post(self, url: str, **kwargs) -> dict:
-        return self.request_manager.post(url, **kwargs).json()
+        return self._decode(self.request_manager.post(url, **kwargs))
 
     def _delete(self, url: str, **kwargs) -> dict:
         response = self.request_manager.delete(url, **kwargs)
@@ -55,7 +103,58 @@ class BaseAPIClient:
         # empty result.
         if response.status_code == HTTPStatus.NO_CONTENT or not response.content:
             return {}
-        return response.json()
+        return self._decode(response)
 
     def _stream(self, url: str, **kwargs):
-        return self.request_manager.get(url, **kwargs)
\ No newline at end of file
+        return self.request_manager.get(url, **kwargs)
+
+    def _iter_json_items(self, url: str, key: str = "data", **kwargs) -> JSONArrayStream:
+        """
+        Stream a GET response and yield the items of its ``key`` array as
+        they are parsed, without holding the whole body. The connection is
+        released once iteration finishes or the iterator is closed.
+        """
+        response = self.request_manager.get(url, stream=True, **kwargs)
+        return JSONArrayStream(
+            response.iter_content(chunk_size=_STREAM_CHUNK_SIZE),
+            key=key,
+            close=response.close,
+        )
+
+    def _iter_bytes(self, url: str, **kwargs) -> Iterator[bytes]:
+        """Stream the raw body of a GET in chunks, releasing the connection
+        once iteration finishes or the iterator is closed."""
+        response = self.request_manager.get(url, stream=True, **kwargs)
+        try:
+            yield from response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+        finally:
+            response.close()
+
+    def _paginate(
+        self,
+        fetch_page: Callable[[int], dict],
+        size: int,
+        items_key: str = "items",
+        max_workers: int = 4,
+        as_dataframe: bool = False,
+    ):
+        """Iterate the items of a paginated listing (see
+        :func:`iter_paged_items`), or collect them into a DataFrame."""
+        items = iter_paged_items(fetch_page, size, items_key, max_workers=max_workers)
+        if as_dataframe:
+            return pd.DataFrame(list(items))
+        return items
+
+    def _resolved(self, value: Any) -> Any:
+        """Return an already-computed result in the transport's form: as
+        is for the sync client, as an awaitable for the async one."""
+        return value
+
+    def _then(self, result: Any, fn: Callable[[Any], Any]) -> Any:
+        """
+        Apply ``fn`` to the result of a transport call. The sync client
+        applies it immediately; the async client chains it onto the pending
+        coroutine instead, so a method written as
+        ``return self._then(self._get(url), fn)`` serves both transports.
+        """
+        return fn(result)
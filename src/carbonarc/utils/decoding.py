@@ -0,0 +1,202 @@
+import codecs
+import json
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+# ``loads`` decodes a whole JSON body (bytes or str) with the fastest decoder
+# installed: orjson, then simdjson, then the standard library.
+if orjson is not None:
+    loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+    DECODER = "orjson"
+elif simdjson is not None:
+    loads = simdjson.loads
+    DECODER = "simdjson"
+else:
+    loads = _stdlib_loads
+    DECODER = "json"
+
+# Parser states for JSONArrayParser.
+_START, _KEY, _COLON, _VALUE, _AFTER_VALUE, _ARRAY, _ITEM, _AFTER_ITEM, _DONE = range(9)
+_INCOMPLETE = object()
+_WHITESPACE = " \t\n\r"
+# Characters that can continue a JSON number.
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+# Drop consumed text from the buffer once this many characters pile up.
+_COMPACT_AT = 1 << 20
+
+
+class JSONArrayParser:
+    """
+    Push parser for a top-level JSON object holding one large array
+    member (``{"data": [...], "pages": 3, ...}``).
+
+    Feed it raw body chunks as they arrive; each call returns the array
+    items completed so far, so records can be consumed before the body has
+    finished downloading. Every other top-level member is collected into
+    :attr:`meta` as it is passed. Items are decoded with the standard
+    library's C scanner, which can resume at any offset of a partial buffer.
+    """
+
+    def __init__(self, key: str = "data"):
+        self.key = key
+        self.meta: dict = {}
+        self._buf = ""
+        self._pos = 0
+        self._state = _START
+        self._current_key: Optional[str] = None
+        self._eof = False
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the body; return the array items it completed."""
+        if self._pos >= _COMPACT_AT:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += self._text.decode(chunk)
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """Signal end of body; return any final items. Raises ``ValueError``
+        if the document was truncated."""
+        self._buf += self._text.decode(b"", final=True)
+        self._eof = True
+        items = self._parse()
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON response body")
+        return items
+
+    def _value(self) -> Any:
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            return _INCOMPLETE
+        # A number followed only by number characters up to the buffer edge
+        # (``1`` of ``1.``, ``1.5`` of ``1.5e+``) may continue in the next
+        # chunk; wait for a character that ends it to be sure.
+        if not self._eof and isinstance(value, (int, float)) and not isinstance(value, bool):
+            rest = end
+            while rest < len(self._buf) and self._buf[rest] in _NUMBER_CHARS:
+                rest += 1
+            if rest == len(self._buf):
+                return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _parse(self) -> List[Any]:
+        items = []
+        buf = self._buf
+        while True:
+            while self._pos < len(buf) and buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos >= len(buf):
+                return items
+            char = buf[self._pos]
+            state = self._state
+            if state == _START:
+                self._expect(char, "{")
+                self._state = _KEY
+            elif state == _KEY:
+                if char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                key = self._value()
+                if key is _INCOMPLETE:
+                    return items
+                self._current_key = key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._current_key == self.key and char == "[":
+                    self._pos += 1
+                    self._state = _ARRAY
+                    continue
+                value = self._value()
+                if value is _INCOMPLETE:
+                    return items
+                self.meta[self._current_key] = value
+                self._state = _AFTER_VALUE
+            elif state == _AFTER_VALUE:
+                self._expect(char, ",}")
+                self._state = _KEY if char == "," else _DONE
+            elif state == _ARRAY:
+                if char == "]":
+                    self._pos += 1
+                    self._state = _AFTER_VALUE
+                else:
+                    self._state = _ITEM
+            elif state == _ITEM:
+                item = self._value()
+                if item is _INCOMPLETE:
+                    return items
+                items.append(item)
+                self._state = _AFTER_ITEM
+            elif state == _AFTER_ITEM:
+                self._expect(char, ",]")
+                self._state = _ITEM if char == "," else _AFTER_VALUE
+            else:
+                raise ValueError(f"Unexpected data after JSON document at offset {self._pos}")
+
+    def _expect(self, char: str, allowed: str) -> None:
+        if char not in allowed:
+            raise ValueError(
+                f"Expected one of {allowed!r} at offset {self._pos}, got {char!r}"
+            )
+        self._pos += 1
+
+
+class JSONArrayStream:
+    """
+    Iterate the items of a response's array member (default ``data``) while
+    the body is still streaming in. Other top-level members are available
+    on :attr:`meta` once they have been passed — after iteration for keys
+    that follow the array.
+
+    Example:
+        >>> records = client.explorer.iter_framework_records(framework_id)
+        >>> for record in records:
+        ...     handle(record)
+        >>> records.meta.get("pages")
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        key: str = "data",
+        close: Optional[Callable[[], None]] = None,
+    ):
+        self._chunks = chunks
+        self._close = close
+        self._parser = JSONArrayParser(key)
+
+    @property
+    def meta(self) -> dict:
+        return self._parser.meta
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            for chunk in self._chunks:
+                yield from self._parser.feed(chunk)
+            yield from self._parser.close()
+        finally:
+            if self._close is not None:
+                self._close()
@@ -31,9 +31,27 @@ class ValidationError(CarbonArcException):
 
 
 class RateLimitError(CarbonArcException):
-    """Raised when API rate limit is exceeded."""
-    pass
+    """Raised when API rate limit is exceeded (HTTP 429) and retries are
+    exhausted. ``retry_after`` carries the server's ``Retry-After`` hint in
+    seconds, when one was sent."""
+
+    def __init__(self, message, status_code=None, response=None, retry_after=None):
+        self.retry_after = retry_after
+        super().__init__(message, status_code=status_code, response=response)
+
 
 class InvalidConfigurationError(CarbonArcException):
     """Raised when the configuration is invalid."""
-    pass
\ No newline at end of file
+    pass
+
+
+class PartialOrderError(CarbonArcException):
+    """Raised when a chunked order was only partly placed: some chunks
+    were bought and others failed. ``results`` holds the responses of the
+    chunks that succeeded, ``failed`` the ``(frameworks, exception)`` pairs
+    of the chunks that did not, so they can be retried on their own."""
+
+    def __init__(self, message, results=None, failed=None):
+        self.results = results or []
+        self.failed = failed or []
+        super().__init__(message)
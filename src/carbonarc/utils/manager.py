@@ -1,12 +1,27 @@
 import logging
+import time
+import weakref
 from http import HTTPStatus
+from typing import Any, Callable, Optional
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from requests.structures import CaseInsensitiveDict
 
 from carbonarc import __version__
-from carbonarc.utils.exceptions import AuthenticationError, ForbiddenError
+from carbonarc.utils.cache import ResponseCache
+from carbonarc.utils.decoding import loads
+from carbonarc.utils.exceptions import (
+    AuthenticationError,
+    CarbonArcException,
+    ForbiddenError,
+    RateLimitError,
+)
+from carbonarc.utils.ratelimit import RateLimiter
+from carbonarc.utils.retry import IDEMPOTENT_METHODS, RetryPolicy, parse_retry_after
+from carbonarc.utils.validators import ValidatorCache
 
 
 class HttpRequestManager:
@@ -16,83 +31,260 @@ class HttpRequestManager:
     """
 
     def __init__(
-        self, auth_token: AuthBase, user_agent: str = f"Python-APIClient/{__version__}"
+        self,
+        auth_token: AuthBase,
+        user_agent: str = f"Python-APIClient/{__version__}",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
     ):
         """
         Initialize the HttpRequestManager with an authentication token and user agent.
         :param auth_token: The authentication token to be used for requests.
         :param user_agent: The user agent string to be used for requests.
+        :param pool_connections: Number of per-host connection pools to keep
+            (one per distinct host, e.g. the data API and CAMS).
+        :param pool_maxsize: Maximum number of keep-alive connections held
+            per host pool. Raise this when fanning requests out over threads.
+        :param pool_block: Block when a host pool is exhausted instead of
+            opening (and then discarding) an extra connection.
+        :param keep_alive: Reuse connections between requests. When False,
+            every request asks the server to close the connection.
+        :param retry: Retry policy for transient failures (429/5xx and
+            connection errors). Defaults to ``RetryPolicy()``; pass
+            ``RetryPolicy(max_retries=0)`` to disable retries.
+        :param rate_limiter: Optional client-side limiter applied before
+            every attempt (including retries), budgeted per host.
+        :param json_loads: Decoder applied to response bodies by the API
+            clients. Defaults to the fastest installed decoder (orjson,
+            simdjson, then the standard library).
+        :param cache: Optional persistent cache for metadata responses. Only
+            calls made with a ``cache`` namespace use it.
+        :param conditional_requests: Remember ``ETag`` / ``Last-Modified``
+            validators of GET responses and revalidate repeat GETs with
+            ``If-None-Match`` / ``If-Modified-Since``; a ``304`` is answered
+            with the remembered body. Counters are on ``self.validators``.
+            Off by default; only bodies up to
+            ``ValidatorCache.max_entry_bytes`` (1 MB) are remembered, so
+            data pages are never retained.
         """
         if not isinstance(auth_token, AuthBase):
             raise ValueError("auth_token must be an instance of requests.auth.AuthBase")
 
         self.auth_token = auth_token
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.json_loads = json_loads if json_loads is not None else loads
+        self.cache = cache
+        self.validators = ValidatorCache() if conditional_requests else None
         self._logger = logging.getLogger(__name__)
         self.request_session = requests.Session()
+        # A single adapter serves every host the session talks to; urllib3
+        # keys its pools by (scheme, host, port) so the data API and CAMS
+        # each get their own warm pool on the same session.
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.request_session.mount("https://", adapter)
+        self.request_session.mount("http://", adapter)
         self.request_session.headers.update(
             {
                 "User-Agent": user_agent,
                 "Accept": "application/json",
             }
         )
+        if not keep_alive:
+            self.request_session.headers["Connection"] = "close"
+
+    def close(self) -> None:
+        """Release every pooled connection held by the session."""
+        self.request_session.close()
 
     def post(self, url, data=None, json=None, **kwargs) -> requests.Response:
-        return self._raise_for_status(
-            self.request_session.post(
-                url, auth=self.auth_token, data=data, json=json, **kwargs
-            )
-        )
+        return self._request("POST", url, data=data, json=json, **kwargs)
 
     def patch(self, url, data=None, json=None, **kwargs) -> requests.Response:
-        return self._raise_for_status(
-            self.request_session.patch(
-                url, auth=self.auth_token, data=data, json=json, **kwargs
-            )
-        )
+        return self._request("PATCH", url, data=data, json=json, **kwargs)
 
     def get(self, url, **kwargs) -> requests.Response:
-        return self._raise_for_status(
-            self.request_session.get(url, auth=self.auth_token, **kwargs)
-        )
+        if self.validators is None or kwargs.get("stream"):
+            return self._request("GET", url, **kwargs)
+        return self._conditional_get(url, **kwargs)
+
+    def _conditional_get(self, url, **kwargs) -> requests.Response:
+        key = self.validators.key(url, kwargs.get("params"))
+        conditional = self.validators.request_headers(key)
+        if not conditional:
+            response = self._request("GET", url, **kwargs)
+        else:
+            headers = {**(kwargs.get("headers") or {}), **conditional}
+            response = self._request("GET", url, **{**kwargs, "headers": headers})
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                entry = self.validators.not_modified(key)
+                if entry is None:
+                    # Evicted by another thread since the headers were built.
+                    return self._request("GET", url, **kwargs)
+                cached = requests.Response()
+                cached.status_code = HTTPStatus.OK
+                cached.reason = "OK"
+                cached.headers = CaseInsensitiveDict(entry.headers)
+                cached._content = entry.body
+                cached.url = response.url
+                cached.request = response.request
+                cached.elapsed = response.elapsed
+                return cached
+        self.validators.store(key, response.headers, response.content)
+        return response
 
     def put(self, url, data=None, **kwargs) -> requests.Response:
-        return self._raise_for_status(
-            self.request_session.put(url, auth=self.auth_token, data=data, **kwargs)
-        )
+        return self._request("PUT", url, data=data, **kwargs)
 
     def delete(self, url, **kwargs) -> requests.Response:
-        return self._raise_for_status(
-            self.request_session.delete(url, auth=self.auth_token, **kwargs)
-        )
+        return self._request("DELETE", url, **kwargs)
 
     def get_stream(self, url, **kwargs) -> requests.Response:
-        self.request_session.headers.update({"Accept": "application/octet-stream"})
-        return self._raise_for_status(
-            self.request_session.get(url, auth=self.auth_token, stream=True, **kwargs)
-        )
+        # Set the Accept header per request rather than on the session: the
+        # session is shared by every sub-client, so mutating it here would
+        # make all later JSON calls ask for octet-streams.
+        headers = {**(kwargs.pop("headers", None) or {}), "Accept": "application/octet-stream"}
+        return self._request("GET", url, stream=True, headers=headers, **kwargs)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        retry: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request, retrying transient failures per the retry policy.
+
+        :param retry: Per-call override of the manager's retry policy.
+        :param idempotent: Whether the call is safe to replay. Defaults to
+            True for GET/HEAD/OPTIONS/PUT/DELETE; pass True for read-only
+            POST endpoints (e.g. price quotes) to retry them on 5xx too.
+        """
+        policy = retry if retry is not None else self.retry
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = self._send(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not policy.should_retry_exception(e, attempt, idempotent):
+                    raise
+                delay = policy.backoff(attempt)
+                self._logger.warning(
+                    f"{method} {url} failed ({e.__class__.__name__}); "
+                    f"retry {attempt + 1}/{policy.max_retries} in {delay:.2f}s"
+                )
+            else:
+                if not policy.should_retry_response(response, attempt, idempotent):
+                    return self._raise_for_status(response)
+                delay = policy.backoff(attempt, response)
+                if (
+                    self.rate_limiter is not None
+                    and response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+                ):
+                    self.rate_limiter.pause(url, delay)
+                self._logger.warning(
+                    f"{method} {url} returned {response.status_code}; "
+                    f"retry {attempt + 1}/{policy.max_retries} in {delay:.2f}s"
+                )
+                # Hand the connection back to the pool before sleeping.
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.rate_limiter is None:
+            return self.request_session.request(method, url, auth=self.auth_token, **kwargs)
+        release = self.rate_limiter.acquire(url)
+        try:
+            response = self.request_session.request(method, url, auth=self.auth_token, **kwargs)
+        except BaseException:
+            release()
+            raise
+        if not kwargs.get("stream"):
+            release()
+            return response
+        # A streamed body is still downloading: keep the in-flight slot
+        # until the response is closed (or collected, if nobody closes it).
+        finalizer = weakref.finalize(response, release)
+        close = response.close
+
+        def close_and_release() -> None:
+            try:
+                close()
+            finally:
+                finalizer()
+
+        response.close = close_and_release
+        return response
 
     def _raise_for_status(self, response: requests.Response) -> requests.Response:
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == HTTPStatus.CONFLICT:
-                raise AuthenticationError("Conflict error")
-            if e.response.status_code == HTTPStatus.FORBIDDEN:
-                detail: str | None = None
-                try:
-                    body = e.response.json()
-                    if isinstance(body, dict):
-                        detail = body.get("detail")
-                except ValueError:
-                    pass
-                raise ForbiddenError(
-                    detail or "Forbidden",
-                    status_code=e.response.status_code,
-                    response=e.response,
-                ) from e
-            if not bool(BeautifulSoup(e.response.text, "html.parser").find()):
-                self._logger.error(e.response.text)
-            else:
-                self._logger.debug(e.response.text)
+            # Read a streamed error body now and release its connection
+            # (and rate-limit slot); the exception keeps the content.
+            response.content
+            response.close()
+            error = status_error(e.response)
+            if error is not None:
+                raise error from e
+            log_error_body(self._logger, e.response.text)
             raise
         return response
+
+
+def status_error(response) -> Optional[CarbonArcException]:
+    """
+    Map an error response to the SDK exception raised for it, or ``None``
+    when the transport's own HTTP error should propagate. Only touches
+    ``status_code`` / ``headers`` / ``json()``, so it serves both the
+    ``requests`` and the async (``httpx``) transports.
+    """
+    if response.status_code == HTTPStatus.CONFLICT:
+        return AuthenticationError("Conflict error")
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return RateLimitError(
+            "Rate limit exceeded"
+            + (f"; retry after {retry_after:.0f}s" if retry_after is not None else ""),
+            status_code=response.status_code,
+            response=response,
+            retry_after=retry_after,
+        )
+    if response.status_code == HTTPStatus.FORBIDDEN:
+        detail: str | None = None
+        try:
+            body = response.json()
+            if isinstance(body, dict):
+                detail = body.get("detail")
+        except ValueError:
+            pass
+        return ForbiddenError(
+            detail or "Forbidden",
+            status_code=response.status_code,
+            response=response,
+        )
+    return None
+
+
+def log_error_body(logger: logging.Logger, text: str) -> None:
+    """Log an error body at ERROR, or at DEBUG when it is an HTML page."""
+    if not bool(BeautifulSoup(text, "html.parser").find()):
+        logger.error(text)
+    else:
+        logger.debug(text)
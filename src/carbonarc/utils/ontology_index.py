@@ -0,0 +1,422 @@
+import json
+import os
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+_FORMAT_VERSION = 1
+_TOKEN_RE = re.compile(r"\w+")
+
+_ENTITY_ID_FIELDS = ("carc_id", "entity_id", "id")
+_ENTITY_LABEL_FIELDS = ("label", "carc_name", "entity_name", "name")
+_ENTITY_REPRESENTATION_FIELDS = ("representation", "entity_representation")
+_ENTITY_ALIAS_FIELDS = ("ticker", "symbol", "aliases")
+_INSIGHT_ID_FIELDS = ("insight_id", "carc_id", "id")
+_INSIGHT_LABEL_FIELDS = ("insight_label", "label", "name")
+_INSIGHT_REPRESENTATION_FIELDS = (
+    "entity_representations", "representations", "entity_representation",
+)
+
+_ARRAYS = (
+    "entity_ids", "entity_reps", "entity_labels", "id_order",
+    "key_text", "key_pos",
+    "vocab", "posting_offsets", "postings",
+    "insight_ids", "insight_labels", "insight_order",
+    "rep_offsets", "rep_insights",
+    "link_offsets", "link_insights",
+)
+
+
+def _normalize(text: Any) -> str:
+    """Case-fold, strip accents and collapse whitespace."""
+    text = str(text)
+    if not text.isascii():
+        text = "".join(
+            c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c)
+        )
+    return " ".join(text.casefold().split())
+
+
+def _first(record: dict, fields: Sequence[str]) -> Any:
+    for field in fields:
+        value = record.get(field)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _as_list(value: Any) -> list:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def records(payload: Any) -> List[dict]:
+    """
+    Flatten an ontology listing into a list of records. Accepts a list of
+    records, a paginated body (``items`` / ``data`` / ...), or a map of
+    ``{id: record}`` / ``{id: label}``.
+    """
+    if isinstance(payload, list):
+        return [r for r in payload if isinstance(r, dict)]
+    if not isinstance(payload, dict):
+        return []
+    for key in ("items", "data", "entities", "insights", "datasets", "changes", "results"):
+        if isinstance(payload.get(key), list):
+            return records(payload[key])
+    rows = []
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            rows.append({"id": key, **value})
+        elif isinstance(value, str):
+            rows.append({"id": key, "label": value})
+    return rows
+
+
+def _bytes_array(values: List[bytes]) -> np.ndarray:
+    # ``S`` arrays sort bytewise, which for UTF-8 is code-point order, so
+    # prefix ranges can be found with ``searchsorted``.
+    return np.array(values, dtype=f"S{max((len(v) for v in values), default=1) or 1}")
+
+
+def _csr(rows: List[int], values: List[int], n_rows: int, dtype) -> Tuple[np.ndarray, np.ndarray]:
+    """Compressed sparse rows from ``(row, value)`` edge lists: the values
+    of row ``i`` are ``flat[offsets[i]:offsets[i + 1]]``."""
+    rows = np.asarray(rows, dtype=np.int64)
+    order = np.argsort(rows, kind="stable")
+    offsets = np.searchsorted(rows[order], np.arange(n_rows + 1)).astype(np.int64)
+    return offsets, np.asarray(values, dtype=dtype)[order]
+
+
+class OntologyIndex:
+    """
+    In-memory index of ontology entities and insights for resolving names
+    and tickers to ``carc_id`` without a network round trip.
+
+    Entities are held as compact numpy arrays (ids, representation codes,
+    UTF-8 labels), with a sorted key table for exact and prefix lookups, an
+    inverted token index for word searches, and representation-level and
+    per-entity insight adjacency. :meth:`save` writes the arrays as ``.npy``
+    files that :meth:`load` memory-maps, so a saved index opens almost
+    instantly regardless of size.
+
+    Lookups return entity dicts of the form ``{"carc_id", "label",
+    "representation"}``, which can be passed straight to
+    :meth:`ExplorerAPIClient.build_framework`.
+
+    Example:
+        >>> index = client.ontology.build_index()
+        >>> index.save("ontology-index")
+        >>> index = OntologyIndex.load("ontology-index")
+        >>> index.lookup("AAPL")
+        >>> index.search("apple inc")
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], representations: List[str]):
+        for name in _ARRAYS:
+            setattr(self, name, arrays[name])
+        self.representations = representations
+        self._rep_codes = {rep: code for code, rep in enumerate(representations)}
+
+    # ---- construction --------------------------------------------------------
+
+    @classmethod
+    def from_records(
+        cls,
+        entities: Iterable[dict],
+        insights: Iterable[dict] = (),
+        links: Iterable[Tuple[Any, str, Any]] = (),
+    ) -> "OntologyIndex":
+        """
+        Build an index from entity and insight records.
+
+        Args:
+            entities: Entity records, e.g. from :meth:`get_entity_map` or
+                :meth:`iter_entities`. The id is read from ``carc_id`` /
+                ``entity_id`` / ``id``, the label from ``label`` /
+                ``carc_name`` / ``entity_name`` / ``name``, and ``ticker`` /
+                ``symbol`` / ``aliases`` are indexed as alternative names.
+            insights: Insight records. ``entity_representations`` (or
+                ``representations`` / ``entity_representation``) links an
+                insight to every entity of those representations.
+            links: Explicit ``(entity_id, representation, insight_id)``
+                edges, e.g. from :meth:`get_insights_for_entity`.
+        """
+        representations: List[str] = []
+        rep_codes: Dict[str, int] = {}
+
+        def rep_code(rep: str) -> int:
+            if rep not in rep_codes:
+                rep_codes[rep] = len(representations)
+                representations.append(rep)
+            return rep_codes[rep]
+
+        ids: List[int] = []
+        reps: List[int] = []
+        labels: List[bytes] = []
+        key_text: List[bytes] = []
+        key_pos: List[int] = []
+        token_ids: Dict[str, int] = {}
+        posting_rows: List[int] = []
+        posting_values: List[int] = []
+        positions: Dict[Tuple[int, int], int] = {}
+        for record in entities:
+            entity_id = _first(record, _ENTITY_ID_FIELDS)
+            if entity_id is None:
+                continue
+            entity_id = int(entity_id)
+            rep = rep_code(str(_first(record, _ENTITY_REPRESENTATION_FIELDS) or ""))
+            if (entity_id, rep) in positions:
+                continue
+            pos = positions[(entity_id, rep)] = len(ids)
+            label = str(_first(record, _ENTITY_LABEL_FIELDS) or "")
+            ids.append(entity_id)
+            reps.append(rep)
+            labels.append(label.encode())
+            names = [label]
+            for field in _ENTITY_ALIAS_FIELDS:
+                if field in record:
+                    names.extend(_as_list(record[field]))
+            tokens = set()
+            for name in names:
+                normalized = _normalize(name)
+                if normalized:
+                    key_text.append(normalized.encode())
+                    key_pos.append(pos)
+                    tokens.update(_TOKEN_RE.findall(normalized))
+            for token in tokens:
+                token_id = token_ids.get(token)
+                if token_id is None:
+                    token_id = token_ids[token] = len(token_ids)
+                posting_rows.append(token_id)
+                posting_values.append(pos)
+
+        insight_ids: List[int] = []
+        insight_labels: List[bytes] = []
+        rep_rows: List[int] = []
+        rep_values: List[int] = []
+        for record in insights:
+            insight_id = _first(record, _INSIGHT_ID_FIELDS)
+            if insight_id is None:
+                continue
+            insight_ids.append(int(insight_id))
+            insight_labels.append(str(_first(record, _INSIGHT_LABEL_FIELDS) or "").encode())
+            for rep in _as_list(_first(record, _INSIGHT_REPRESENTATION_FIELDS)):
+                rep_rows.append(rep_code(str(rep)))
+                rep_values.append(int(insight_id))
+
+        link_rows: List[int] = []
+        link_values: List[int] = []
+        for entity_id, rep, insight_id in links:
+            pos = positions.get((int(entity_id), rep_codes.get(str(rep), -1)))
+            if pos is not None:
+                link_rows.append(pos)
+                link_values.append(int(insight_id))
+
+        keys = _bytes_array(key_text)
+        key_order = np.argsort(keys, kind="stable")
+        vocab = _bytes_array([t.encode() for t in token_ids])
+        vocab_order = np.argsort(vocab, kind="stable")
+        # Renumber tokens by their sorted position.
+        token_rank = np.empty(len(vocab_order), dtype=np.int64)
+        token_rank[vocab_order] = np.arange(len(vocab_order))
+        entity_ids = np.array(ids, dtype=np.int64)
+        insight_id_array = np.array(insight_ids, dtype=np.int64)
+        posting_offsets, postings = _csr(
+            token_rank[np.asarray(posting_rows, dtype=np.int64)],
+            posting_values,
+            len(vocab_order),
+            np.int32,
+        )
+        rep_offsets, rep_insights = _csr(rep_rows, rep_values, len(representations), np.int64)
+        link_offsets, link_insights = _csr(link_rows, link_values, len(ids), np.int64)
+        arrays = {
+            "entity_ids": entity_ids,
+            "entity_reps": np.array(reps, dtype=np.int32),
+            "entity_labels": _bytes_array(labels),
+            "id_order": np.argsort(entity_ids, kind="stable"),
+            "key_text": keys[key_order],
+            "key_pos": np.array(key_pos, dtype=np.int32)[key_order],
+            "vocab": vocab[vocab_order],
+            "posting_offsets": posting_offsets,
+            "postings": postings,
+            "insight_ids": insight_id_array,
+            "insight_labels": _bytes_array(insight_labels),
+            "insight_order": np.argsort(insight_id_array, kind="stable"),
+            "rep_offsets": rep_offsets,
+            "rep_insights": rep_insights,
+            "link_offsets": link_offsets,
+            "link_insights": link_insights,
+        }
+        return cls(arrays, representations)
+
+    # ---- persistence ---------------------------------------------------------
+
+    def save(self, path: str) -> str:
+        """Write the index to directory ``path`` (created if needed)."""
+        os.makedirs(path, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), np.asarray(getattr(self, name)))
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({"version": _FORMAT_VERSION, "representations": self.representations}, f)
+        return path
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "OntologyIndex":
+        """
+        Open an index written by :meth:`save`.
+
+        Args:
+            path: Directory the index was saved to.
+            mmap: Memory-map the arrays (default) instead of reading them,
+                so pages are only loaded when a lookup touches them.
+        """
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        if meta.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported ontology index version: {meta.get('version')}")
+        mode = "r" if mmap else None
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode)
+            for name in _ARRAYS
+        }
+        return cls(arrays, meta["representations"])
+
+    # ---- lookups -------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def _entity(self, pos: int) -> Dict[str, Any]:
+        return {
+            "carc_id": int(self.entity_ids[pos]),
+            "label": self.entity_labels[pos].decode(),
+            "representation": self.representations[int(self.entity_reps[pos])],
+        }
+
+    def _filter(
+        self,
+        positions: Iterable[int],
+        representation: Optional[Union[str, List[str]]],
+        limit: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        wanted = None
+        if representation is not None:
+            wanted = {self._rep_codes.get(r, -1) for r in _as_list(representation)}
+        results = []
+        for pos in dict.fromkeys(int(p) for p in positions):
+            if wanted is not None and int(self.entity_reps[pos]) not in wanted:
+                continue
+            results.append(self._entity(pos))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def _key_range(self, prefix: bytes, exact: bool) -> np.ndarray:
+        lo = int(np.searchsorted(self.key_text, np.bytes_(prefix), side="left"))
+        if exact:
+            hi = int(np.searchsorted(self.key_text, np.bytes_(prefix), side="right"))
+        else:
+            # No UTF-8 sequence contains 0xff, so this bounds every key
+            # that starts with ``prefix``.
+            hi = int(np.searchsorted(self.key_text, np.bytes_(prefix + b"\xff"), side="left"))
+        return self.key_pos[lo:hi]
+
+    def lookup(
+        self, name: str, representation: Optional[Union[str, List[str]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Entities whose label or alias equals ``name`` (case- and
+        whitespace-insensitive)."""
+        normalized = _normalize(name)
+        if not normalized:
+            return []
+        return self._filter(self._key_range(normalized.encode(), exact=True), representation, None)
+
+    def prefix(
+        self,
+        text: str,
+        representation: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = 20,
+    ) -> List[Dict[str, Any]]:
+        """Entities whose label or alias starts with ``text``, in key order."""
+        normalized = _normalize(text)
+        if not normalized:
+            return []
+        return self._filter(self._key_range(normalized.encode(), exact=False), representation, limit)
+
+    def _token_positions(self, token: str, as_prefix: bool) -> np.ndarray:
+        encoded = token.encode()
+        lo = int(np.searchsorted(self.vocab, np.bytes_(encoded), side="left"))
+        if as_prefix:
+            hi = int(np.searchsorted(self.vocab, np.bytes_(encoded + b"\xff"), side="left"))
+        else:
+            hi = int(np.searchsorted(self.vocab, np.bytes_(encoded), side="right"))
+        if hi <= lo:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate([
+            self.postings[self.posting_offsets[i]:self.posting_offsets[i + 1]]
+            for i in range(lo, hi)
+        ]))
+
+    def search(
+        self,
+        text: str,
+        representation: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Entities containing every word of ``text`` in their label or an
+        alias; the last word also matches as a prefix, for type-ahead use.
+        Shorter labels rank first.
+        """
+        tokens = _TOKEN_RE.findall(_normalize(text))
+        if not tokens:
+            return []
+        matched = None
+        for i, token in enumerate(tokens):
+            found = self._token_positions(token, as_prefix=i == len(tokens) - 1)
+            matched = found if matched is None else np.intersect1d(matched, found, assume_unique=True)
+            if not len(matched):
+                return []
+        ranked = sorted(matched.tolist(), key=lambda p: (len(self.entity_labels[p]), p))
+        return self._filter(ranked, representation, limit)
+
+    def entity(self, carc_id: int, representation: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The entity with ``carc_id`` (in ``representation`` when given)."""
+        matches = self._entity_positions(carc_id, representation)
+        return self._entity(matches[0]) if matches else None
+
+    def _entity_positions(self, carc_id: int, representation: Optional[str]) -> List[int]:
+        ids = self.entity_ids
+        lo = int(np.searchsorted(ids, carc_id, side="left", sorter=self.id_order))
+        hi = int(np.searchsorted(ids, carc_id, side="right", sorter=self.id_order))
+        positions = [int(p) for p in self.id_order[lo:hi]]
+        if representation is not None:
+            code = self._rep_codes.get(representation, -1)
+            positions = [p for p in positions if int(self.entity_reps[p]) == code]
+        return positions
+
+    def insights_for(self, carc_id: int, representation: Optional[str] = None) -> np.ndarray:
+        """Ids of the insights available for an entity: those linked to its
+        representation plus any explicit per-entity links."""
+        groups = []
+        for pos in self._entity_positions(carc_id, representation):
+            rep = int(self.entity_reps[pos])
+            groups.append(self.rep_insights[self.rep_offsets[rep]:self.rep_offsets[rep + 1]])
+            groups.append(self.link_insights[self.link_offsets[pos]:self.link_offsets[pos + 1]])
+        if not groups:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(groups))
+
+    def insight(self, insight_id: int) -> Optional[Dict[str, Any]]:
+        """The insight with ``insight_id``, as ``{"insight_id", "label"}``."""
+        ids = self.insight_ids
+        i = int(np.searchsorted(ids, insight_id, sorter=self.insight_order))
+        if i >= len(ids) or ids[self.insight_order[i]] != insight_id:
+            return None
+        pos = int(self.insight_order[i])
+        return {"insight_id": int(ids[pos]), "label": self.insight_labels[pos].decode()}
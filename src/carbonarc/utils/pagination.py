@@ -0,0 +1,296 @@
+import asyncio
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_pages(
+    fetch_page: Callable[[int], T],
+    first_page: int,
+    last_page: int,
+    max_workers: int = 4,
+    prefetch: Optional[int] = None,
+    head: Iterable[T] = (),
+) -> Iterator[T]:
+    """
+    Fetch pages ``first_page..last_page`` on a thread pool and yield the
+    results in page order.
+
+    At most ``prefetch`` pages (default ``max_workers``) are requested ahead
+    of the consumer, so only that many undelivered pages are ever held in
+    memory. Nothing is requested until the iterator is first advanced; the
+    pool is shut down, cancelling the pages not yet started, once it is
+    exhausted or closed.
+
+    Args:
+        fetch_page: Callable returning the decoded page for a page number.
+        first_page: First page number to fetch (inclusive).
+        last_page: Last page number to fetch (inclusive).
+        max_workers: Number of pages fetched concurrently.
+        prefetch: Pages requested ahead of the consumer.
+        head: Results the caller already has (e.g. the first page), yielded
+            before the fetched pages. The first window is requested before
+            they are handed over, so it downloads while they are consumed.
+
+    Returns:
+        Iterator over ``head``, then ``fetch_page(n)`` for each page, in order.
+    """
+    if last_page < first_page:
+        yield from head
+        return
+    window = max(1, prefetch if prefetch is not None else max_workers)
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        pending = deque()
+        next_page = first_page
+        while next_page <= last_page and len(pending) < window:
+            pending.append(pool.submit(fetch_page, next_page))
+            next_page += 1
+        yield from head
+        del head
+        while pending:
+            result = pending.popleft().result()
+            if next_page <= last_page:
+                pending.append(pool.submit(fetch_page, next_page))
+                next_page += 1
+            yield result
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def page_count(response: dict, size: int) -> Optional[int]:
+    """Number of pages reported by a paginated response (``pages``, else
+    derived from ``total``), or ``None`` when it reports neither."""
+    if response.get("pages") is not None:
+        return int(response["pages"])
+    if response.get("total") is not None:
+        return max(1, -(-int(response["total"]) // size))
+    return None
+
+
+# Statuses with which a listing refuses a page past its end, instead of
+# returning an empty one.
+_PAST_THE_END = {400, 404, 416, 422}
+
+
+def _past_the_end(error: Exception) -> bool:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status in _PAST_THE_END
+
+
+def cancel_tasks(tasks: Iterable["asyncio.Future"]) -> None:
+    """Cancel tasks still running and retrieve the exception of those that
+    already failed, so asyncio does not report it as never retrieved."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+
+
+def iter_paged_items(
+    fetch_page: Callable[[int], dict],
+    size: int,
+    items_key: str = "items",
+    max_workers: int = 4,
+    prefetch: Optional[int] = None,
+) -> Iterator[dict]:
+    """
+    Yield every item of a paginated listing, fetching pages ahead of the
+    consumer.
+
+    The page count is read from the first page; the remaining pages are
+    requested through :func:`iter_pages` as soon as it arrives, so they
+    download while the first page's items are consumed. When the response
+    carries no ``pages`` / ``total``, pages are fetched one by one until a
+    short page. Nothing is requested until the iterator is first advanced.
+
+    Args:
+        fetch_page: Callable returning the decoded response for a page number.
+        size: Page size the callable requests.
+        items_key: Response key holding the page's items.
+        max_workers: Number of pages fetched concurrently.
+        prefetch: Pages requested ahead of the consumer.
+
+    Returns:
+        Iterator over the items, in page order.
+    """
+    first = fetch_page(1)
+    items = first.get(items_key) or []
+    pages = page_count(first, size)
+    if pages is None:
+        yield from _iter_until_short(fetch_page, size, items_key, items)
+        return
+    responses = iter_pages(
+        fetch_page, 2, pages, max_workers=max_workers, prefetch=prefetch, head=[first]
+    )
+    del first, items
+    for response in responses:
+        yield from response.get(items_key) or []
+
+
+def _iter_until_short(fetch_page, size, items_key, items):
+    page = 1
+    yield from items
+    while len(items) >= size:
+        page += 1
+        items = fetch_page(page).get(items_key) or []
+        yield from items
+
+
+def iter_page_responses(
+    fetch_page: Callable[[int], dict],
+    size: int,
+    items_key: str = "items",
+    max_workers: int = 4,
+    prefetch: Optional[int] = None,
+) -> Iterator[dict]:
+    """
+    Yield the response of every page of a paginated listing, in order,
+    fetching pages ahead of the consumer.
+
+    Like :func:`iter_paged_items`, but page by page. When the first page
+    reports no ``pages`` / ``total``, the following pages are still
+    requested ``prefetch`` at a time; the first short (or empty) page ends
+    the listing and the speculative requests beyond it are dropped, failed
+    or not. A page after a full one that is refused as out of range (400,
+    404, 416, 422) also ends it. Nothing is requested until the iterator is
+    first advanced, and its page pool is shut down once it is exhausted or
+    closed.
+
+    Args:
+        fetch_page: Callable returning the decoded response for a page number.
+        size: Page size the callable requests.
+        items_key: Response key holding the page's items.
+        max_workers: Number of pages fetched concurrently.
+        prefetch: Pages requested ahead of the consumer (default
+            ``max_workers``).
+
+    Returns:
+        Iterator over the page responses that hold items.
+    """
+    first = fetch_page(1)
+    if not first.get(items_key):
+        return
+    pages = page_count(first, size)
+    if pages is not None:
+        responses = iter_pages(
+            fetch_page, 2, pages, max_workers=max_workers, prefetch=prefetch, head=[first]
+        )
+    elif len(first[items_key]) < size:
+        responses = iter([first])
+    else:
+        window = max(1, prefetch if prefetch is not None else max_workers)
+        responses = _drain_until_short(fetch_page, max_workers, window, first, size, items_key)
+    del first
+    yield from responses
+
+
+def _drain_until_short(fetch_page, max_workers, window, first, size, items_key):
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        pending = deque(pool.submit(fetch_page, page) for page in range(2, 2 + window))
+        next_page = 2 + window
+        yield first
+        del first
+        while pending:
+            try:
+                response = pending.popleft().result()
+            except Exception as e:
+                if not _past_the_end(e):
+                    raise
+                break
+            items = response.get(items_key)
+            if not items:
+                break
+            pending.append(pool.submit(fetch_page, next_page))
+            next_page += 1
+            yield response
+            if len(items) < size:
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_paged_items(
+    fetch_page: Callable[[int], Awaitable[dict]],
+    size: int,
+    items_key: str = "items",
+    max_workers: int = 4,
+) -> AsyncIterator[dict]:
+    """Async counterpart of :func:`iter_paged_items`: up to ``max_workers``
+    pages are in flight as tasks on the running loop."""
+    first = await fetch_page(1)
+    items = first.get(items_key) or []
+    pages = page_count(first, size)
+    if pages is None:
+        page = 1
+        for item in items:
+            yield item
+        while len(items) >= size:
+            page += 1
+            items = (await fetch_page(page)).get(items_key) or []
+            for item in items:
+                yield item
+        return
+    pending = deque()
+    next_page = 2
+    try:
+        while True:
+            while next_page <= pages and len(pending) < max(1, max_workers):
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            for item in items:
+                yield item
+            if not pending:
+                break
+            items = (await pending.popleft()).get(items_key) or []
+    finally:
+        cancel_tasks(pending)
+
+
+async def aiter_page_responses(
+    fetch_page: Callable[[int], Awaitable[dict]],
+    size: int,
+    items_key: str = "items",
+    max_workers: int = 4,
+    prefetch: Optional[int] = None,
+) -> AsyncIterator[dict]:
+    """Async counterpart of :func:`iter_page_responses`: up to ``prefetch``
+    pages (default ``max_workers``) are in flight as tasks on the running
+    loop."""
+    first = await fetch_page(1)
+    if not first.get(items_key):
+        return
+    pages = page_count(first, size)
+    if pages is None and len(first[items_key]) < size:
+        pages = 1
+    window = max(1, prefetch if prefetch is not None else max_workers)
+    pending = deque()
+    next_page = 2
+    response = first
+    try:
+        while True:
+            # Queue the next pages before handing this one over, so they
+            # download while the caller works on it.
+            while (pages is None or next_page <= pages) and len(pending) < window:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            yield response
+            if (pages is None and len(response[items_key]) < size) or not pending:
+                break
+            try:
+                response = await pending.popleft()
+            except Exception as e:
+                if pages is not None or not _past_the_end(e):
+                    raise
+                break
+            if not response.get(items_key):
+                break
+    finally:
+        cancel_tasks(pending)
@@ -0,0 +1,411 @@
+import asyncio
+import os
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from carbonarc.utils.exceptions import InvalidConfigurationError
+
+# How long a caller waiting for a cross-process slot (or an async caller
+# waiting for any slot) sleeps between polls.
+_SLOT_POLL_MIN = 0.005
+_SLOT_POLL_MAX = 0.1
+
+
+def _host_of(url: str) -> str:
+    """Budget key for ``url``: its ``host[:port]`` (bare hosts pass through)."""
+    return urlsplit(url).netloc if "://" in url else url
+
+
+class _TokenBucket:
+    """
+    In-process token bucket.
+
+    ``reserve`` never blocks: it takes a token (letting the balance go
+    negative) and returns how long the caller must wait for it to mature.
+    Queuing reservations this way spaces callers out evenly at ``rate``
+    instead of letting them all retry the moment a token frees up.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate,
+                -seconds * self.rate,
+            )
+            self._updated = now
+
+
+class _FileTokenBucket:
+    """
+    Token bucket whose state lives in a small file guarded by ``flock``, so
+    every process pointing at the same ``state_dir`` draws from one budget.
+    Uses wall-clock time because monotonic clocks are per-process.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.path = path
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[list]:
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read().split()
+                now = time.time()
+                if len(raw) == 2:
+                    tokens, updated = float(raw[0]), float(raw[1])
+                else:
+                    tokens, updated = self.capacity, now
+                state = [min(self.capacity, tokens + max(0.0, now - updated) * self.rate), now]
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(f"{state[0]!r} {state[1]!r}")
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def reserve(self) -> float:
+        with self._locked_state() as state:
+            state[0] -= 1
+            return 0.0 if state[0] >= 0 else -state[0] / self.rate
+
+    def pause(self, seconds: float) -> None:
+        with self._locked_state() as state:
+            state[0] = min(state[0], -seconds * self.rate)
+
+
+class _ThreadSlots:
+    """In-flight cap shared by the threads of one process."""
+
+    def __init__(self, size: int):
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    def acquire(self):
+        self._semaphore.acquire()
+        return self._semaphore
+
+    def try_acquire(self):
+        return self._semaphore if self._semaphore.acquire(blocking=False) else None
+
+    def release(self, slot) -> None:
+        slot.release()
+
+
+class _FileSlots:
+    """
+    In-flight cap shared across processes: one lock file per slot. Holding
+    an exclusive ``flock`` on a slot file is holding the slot; the kernel
+    drops it if the process dies, so a crashed worker never leaks capacity.
+    """
+
+    def __init__(self, prefix: str, size: int):
+        self._paths = [f"{prefix}.slot{i}" for i in range(size)]
+
+    def acquire(self):
+        # flock can only wait on one file, not on "any of the slots".
+        poll = _SLOT_POLL_MIN
+        slot = self.try_acquire()
+        while slot is None:
+            time.sleep(poll)
+            poll = min(poll * 2, _SLOT_POLL_MAX)
+            slot = self.try_acquire()
+        return slot
+
+    def try_acquire(self):
+        for path in self._paths:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+            return fd
+        return None
+
+    def release(self, fd) -> None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+class _Hold:
+    """In-process "no new requests until" time, set by :meth:`RateLimiter.pause`
+    for budgets without a token bucket to drain."""
+
+    def __init__(self):
+        self._until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._until = max(self._until, time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self._until - time.monotonic())
+
+
+class _FileHold:
+    """:class:`_Hold` shared across processes through a file guarded by
+    ``flock``; uses wall-clock time like :class:`_FileTokenBucket`."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def pause(self, seconds: float) -> None:
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read().strip()
+                until = max(float(raw) if raw else 0.0, time.time() + seconds)
+                f.seek(0)
+                f.truncate()
+                f.write(repr(until))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def remaining(self) -> float:
+        try:
+            with open(self.path) as f:
+                raw = f.read().strip()
+        except FileNotFoundError:
+            return 0.0
+        return max(0.0, float(raw) - time.time()) if raw else 0.0
+
+
+class _HostBudget:
+    def __init__(self, bucket, slots, hold=None):
+        self.bucket = bucket
+        self.slots = slots
+        self.hold = hold
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter applied by :class:`HttpRequestManager` before
+    each request.
+
+    Budgets are kept per host, so the data API and CAMS (``cams_host``) are
+    throttled independently. Each budget combines a token bucket
+    (``requests_per_second`` sustained, ``burst`` peak) with an optional cap
+    on concurrent in-flight requests. A single instance is thread-safe and
+    can be shared by every client in a process; pass ``state_dir`` to share
+    the same budgets across processes through lock files (POSIX only).
+
+    Example:
+        >>> limiter = RateLimiter(
+        ...     requests_per_second=10,
+        ...     max_in_flight=8,
+        ...     per_host={"app.carbonarc.co": {"requests_per_second": 2}},
+        ... )
+        >>> client = CarbonArcClient(token="...", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        per_host: Optional[Dict[str, Dict[str, float]]] = None,
+        state_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            requests_per_second: Default sustained request rate per host.
+                ``None`` leaves the rate unlimited.
+            burst: Default bucket capacity (requests allowed back-to-back
+                after an idle period). Defaults to ``max(1, requests_per_second)``.
+            max_in_flight: Default cap on concurrent requests per host.
+                ``None`` leaves concurrency unlimited.
+            per_host: Overrides keyed by host (``"app.carbonarc.co"``) or base
+                URL (``"https://app.carbonarc.co"``); each value may set
+                ``requests_per_second``, ``burst`` and ``max_in_flight``.
+            state_dir: Directory for cross-process state. When set, all
+                processes using the same directory share each host budget.
+        """
+        if state_dir is not None:
+            if fcntl is None:
+                raise InvalidConfigurationError(
+                    "Cross-process rate limiting (state_dir) requires fcntl, "
+                    "which is not available on this platform."
+                )
+            os.makedirs(state_dir, exist_ok=True)
+        self._defaults = {
+            "requests_per_second": requests_per_second,
+            "burst": burst,
+            "max_in_flight": max_in_flight,
+        }
+        self._per_host = {_host_of(k): v for k, v in (per_host or {}).items()}
+        self._state_dir = state_dir
+        self._budgets: Dict[str, _HostBudget] = {}
+        self._lock = threading.Lock()
+
+    def _budget(self, url: str) -> _HostBudget:
+        host = _host_of(url)
+        budget = self._budgets.get(host)
+        if budget is not None:
+            return budget
+        with self._lock:
+            budget = self._budgets.get(host)
+            if budget is None:
+                budget = self._budgets[host] = self._make_budget(host)
+        return budget
+
+    def _make_budget(self, host: str) -> _HostBudget:
+        config = {**self._defaults, **self._per_host.get(host, {})}
+        rate = config.get("requests_per_second")
+        in_flight = config.get("max_in_flight")
+        prefix = None
+        if self._state_dir is not None:
+            prefix = os.path.join(self._state_dir, re.sub(r"[^A-Za-z0-9_.-]", "_", host))
+
+        bucket = None
+        if rate:
+            capacity = float(config.get("burst") or max(1.0, rate))
+            if prefix is None:
+                bucket = _TokenBucket(rate, capacity)
+            else:
+                bucket = _FileTokenBucket(f"{prefix}.bucket", rate, capacity)
+
+        slots = None
+        hold = None
+        if in_flight:
+            if prefix is None:
+                slots = _ThreadSlots(int(in_flight))
+            else:
+                slots = _FileSlots(prefix, int(in_flight))
+            if bucket is None:
+                # Without a bucket to drain, pause() holds back new slots.
+                hold = _Hold() if prefix is None else _FileHold(f"{prefix}.hold")
+        return _HostBudget(bucket, slots, hold)
+
+    @staticmethod
+    def _releaser(budget: _HostBudget, slot) -> Callable[[], None]:
+        """Release ``slot`` on the first call; later calls do nothing."""
+        held = [slot] if slot is not None else []
+
+        def release() -> None:
+            try:
+                slot = held.pop()
+            except IndexError:
+                return
+            budget.slots.release(slot)
+
+        return release
+
+    def acquire(self, url: str) -> Callable[[], None]:
+        """
+        Block until ``url``'s host budget admits a request and take an
+        in-flight slot, for requests that outlive a ``with`` block (streamed
+        responses hold theirs until closed). The token is waited for before
+        the slot is taken, so a slot is only held while a request can use it.
+
+        Returns:
+            Function releasing the slot; calling it again does nothing.
+        """
+        budget = self._budget(url)
+        if budget.bucket is not None:
+            delay = budget.bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        if budget.slots is None:
+            return self._releaser(budget, None)
+        while True:
+            if budget.hold is not None:
+                while budget.hold.remaining() > 0:
+                    time.sleep(budget.hold.remaining())
+            slot = budget.slots.acquire()
+            # A pause that began while this caller waited for the slot
+            # applies to it too.
+            if budget.hold is None or budget.hold.remaining() <= 0:
+                return self._releaser(budget, slot)
+            budget.slots.release(slot)
+
+    async def aacquire(self, url: str) -> Callable[[], None]:
+        """Async counterpart of :meth:`acquire`: waits on the event loop
+        instead of blocking the thread. Budgets are shared with sync
+        callers, so a slot is polled for rather than awaited."""
+        budget = self._budget(url)
+        if budget.bucket is not None:
+            delay = budget.bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if budget.slots is None:
+            return self._releaser(budget, None)
+        poll = _SLOT_POLL_MIN
+        while True:
+            if budget.hold is not None and budget.hold.remaining() > 0:
+                await asyncio.sleep(budget.hold.remaining())
+                continue
+            slot = budget.slots.try_acquire()
+            if slot is None:
+                await asyncio.sleep(poll)
+                poll = min(poll * 2, _SLOT_POLL_MAX)
+                continue
+            if budget.hold is None or budget.hold.remaining() <= 0:
+                return self._releaser(budget, slot)
+            budget.slots.release(slot)
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """Block until ``url``'s host budget admits a request, and hold an
+        in-flight slot for the duration of the ``with`` block."""
+        release = self.acquire(url)
+        try:
+            yield
+        finally:
+            release()
+
+    @asynccontextmanager
+    async def alimit(self, url: str) -> AsyncIterator[None]:
+        """Async counterpart of :meth:`limit`."""
+        release = await self.aacquire(url)
+        try:
+            yield
+        finally:
+            release()
+
+    def pause(self, url: str, seconds: float) -> None:
+        """Hold back every caller of ``url``'s host for ``seconds`` — used
+        when the server answers 429 so all workers back off together
+        instead of each discovering the throttle separately. Requests
+        already in flight are not affected."""
+        if seconds <= 0:
+            return
+        budget = self._budget(url)
+        if budget.bucket is not None:
+            budget.bucket.pause(seconds)
+        elif budget.hold is not None:
+            budget.hold.pause(seconds)
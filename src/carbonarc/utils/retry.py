@@ -0,0 +1,154 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Iterable, Optional
+
+import requests
+
+# Methods the HTTP spec defines as idempotent — replaying them after a
+# transient failure cannot double-apply a side effect.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+DEFAULT_RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into a number of seconds.
+
+    Args:
+        value: Header value, either delta-seconds (``"120"``) or an HTTP date.
+
+    Returns:
+        Seconds to wait (never negative), or ``None`` if absent/unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient HTTP failures.
+
+    Retries use exponential backoff with full jitter and honor the server's
+    ``Retry-After`` header. Non-idempotent requests (POST/PATCH such as
+    ``buy_frameworks`` or ``purchase_transcript``) are only replayed when
+    the server provably did not process them: a ``429`` refusal or a
+    connection that never got established. Read-only POST endpoints can opt
+    in to full retries by passing ``idempotent=True`` on the call.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+    ):
+        """
+        Args:
+            max_retries: Number of retries after the first attempt. ``0``
+                disables retrying.
+            backoff_factor: Base delay in seconds; attempt ``n`` waits up to
+                ``backoff_factor * 2 ** n``.
+            max_backoff: Upper bound for a computed backoff delay.
+            jitter: Draw the delay uniformly from ``[0, backoff]`` so many
+                clients retrying at once do not synchronize.
+            retry_statuses: HTTP status codes considered transient.
+            respect_retry_after: Wait for the server-provided
+                ``Retry-After`` when present instead of the computed backoff.
+            max_retry_after: Cap on an honored ``Retry-After`` value; a
+                longer wait is treated as exhausting the retries.
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(int(s) for s in retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, "
+            f"backoff_factor={self.backoff_factor}, max_backoff={self.max_backoff})"
+        )
+
+    def should_retry_response(
+        self, response: requests.Response, attempt: int, idempotent: bool
+    ) -> bool:
+        """Whether ``response`` (received on ``attempt``, 0-based) should be retried."""
+        if attempt >= self.max_retries:
+            return False
+        status = response.status_code
+        if status not in self.retry_statuses:
+            return False
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None and retry_after > self.max_retry_after:
+                return False
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            # A 429 is a refusal — the request was not processed, so it is
+            # safe to replay whatever the method.
+            return True
+        return idempotent
+
+    def should_retry_exception(
+        self, exc: Exception, attempt: int, idempotent: bool
+    ) -> bool:
+        """Whether a transport error raised on ``attempt`` should be retried."""
+        if attempt >= self.max_retries:
+            return False
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            # The connection was never established; nothing reached the server.
+            return True
+        if isinstance(
+            exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        ):
+            return idempotent
+        return False
+
+    def backoff(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """
+        Seconds to sleep before retry number ``attempt + 1``.
+
+        Args:
+            attempt: 0-based index of the attempt that just failed.
+            response: The failed response, if any, for ``Retry-After``.
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
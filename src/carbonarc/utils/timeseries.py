@@ -1,48 +1,116 @@
+import numpy as np
 import pandas as pd
 import datetime
 from typing import Union
 
-def timeseries_response_to_pandas(response: Union[dict, pd.DataFrame]) -> pd.DataFrame:
+_ENTITY_COLUMNS = ["entity_representation", "entity_id", "entity_name"]
+
+
+def timeseries_response_to_pandas(
+    response: Union[dict, pd.DataFrame], pivot: bool = False
+) -> pd.DataFrame:
     """
     Convert a timeseries response to a pandas DataFrame.
 
+    All series are flattened into columnar arrays in a single pass; dates
+    are parsed once per distinct value, and ``entity_representation`` /
+    ``entity_name`` are returned as categoricals.
+
     Args:
         response: The response object from the API.
+        pivot: Return one row per (entity, date) with one column per
+            insight, instead of one row per series point.
 
     Returns:
         A pandas DataFrame containing the timeseries data.
     """
-    
+
     if isinstance(response, pd.DataFrame):
         response["date"] = pd.to_datetime(response["date"]).dt.date
         return response
-    
+
     elif isinstance(response, dict):
         response_data = response.get("data", [])
         if not response_data:
             raise ValueError("Response data is empty")
-        
-        series = []
+
+        lengths = []
+        dates = []
+        values = []
         for item in response_data:
-            df = pd.DataFrame(item["series"])
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-            df["entity_representation"] = item["entity_representation"]
-            df["entity_id"] = item["entity_id"]
-            df["entity_name"] = item["entity_name"]
-            
-            df.rename(columns={"value": item["insight"]}, inplace=True)
-            
-            df = df[["entity_representation", "entity_id", "entity_name", "date", item["insight"]]]
-            series.append(df)
-        
-        df = pd.concat(series)
-        
+            series = item["series"]
+            lengths.append(len(series))
+            dates.extend([point["date"] for point in series])
+            values.extend([point["value"] for point in series])
+
+        lengths = pd.Series(lengths).to_numpy()
+        insights = _repeat_categorical([item["insight"] for item in response_data], lengths)
+        df = pd.DataFrame(
+            {
+                "entity_representation": _repeat_categorical(
+                    [item["entity_representation"] for item in response_data], lengths
+                ),
+                "entity_id": pd.Series(
+                    [item["entity_id"] for item in response_data]
+                ).to_numpy().repeat(lengths),
+                "entity_name": _repeat_categorical(
+                    [item["entity_name"] for item in response_data], lengths
+                ),
+                "date": _parse_dates(dates),
+            }
+        )
+        values = pd.Series(values)
+
+        if pivot:
+            df["insight"] = insights
+            df["value"] = values
+            wide = df.pivot_table(
+                index=_ENTITY_COLUMNS + ["date"],
+                columns="insight",
+                values="value",
+                aggfunc="first",
+                observed=True,
+                sort=False,
+            ).reset_index()
+            wide.columns.name = None
+            return wide
+
+        # One value column per insight, empty on rows of other insights —
+        # the same layout (and index) as concatenating one frame per series.
+        if len(insights.categories) == 1:
+            df[insights.categories[0]] = values
+        else:
+            for code, insight in enumerate(insights.categories):
+                df[insight] = values.where(insights.codes == code)
+        df.index = _series_index(lengths)
         return df
-        
+
     else:
         raise ValueError("Response must be a dictionary or a pandas DataFrame")
 
 
+def _repeat_categorical(per_item: list, lengths) -> pd.Categorical:
+    """Expand one value per series to one per point, as a categorical."""
+    codes, categories = pd.factorize(pd.Series(per_item, dtype=object))
+    return pd.Categorical.from_codes(codes.repeat(lengths), categories=categories)
+
+
+def _parse_dates(dates: list) -> pd.Series:
+    """Parse date strings to ``datetime.date``, once per distinct value."""
+    codes, uniques = pd.factorize(pd.Series(dates, dtype=object))
+    parsed = pd.Series(pd.to_datetime(uniques, format="mixed")).dt.date.to_numpy()
+    # ``factorize`` codes missing dates as -1, which ``take`` would read as
+    # the last distinct date.
+    return pd.Series(parsed.take(codes)).where(codes != -1, pd.NaT)
+
+
+def _series_index(lengths) -> pd.Index:
+    """Per-series positions (0..n-1 for each series), the index
+    ``pd.concat`` of one frame per series would give."""
+    starts = lengths.cumsum() - lengths
+    return pd.Index(np.arange(lengths.sum()) - starts.repeat(lengths))
+
+
 def is_valid_date(date_string: str) -> bool:
     """
     Checks if a string is a valid date in YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS format.
@@ -0,0 +1,111 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+
+class _Validated(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    headers: Dict[str, str]
+
+
+class ValidatorCache:
+    """
+    Remember the ``ETag`` / ``Last-Modified`` validators and body of recent
+    GET responses, so a repeat GET can be sent as a conditional request and
+    a ``304 Not Modified`` answered from memory.
+
+    Bounded by entry count and total body size; the least recently used
+    entries are dropped first. Bodies larger than ``max_entry_bytes`` are
+    never kept, so listings and metadata are revalidated while data pages
+    and ``fetch_all`` bodies pass straight through. ``hits`` counts
+    requests answered with 304 and served from the cache, ``misses``
+    counts cacheable responses (with a validator, within the size cap)
+    that transferred a full body.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 16 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _Validated]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params=None) -> str:
+        if not params:
+            return url
+        items = params.items() if isinstance(params, dict) else params
+        return url + "?" + "&".join(f"{k}={v}" for k, v in sorted(items, key=str) if v is not None)
+
+    def request_headers(self, key: str) -> Dict[str, str]:
+        """Conditional headers to send for ``key`` (empty if unknown)."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified(self, key: str) -> Optional[_Validated]:
+        """Return the stored entry after a 304, counting a hit."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def store(self, key: str, headers, body: bytes) -> None:
+        """Record the validators of a full response, counting a miss when
+        it is cacheable."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self._discard(key)
+            if not (etag or last_modified) or len(body) > self.max_entry_bytes:
+                return
+            self.misses += 1
+            # The body is stored decoded, so drop the transfer framing.
+            kept = {
+                k: v for k, v in headers.items()
+                if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+            }
+            self._entries[key] = _Validated(etag, last_modified, body, kept)
+            self._bytes += len(body)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,147 @@
+import io
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from carbonarc import CarbonArcClient
+
+HOST = "https://api.example.com"
+CAMS_HOST = "https://cams.example.com"
+
+Handler = Callable[["Call"], Any]
+
+
+class Call:
+    """A request received by :class:`StubAPI`."""
+
+    def __init__(self, method: str, url: str, headers, body: Optional[bytes]):
+        parts = urlsplit(url)
+        self.method = method
+        self.url = url
+        self.host = f"{parts.scheme}://{parts.netloc}"
+        self.path = parts.path
+        self.params = {k: v if len(v) > 1 else v[0] for k, v in parse_qs(parts.query).items()}
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body or b""
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class StubAPI:
+    """
+    In-process HTTP backend for client tests, serving both transports: a
+    ``requests`` adapter (:meth:`adapter`) and an ``httpx`` mock transport
+    (:meth:`transport`).
+
+    Routes map ``(method, path)`` to a handler taking the :class:`Call` and
+    returning a JSON-able body, raw ``bytes``, or ``(status, body)`` /
+    ``(status, body, headers)``. Unrouted requests answer 404.
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], Handler] = {}
+        self.calls: List[Call] = []
+        self._lock = threading.Lock()
+
+    def route(self, method: str, path: str, handler: Any) -> None:
+        self.routes[(method, path)] = handler if callable(handler) else (lambda call: handler)
+
+    def paths(self, method: Optional[str] = None) -> List[str]:
+        return [c.path for c in self.calls if method is None or c.method == method]
+
+    def handle(self, method: str, url: str, headers, body) -> Tuple[int, Dict[str, str], bytes]:
+        call = Call(method, url, headers, body)
+        with self._lock:
+            self.calls.append(call)
+        handler = self.routes.get((method, call.path))
+        if handler is None:
+            return 404, {"Content-Type": "application/json"}, b'{"detail": "not found"}'
+        result = handler(call)
+        status, response_headers = 200, {}
+        if isinstance(result, tuple):
+            status, result, *rest = result
+            response_headers = rest[0] if rest else {}
+        if isinstance(result, (bytes, bytearray)):
+            content = bytes(result)
+        else:
+            content = json.dumps(result).encode()
+            response_headers = {"Content-Type": "application/json", **response_headers}
+        return status, response_headers, content
+
+    def adapter(self) -> BaseAdapter:
+        return _StubAdapter(self)
+
+    def transport(self):
+        import httpx
+
+        def handler(request: "httpx.Request") -> "httpx.Response":
+            status, headers, content = self.handle(
+                request.method, str(request.url), request.headers, request.read()
+            )
+            return httpx.Response(status, headers=headers, content=content)
+
+        return httpx.MockTransport(handler)
+
+
+class _StubAdapter(BaseAdapter):
+    def __init__(self, api: StubAPI):
+        super().__init__()
+        self.api = api
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode()
+        elif body is not None and not isinstance(body, bytes):
+            body = b"".join(body) if not hasattr(body, "read") else body.read()
+        status, headers, content = self.api.handle(request.method, request.url, request.headers, body)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status < 400 else "Error"
+        response.headers = CaseInsensitiveDict(headers)
+        response.raw = io.BytesIO(content)
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+def mount(client, api: StubAPI):
+    """Route every request of ``client``'s shared session to ``api``."""
+    adapter = api.adapter()
+    client.request_manager.request_session.mount("https://", adapter)
+    client.request_manager.request_session.mount("http://", adapter)
+    return client
+
+
+def mount_async(client, api: StubAPI):
+    """Route every request of an :class:`AsyncCarbonArcClient` to ``api``,
+    keeping its auth and default headers."""
+    import httpx
+
+    pooled = client.request_manager.client
+    client.request_manager.client = httpx.AsyncClient(
+        transport=api.transport(), auth=pooled.auth, headers=pooled.headers
+    )
+    return client
+
+
+@pytest.fixture
+def api() -> StubAPI:
+    return StubAPI()
+
+
+@pytest.fixture
+def client(api):
+    with CarbonArcClient("token", host=HOST, cams_host=CAMS_HOST) as client:
+        yield mount(client, api)
@@ -0,0 +1,157 @@
+import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from carbonarc.utils.arrow import (  # noqa: E402
+    ParquetSink,
+    infer_schema,
+    record_batch,
+    tables_from_pages,
+    to_table,
+)
+
+
+def test_plain_dates_are_date32():
+    table = to_table([{"date": "2024-01-31"}, {"date": None}])
+    assert table.schema.field("date").type == pa.date32()
+    assert table.column("date").to_pylist() == [datetime.date(2024, 1, 31), None]
+
+
+def test_date_columns_with_times_are_timestamps():
+    table = to_table([{"date": "2024-01-01T10:00:00Z"}, {"date": "2024-01-02T11:30:00+00:00"}])
+    assert table.schema.field("date").type == pa.timestamp("us", tz="UTC")
+    assert table.column("date")[0].as_py() == datetime.datetime(
+        2024, 1, 1, 10, tzinfo=datetime.timezone.utc
+    )
+    naive = to_table([{"event_date": "2024-01-01T10:00:00"}])
+    assert naive.schema.field("event_date").type == pa.timestamp("us")
+
+
+@pytest.mark.parametrize("value", ["2024-01", "Q1 2024", "2024-02-30"])
+def test_non_iso_dates_stay_text(value):
+    table = to_table([{"date": value}, {"date": value + " "}])
+    assert pa.types.is_string(table.schema.field("date").type) or pa.types.is_dictionary(
+        table.schema.field("date").type
+    )
+    assert table.column("date").to_pylist()[0] == value
+
+
+def test_later_page_widens_instead_of_failing():
+    first = [{"carc_id": 1, "value": 1.5, "date": "2024-01-01", "label": None}]
+    later = [{"carc_id": "x", "value": "NaN", "date": "2024-01-02T10:00:00", "label": "a"}]
+    table = tables_from_pages([first, later])
+    assert table.num_rows == 2
+    assert table.column("carc_id").to_pylist() == ["1", "x"]
+    assert table.column("value").to_pylist() == ["1.5", "NaN"]
+    assert table.schema.field("date").type == pa.timestamp("us")
+    assert table.column("date").to_pylist()[1] == datetime.datetime(2024, 1, 2, 10)
+    assert table.column("label").to_pylist() == [None, "a"]
+
+
+def test_ids_never_silently_truncate():
+    schema = infer_schema([{"carc_id": 1}])
+    batch = record_batch([{"carc_id": 2.5}], schema)
+    assert batch.schema.field("carc_id").type == pa.float64()
+    assert batch.column(0).to_pylist() == [2.5]
+
+
+def test_nested_values_fall_back_to_json_text():
+    schema = infer_schema([{"tags": ["a", "b"]}])
+    batch = record_batch([{"tags": {"not": "a list"}}], schema)
+    assert batch.column(0).to_pylist() == ['{"not": "a list"}']
+
+
+def test_sink_rewrites_written_rows_when_the_schema_widens(tmp_path):
+    path = str(tmp_path / "out.parquet")
+    first = [{"id": i, "date": "2024-01-01", "value": 1.0} for i in range(3)]
+    later = [{"id": "abc", "date": "2024-01-02T10:00:00Z", "value": 2.0}]
+    with ParquetSink(path, infer_schema(first)) as sink:
+        sink.write(record_batch(first, sink.schema))
+        sink.write(record_batch(later, sink.schema))
+        sink.write(record_batch(first, sink.schema))
+    table = pq.read_table(path)
+    assert table.num_rows == 7
+    assert table.column("id").to_pylist() == ["0", "1", "2", "abc", "0", "1", "2"]
+    assert table.schema.field("date").type == pa.timestamp("us", tz="UTC")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.parquet"]
+
+
+def test_partitioned_sink_widens_every_partition(tmp_path):
+    import pyarrow.dataset as ds
+
+    first = [{"group": "a", "value": 1.0}, {"group": "b", "value": 2.0}]
+    later = [{"group": "a", "value": "n/a"}]
+    with ParquetSink(str(tmp_path), infer_schema(first), partition_by="group") as sink:
+        sink.write(record_batch(first, sink.schema))
+        sink.write(record_batch(later, sink.schema))
+    table = ds.dataset(str(tmp_path), partitioning="hive").to_table()
+    assert sorted(table.column("value").to_pylist()) == ["1.0", "2.0", "n/a"]
+
+
+def test_empty_sink_leaves_a_valid_file(tmp_path):
+    path = str(tmp_path / "empty.parquet")
+    with ParquetSink(path, infer_schema([{"value": 1.0}])):
+        pass
+    assert pq.read_table(path).num_rows == 0
+
+
+def test_name_columns_are_always_dictionary_encoded():
+    schema = infer_schema([
+        {"entity_name": f"Brand {i}", "label": str(i), "representation": "brand", "content": "x"}
+        for i in range(4)
+    ])
+    for name in ("entity_name", "label", "representation"):
+        assert schema.field(name).type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field("content").type == pa.string()
+
+
+def test_whole_numbers_stay_integers():
+    table = to_table([{"count": 3, "value": 1.5}, {"count": 4, "value": 2}])
+    assert table.schema.field("count").type == pa.int64()
+    assert table.schema.field("value").type == pa.float64()
+    widened = tables_from_pages([[{"count": 3}], [{"count": 4.5}]])
+    assert widened.schema.field("count").type == pa.float64()
+    assert widened.column("count").to_pylist() == [3.0, 4.5]
+
+
+@pytest.fixture
+def framework_pages(api):
+    pages = [
+        [{"date": "2024-01-01", "entity_name": "A", "count": 1}],
+        [{"date": "2024-01-02", "entity_name": "B", "count": 2.5}],
+    ]
+
+    def handler(call):
+        page = int(call.params["page"])
+        return {"data": pages[page - 1], "page": page, "pages": len(pages)}
+
+    api.route("GET", "/v2/framework/F1/data", handler)
+    return pages
+
+
+def test_download_to_parquet_infers_the_schema(client, framework_pages, tmp_path):
+    path = client.explorer.download_framework_to_parquet("F1", str(tmp_path / "f.parquet"))
+    table = pq.read_table(path)
+    assert table.schema.field("entity_name").type == pa.dictionary(pa.int32(), pa.string())
+    assert table.schema.field("count").type == pa.float64()
+    assert table.column("count").to_pylist() == [1.0, 2.5]
+
+
+def test_download_to_parquet_with_a_declared_schema(client, framework_pages, tmp_path, monkeypatch):
+    from carbonarc.utils import arrow
+
+    schema = pa.schema([
+        ("date", pa.date32()),
+        ("entity_name", pa.dictionary(pa.int32(), pa.string())),
+        ("count", pa.float64()),
+    ])
+    monkeypatch.setattr(arrow.ParquetSink, "_widen", lambda self, schema: pytest.fail("rewrote"))
+    path = client.explorer.download_framework_to_parquet(
+        "F1", str(tmp_path / "f.parquet"), schema=schema
+    )
+    table = pq.read_table(path)
+    assert table.schema == schema
+    assert table.column("entity_name").to_pylist() == ["A", "B"]
@@ -0,0 +1,98 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from test_framework_data import ROWS, _framework_data  # noqa: E402
+
+ENTITIES = [
+    {"entity_id": i, "entity_representation": "brand", "label": f"Brand {i}"}
+    for i in range(1, 6)
+]
+
+
+@pytest.fixture
+def framework(api):
+    api.route("GET", "/v2/framework/F1/data", _framework_data(ROWS))
+    return "F1"
+
+
+def _data_types(api):
+    return [c.params.get("data_type") for c in api.calls]
+
+
+def test_framework_table_matches_dataframe(client, api, framework):
+    table = client.explorer.get_framework_data(framework, data_type="arrow")
+    assert isinstance(table, pa.Table)
+    assert table.schema.field("date").type == pa.date32()
+    frame = client.explorer.get_framework_data(framework, data_type="dataframe")
+    assert table.num_rows == len(frame)
+    assert table.column("date").to_pylist() == frame["date"].tolist()
+    assert table.column("value").to_pylist() == frame["value"].tolist()
+    assert _data_types(api) == [None, "dataframe"]
+
+
+def test_paged_framework_table_matches_fetch_all(client, api, framework):
+    whole = client.explorer.get_framework_data(framework, data_type="arrow")
+    paged = client.explorer.get_framework_data(framework, data_type="arrow", size=4, max_workers=3)
+    assert paged.equals(whole)
+    assert set(_data_types(api)) == {None}
+
+
+def test_single_page_table(client, framework):
+    table = client.explorer.get_framework_data(
+        framework, data_type="arrow", page=2, size=5, fetch_all=False
+    )
+    assert table.column("date").to_pylist()[0] == datetime.date(2024, 1, 6)
+    assert table.num_rows == 5
+
+
+def test_streamed_tables_share_one_schema(client, api, framework):
+    tables = list(client.explorer.stream_framework_data(framework, data_type="arrow", page_size=10))
+    assert [t.num_rows for t in tables] == [10, 10, 3]
+    assert pa.concat_tables(tables).equals(client.explorer.get_framework_data(framework, data_type="arrow"))
+
+
+def test_panel_debias_table(client, api):
+    api.route("GET", "/v2/framework/F1/panel-debias", {"data": ROWS[:4]})
+    table = client.explorer.get_framework_panel_debias_data("F1", insight_id=7, data_type="arrow")
+    assert table.num_rows == 4
+    assert api.calls[0].params == {"fetch_all": "true", "insight_id": "7"}
+
+
+def test_empty_framework_is_an_empty_table(client, api):
+    api.route("GET", "/v2/framework/F2/data", {"data": [], "total": 0})
+    table = client.explorer.get_framework_data("F2", data_type="arrow")
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 0
+
+
+def test_webcontent_table(client, api):
+    records = [{"timestamp": "2024-03-01T10:00:00Z", "content": f"post {i}"} for i in range(3)]
+    api.route("GET", "/v2/webcontent/12/data", {"data": records, "query_metadata": {"total_records": 3}})
+    table = client.hub.get_webcontent_data(12, fetch_all=True, data_type="arrow")
+    assert table.column("content").to_pylist() == ["post 0", "post 1", "post 2"]
+    assert "data_type" not in api.calls[0].params
+
+
+def test_transcripts_table(client, api):
+    transcripts = [{"id": "t1", "title": "Q1", "is_purchased": True}]
+    api.route("GET", "/v2/transcripts", {"transcripts": transcripts, "total": 1, "page": 1, "size": 20})
+    table = client.transcripts.list_transcripts(data_type="arrow")
+    assert table.to_pylist() == transcripts
+
+
+def test_entities_table(client, api):
+    api.route("GET", "/v2/ontology/entities", {"entities": ENTITIES, "total": 5})
+    table = client.ontology.get_entities(data_type="arrow")
+    assert table.num_rows == 5
+    assert table.column("label").to_pylist() == [e["label"] for e in ENTITIES]
+    assert table.to_pandas()["entity_id"].tolist() == pd.Series([1, 2, 3, 4, 5]).tolist()
+
+
+def test_default_data_type_is_unchanged(client, api, framework):
+    api.route("GET", "/v2/ontology/entities", {"entities": ENTITIES, "total": 5})
+    assert client.ontology.get_entities()["entities"] == ENTITIES
+    assert client.explorer.get_framework_data(framework)["data"] == ROWS
@@ -0,0 +1,142 @@
+import asyncio
+import inspect
+
+import pandas as pd
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from carbonarc.aio import AsyncCarbonArcClient  # noqa: E402
+
+from conftest import CAMS_HOST, HOST, mount_async  # noqa: E402
+from test_block import block  # noqa: E402,F401
+from test_framework_data import ROWS, _framework_data  # noqa: E402
+
+
+def run(api, body):
+    """Run ``body(client)`` against ``api`` on a fresh async client."""
+    async def main():
+        async with AsyncCarbonArcClient("token", host=HOST, cams_host=CAMS_HOST) as client:
+            return await body(mount_async(client, api))
+
+    return asyncio.run(main())
+
+
+def test_sync_then_applies_immediately(client):
+    assert client.block._then(2, lambda n: n * 3) == 6
+    assert client.block._resolved(4) == 4
+
+
+def test_async_then_chains_onto_the_pending_call(api):
+    api.route("GET", "/v2/ontology/version", {"version": "1.2"})
+
+    async def body(client):
+        ontology = client.ontology
+        pending = ontology._then(
+            ontology._then(ontology._get(f"{HOST}/v2/ontology/version"), lambda r: r["version"]),
+            lambda version: version.split("."),
+        )
+        assert inspect.isawaitable(pending)
+        assert api.calls == []
+        resolved = ontology._resolved([1])
+        assert inspect.isawaitable(resolved)
+        return await pending, await resolved
+
+    assert run(api, body) == (["1", "2"], [1])
+    assert api.calls[0].headers["Authorization"] == "Bearer token"
+
+
+def test_async_errors_surface_when_awaited(api):
+    async def body(client):
+        pending = client.block.get_request("missing")
+        with pytest.raises(httpx.HTTPStatusError):
+            await pending
+
+    run(api, body)
+
+
+BLOCK_CALLS = {
+    "list_datasets": lambda b: b.list_datasets(),
+    "list_requests": lambda b: b.list_requests(),
+    "list_arns": lambda b: b.list_arns(),
+    "my_access": lambda b: b.my_access(),
+    "pending": lambda b: b.pending(),
+    "available": lambda b: b.available(),
+    "coming_soon": lambda b: b.coming_soon(),
+    "rejected": lambda b: b.rejected(),
+    "request_history": lambda b: b.request_history("CA0001"),
+    "request_histories": lambda b: b.request_histories(["CA0001", "CA0003"]),
+    "dataset_status": lambda b: b.dataset_status("CA0001"),
+    "dataset_status_missing": lambda b: b.dataset_status("CA9999"),
+    "dataset_status_many": lambda b: b.dataset_status_many(["CA0001", "CA0002", "CA9999"]),
+    "request_trial": lambda b: b.request_trial("CA0003", lag="7d", cut="eu", use_case="x"),
+    "register_block_arns": lambda b: b.register_block_arns(["arn:6"], "CA0003", lag="7d"),
+    "deregister_arn": lambda b: b.deregister_arn("a1"),
+}
+
+
+# The async dataset_status fetches its three listings concurrently, so it
+# also reads the ARNs of a dataset missing from the catalog.
+ASYNC_EXTRA_CALLS = {"dataset_status_missing": [("GET", "/api/v1/block/arns", {}, None)]}
+
+
+def _requests(api):
+    return sorted(
+        ((c.method, c.path, c.params, c.json() if c.body else None) for c in api.calls),
+        key=repr,
+    )
+
+
+@pytest.mark.parametrize("name", BLOCK_CALLS)
+def test_block_parity(block, api, name):  # noqa: F811
+    call = BLOCK_CALLS[name]
+    expected = call(block)
+    sync_requests = _requests(api)
+    api.calls.clear()
+
+    async def body(client):
+        return await call(client.block)
+
+    assert run(api, body) == expected
+    assert _requests(api) == sorted(sync_requests + ASYNC_EXTRA_CALLS.get(name, []), key=repr)
+
+
+@pytest.mark.parametrize("bucket", ["my_access", "pending", "available", "coming_soon", "rejected"])
+def test_block_snapshot_parity(block, api, bucket):  # noqa: F811
+    expected = getattr(block, bucket)(snapshot=block.snapshot())
+
+    async def body(client):
+        snapshot = await client.block.snapshot()
+        calls = len(api.calls)
+        result = await getattr(client.block, bucket)(snapshot=snapshot)
+        assert len(api.calls) == calls
+        history = await client.block.request_histories(snapshot=snapshot, as_dataframe=True)
+        return result, history
+
+    result, history = run(api, body)
+    assert result == expected
+    pd.testing.assert_frame_equal(history, block.request_histories(as_dataframe=True))
+
+
+def test_block_changes_discard_the_async_snapshot(block, api):  # noqa: F811
+    async def body(client):
+        first = await client.block.snapshot(max_age=60)
+        assert await client.block.snapshot(max_age=60) is first
+        await client.block.register_sample_arns(["arn:5"])
+        assert await client.block.snapshot(max_age=60) is not first
+
+    run(api, body)
+
+
+def test_explorer_parity(client, api):
+    api.route("GET", "/v2/framework/F1/data", _framework_data(ROWS))
+    expected = client.explorer.get_framework_data("F1", data_type="dataframe")
+
+    async def body(client):
+        whole = await client.explorer.get_framework_data("F1", data_type="dataframe")
+        page = await client.explorer.get_framework_data("F1", page=2, size=5, fetch_all=False)
+        return whole, page
+
+    whole, page = run(api, body)
+    pd.testing.assert_frame_equal(whole, expected)
+    assert page["data"] == ROWS[5:10]
@@ -0,0 +1,205 @@
+import pytest
+
+from carbonarc.block import BlockSnapshot
+
+BLOCK = "/api/v1/block"
+
+DATASETS = [
+    {
+        "dataset_id": "CA0001",
+        "status": "ready",
+        "lag": "T + 7 Days",
+        "cuts": [{"cut": "us", "lags": ["6m", "1y"], "request_statuses": {"6m": "APPROVED"}}],
+        "compliance_tear_sheet": {"download_url": f"{BLOCK}/datasets/CA0001/compliance-tear-sheet"},
+    },
+    {
+        "dataset_id": "CA0002",
+        "status": "ready",
+        "cuts": [{"cut": None, "lags": [], "request_statuses": {"": "PENDING"}}],
+    },
+    {"dataset_id": "CA0003", "status": "ready", "cuts": [{"cut": "eu", "lags": ["7d"]}]},
+    {"dataset_id": "CA0004", "status": "coming_soon", "cuts": []},
+    {
+        "dataset_id": "CA0005",
+        "status": "ready",
+        "cuts": [{"cut": "us", "lags": ["6m"], "request_statuses": {"6m": "DENIED"}}],
+    },
+]
+
+REQUESTS = [
+    {
+        "id": "r1", "dataset_id": "CA0001", "lag": "6m", "cut": "us", "status": "trial_active",
+        "requestor_email": "a@example.com", "created_at": "2025-01-01",
+        "approved_by_block_admin": "admin@example.com", "approved_at": "2025-01-03",
+        "trial_start_date": "2025-01-05", "internal_queue_step": "complete",
+    },
+    {
+        "id": "r2", "dataset_id": "CA0002", "lag": None, "status": "pending_block_admin",
+        "requestor_email": "b@example.com", "created_at": "2025-02-01",
+    },
+    {
+        "id": "r3", "dataset_id": "CA0005", "lag": "6m", "cut": "us", "status": "rejected",
+        "rejected_by": "legal@example.com", "rejection_source": "carbonarc_legal",
+        "rejection_message": "no", "updated_at": "2025-03-01",
+    },
+    {"id": "r4", "dataset_id": "CA0001", "lag": "1y", "cut": "us", "status": "pending"},
+]
+
+ARNS = [
+    {"id": "a1", "arn": "arn:1", "scope": "block", "dataset_id": "CA0001", "cut": "us", "lag": "6m"},
+    {"id": "a2", "arn": "arn:2", "scope": "block", "dataset_id": "CA0002", "cut": "", "lag": ""},
+    {"id": "a3", "arn": "arn:3", "scope": "sample", "dataset_id": None},
+    {"id": "a4", "arn": "arn:4", "scope": "block", "dataset_id": "CA0001", "cut": "us", "lag": "1y"},
+]
+
+
+@pytest.fixture
+def block(client, api):
+    api.route("GET", f"{BLOCK}/datasets", lambda call: {"datasets": [dict(d) for d in DATASETS]})
+    api.route("GET", f"{BLOCK}/requests", lambda call: {"items": [dict(r) for r in REQUESTS], "total": 4})
+    api.route("GET", f"{BLOCK}/arns", lambda call: {"items": [dict(a) for a in ARNS]})
+    api.route("POST", f"{BLOCK}/arns/sample", {"ok": True})
+    api.route("POST", f"{BLOCK}/arns/block", {"ok": True})
+    api.route("DELETE", f"{BLOCK}/arns/a1", {"ok": True})
+    api.route("POST", f"{BLOCK}/requests", lambda call: {"id": "r5", **call.json()})
+    return client.block
+
+
+def _ids(rows):
+    return [row["dataset_id"] for row in rows]
+
+
+def test_snapshot_fetches_each_listing_once(block, api):
+    snapshot = block.snapshot()
+    assert sorted(api.paths()) == [f"{BLOCK}/arns", f"{BLOCK}/datasets", f"{BLOCK}/requests"]
+    assert isinstance(snapshot, BlockSnapshot)
+    assert snapshot.dataset("CA0001")["compliance_tear_sheet"]["download_url"].startswith("https://")
+
+
+@pytest.mark.parametrize("bucket", ["my_access", "pending", "available", "coming_soon", "rejected"])
+def test_snapshot_buckets_match_live_calls(block, api, bucket):
+    snapshot = block.snapshot()
+    calls = len(api.calls)
+    assert _ids(getattr(block, bucket)(snapshot=snapshot)) == _ids(getattr(block, bucket)())
+    assert len(api.calls) == calls + 1
+
+
+def test_buckets(block):
+    snapshot = block.snapshot()
+    assert _ids(snapshot.my_access) == ["CA0001"]
+    assert _ids(snapshot.pending) == ["CA0002"]
+    assert _ids(snapshot.available) == ["CA0003"]
+    assert _ids(snapshot.coming_soon) == ["CA0004"]
+    assert _ids(snapshot.rejected) == ["CA0005"]
+
+
+def test_snapshot_status_matches_live_status(block, api):
+    snapshot = block.snapshot()
+    for dataset_id in ["CA0001", "CA0002", "CA0003", "CA9999"]:
+        assert block.dataset_status(dataset_id, snapshot=snapshot) == block.dataset_status(dataset_id)
+
+
+def test_dataset_status_many(block, api):
+    statuses = block.dataset_status_many(["CA0001", "CA0005", "CA9999"])
+    assert len(api.calls) == 3
+    assert statuses["CA0005"] == block.dataset_status("CA0005")
+    assert statuses["CA9999"] == {"dataset_id": "CA9999", "catalog": None, "requests": []}
+
+
+def test_max_age_reuses_the_snapshot(block, api):
+    first = block.snapshot(max_age=60)
+    assert block.snapshot(max_age=60) is first
+    assert block.snapshot() is not first
+    assert len(api.calls) == 6
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda block: block.register_sample_arns(["arn:5"]),
+        lambda block: block.register_block_arns(["arn:6"], "CA0003", lag="7d", cut="eu"),
+        lambda block: block.deregister_arn("a1"),
+        lambda block: block.request_trial("CA0003", lag="7d", cut="eu"),
+    ],
+)
+def test_changes_discard_the_reusable_snapshot(block, change):
+    first = block.snapshot(max_age=60)
+    change(block)
+    assert block.snapshot(max_age=60) is not first
+
+
+def _linear_arns(all_arns, dataset_id, cut_value, lag_value):
+    # The per-SKU scan the ARN index replaced.
+    return [
+        {k: v for k, v in a.items() if k not in {"scope", "catalog", "dataset_id", "cut", "lag"}}
+        for a in all_arns
+        if a.get("scope") == "block"
+        and str(a.get("dataset_id")) == dataset_id
+        and (a.get("cut") or None) == (cut_value or None)
+        and (a.get("lag") or None) == (lag_value or None)
+    ]
+
+
+def test_arns_attach_to_their_sku(block):
+    cuts = block.dataset_status("CA0001")["catalog"]["cuts"]
+    skus = {sku["lag_days"]: [a["id"] for a in sku["arns"]] for sku in cuts[0]["skus"]}
+    assert skus == {180: ["a1"], 365: ["a4"]}
+    assert "dataset_id" not in cuts[0]["skus"][0]["arns"][0]
+
+
+def test_empty_cut_and_lag_match_missing_ones(block):
+    skus = block.dataset_status("CA0002")["catalog"]["cuts"][0]["skus"]
+    assert skus == [{"lag_days": 0, "request_status": "PENDING", "arns": [
+        {"id": "a2", "arn": "arn:2"},
+    ]}]
+
+
+def test_indexed_join_matches_linear_scan(block):
+    arns = ARNS + [
+        {"id": f"x{i}", "arn": f"arn:x{i}", "scope": "block", "dataset_id": f"CA000{i % 6}",
+         "cut": ["us", "eu", "", None][i % 4], "lag": ["6m", "1y", "7d", None, ""][i % 5]}
+        for i in range(60)
+    ]
+    snapshot = BlockSnapshot([dict(d) for d in DATASETS], [], arns)
+    for dataset in DATASETS:
+        dataset_id = dataset["dataset_id"]
+        for raw_cut, cut in zip(dataset["cuts"], snapshot.dataset_status(dataset_id)["catalog"]["cuts"]):
+            lags = raw_cut.get("lags") or [k or None for k in raw_cut.get("request_statuses") or {}]
+            for lag, sku in zip(lags, cut["skus"]):
+                assert sku["arns"] == _linear_arns(arns, dataset_id, raw_cut.get("cut"), lag)
+
+
+def test_request_histories_match_request_history(block, api):
+    histories = block.request_histories()
+    assert api.paths() == [f"{BLOCK}/requests"]
+    assert sorted(histories) == ["CA0001", "CA0002", "CA0005"]
+    for dataset_id, timelines in histories.items():
+        assert timelines == block.request_history(dataset_id)
+    assert [t["request_id"] for t in histories["CA0001"]] == ["r1", "r4"]
+
+
+def test_request_histories_for_listed_datasets(block):
+    histories = block.request_histories(["CA0005", "CA0003"])
+    assert list(histories) == ["CA0005", "CA0003"]
+    assert histories["CA0003"] == []
+    (timeline,) = histories["CA0005"]
+    assert timeline["internal_queue_step"] == "rejected"
+    assert [e["step"] for e in timeline["events"]] == ["rejected"]
+
+
+def test_request_histories_dataframe(block):
+    frame = block.request_histories(as_dataframe=True)
+    # One row per event, and one for the request with no populated step.
+    assert list(frame["request_id"]) == ["r1", "r1", "r1", "r1", "r4", "r2", "r3"]
+    assert list(frame.loc[frame["request_id"] == "r1", "step"]) == [
+        "submitted", "block_admin_approved", "fully_approved", "trial_started",
+    ]
+    assert frame.loc[frame["request_id"] == "r4", "step"].isna().all()
+    assert frame.loc[0, "lag_days"] == 180
+
+
+def test_request_histories_from_snapshot(block, api):
+    snapshot = block.snapshot()
+    calls = len(api.calls)
+    assert block.request_histories(snapshot=snapshot) == block.request_histories()
+    assert len(api.calls) == calls + 1
@@ -0,0 +1,123 @@
+import pandas as pd
+import pytest
+
+from carbonarc.utils.exceptions import InvalidConfigurationError, PartialOrderError
+
+FILTERS = {"date_resolution": "month"}
+ENTITIES = [
+    {"entity_id": 1, "entity_representation": "brand"},
+    {"id": 2, "representation": "brand"},
+]
+
+
+def test_grid_matches_build_framework(client):
+    explorer = client.explorer
+    grid = explorer.build_frameworks(ENTITIES, [10, "11"], FILTERS, aggregate="sum")
+    expected = [
+        explorer.build_framework([{"carc_id": e, "representation": "brand"}], i, FILTERS, "sum")
+        for e in (1, 2)
+        for i in (10, 11)
+    ]
+    assert [explorer._validate_framework(f) for f in grid] == expected
+
+
+def test_grid_shares_payloads(client):
+    grid = client.explorer.build_frameworks(ENTITIES, [10, 11], FILTERS)
+    assert grid[0]["entities"] is grid[1]["entities"]
+    assert grid[0]["insight"] is grid[2]["insight"]
+    assert grid[0]["filters"] is grid[3]["filters"]
+
+
+def test_dataframe_inputs_are_deduplicated(client):
+    entities = pd.DataFrame({"carc_id": [1, 1, 2], "representation": ["brand"] * 3})
+    insights = pd.DataFrame({"insight_id": [10, 10]})
+    grid = client.explorer.build_frameworks(entities, insights, FILTERS)
+    assert [(f["entities"][0]["carc_id"], f["insight"]["insight_id"]) for f in grid] == [
+        (1, 10), (2, 10),
+    ]
+
+
+def test_group_entities_and_wildcard(client):
+    grouped = client.explorer.build_frameworks(ENTITIES, [10, 11], FILTERS, group_entities=True)
+    assert len(grouped) == 2
+    assert [e["carc_id"] for e in grouped[0]["entities"]] == [1, 2]
+
+    wildcard = client.explorer.build_frameworks("brand", 10, FILTERS)
+    assert wildcard == [{
+        "entities": {"carc_name": "*", "representation": "brand"},
+        "insight": {"insight_id": 10},
+        "filters": FILTERS,
+        "aggregate": None,
+    }]
+
+
+def test_events_are_added_to_every_framework(client):
+    events = [{"event_id": 5, "representation": "entityeventp"}]
+    grid = client.explorer.build_frameworks(ENTITIES, [10], FILTERS, events=events)
+    assert all(f["events"] == [{"event_id": "5", "representation": "entityeventp"}] for f in grid)
+
+
+@pytest.mark.parametrize("kwargs, entities", [
+    ({"aggregate": "max"}, ENTITIES),
+    ({"filters": "month"}, ENTITIES),
+    ({}, [{"carc_id": 1}]),
+    ({}, pd.DataFrame({"carc_id": [1]})),
+])
+def test_invalid_inputs(client, kwargs, entities):
+    args = {"filters": FILTERS, **kwargs}
+    with pytest.raises(InvalidConfigurationError):
+        client.explorer.build_frameworks(entities, [10], **args)
+
+
+def _buy(api, fail_when=lambda frameworks: False):
+    def handler(call):
+        frameworks = call.json()["order"]["frameworks"]
+        if fail_when(frameworks):
+            return 400, {"detail": "rejected"}
+        return {
+            "frameworks": [f["insight"]["insight_id"] for f in frameworks],
+            "price": 1.5 * len(frameworks),
+            "currency": "USD",
+        }
+
+    api.route("POST", "/v2/framework/buy", handler)
+
+
+def _order(client, count):
+    return client.explorer.build_frameworks(
+        [{"carc_id": 1, "representation": "brand"}], list(range(count)), FILTERS
+    )
+
+
+def test_unchunked_order_is_one_request(client, api):
+    _buy(api)
+    response = client.explorer.buy_frameworks(_order(client, 5))
+    assert response["frameworks"] == [0, 1, 2, 3, 4]
+    assert len(api.calls) == 1
+
+
+def test_chunked_order_merges_responses(client, api):
+    _buy(api)
+    response = client.explorer.buy_frameworks(_order(client, 7), chunk_size=3, max_workers=2)
+    assert sorted(len(c.json()["order"]["frameworks"]) for c in api.calls) == [1, 3, 3]
+    assert response == {"frameworks": list(range(7)), "price": 10.5, "currency": "USD"}
+
+
+def test_partial_order_reports_failed_chunks(client, api):
+    _buy(api, fail_when=lambda frameworks: frameworks[0]["insight"]["insight_id"] == 3)
+    with pytest.raises(PartialOrderError) as info:
+        client.explorer.buy_frameworks(_order(client, 7), chunk_size=3)
+    error = info.value
+    assert [r["frameworks"] for r in error.results] == [[0, 1, 2], [6]]
+    assert len(error.failed) == 1
+    chunk, exception = error.failed[0]
+    assert [f["insight"]["insight_id"] for f in chunk] == [3, 4, 5]
+    assert isinstance(exception, Exception)
+    assert len(api.calls) == 3
+
+
+def test_fully_failed_order_raises_the_first_error(client, api):
+    _buy(api, fail_when=lambda frameworks: True)
+    with pytest.raises(Exception) as info:
+        client.explorer.buy_frameworks(_order(client, 4), chunk_size=2)
+    assert not isinstance(info.value, PartialOrderError)
@@ -0,0 +1,77 @@
+import time
+
+from carbonarc.utils.cache import ResponseCache
+
+
+def _cache(**kwargs):
+    return ResponseCache(":memory:", **kwargs)
+
+
+def _accessed(cache, key):
+    return cache._conn.execute(
+        "SELECT accessed FROM responses WHERE key = ?", (key,)
+    ).fetchone()[0]
+
+
+def test_round_trip_and_ttl_expiry():
+    cache = _cache(ttls={"ontology": 0.05})
+    cache.set("ontology.entity_map", "k", b"body")
+    assert cache.get("ontology.entity_map", "k") == b"body"
+    time.sleep(0.1)
+    assert cache.get("ontology.entity_map", "k") is None
+
+
+def test_hits_buffer_lru_touches():
+    cache = _cache(touch_batch=3)
+    cache.set("library.datasets", "k", b"body")
+    stored = _accessed(cache, "k")
+    time.sleep(0.01)
+    for _ in range(2):
+        cache.get("library.datasets", "k")
+    assert _accessed(cache, "k") == stored
+    cache.get("library.datasets", "k")
+    assert _accessed(cache, "k") > stored
+    assert cache._touched == {}
+
+
+def test_eviction_sees_buffered_touches():
+    cache = _cache(max_bytes=10)
+    cache.set("library.a", "a", b"aaaa")
+    cache.set("library.b", "b", b"bbbb")
+    cache.get("library.a", "a")
+    cache.set("library.c", "c", b"cccc")
+    assert cache.get("library.a", "a") == b"aaaa"
+    assert cache.get("library.b", "b") is None
+    assert cache.get("library.c", "c") == b"cccc"
+
+
+def test_first_version_drops_unversioned_entries():
+    cache = _cache()
+    cache.set("ontology.entity_map", "k", b"body")
+    cache.set("library.datasets", "d", b"body")
+    assert cache.check_version("ontology", "ontology", {"version": 1}) is True
+    assert cache.get("ontology.entity_map", "k") is None
+    assert cache.get("library.datasets", "d") == b"body"
+
+
+def test_version_change_invalidates_prefix():
+    cache = _cache()
+    cache.check_version("ontology", "ontology", {"version": 1})
+    cache.set("ontology.entity_map", "k", b"body")
+    assert cache.check_version("ontology", "ontology", {"version": 1}) is False
+    assert cache.get("ontology.entity_map", "k") == b"body"
+    assert cache.check_version("ontology", "ontology", {"version": 2}) is True
+    assert cache.get("ontology.entity_map", "k") is None
+
+
+def test_close_flushes_touches(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path)
+    cache.set("library.datasets", "k", b"body")
+    stored = _accessed(cache, "k")
+    time.sleep(0.01)
+    cache.get("library.datasets", "k")
+    cache.close()
+    reopened = ResponseCache(path)
+    assert _accessed(reopened, "k") > stored
+    reopened.close()
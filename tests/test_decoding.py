@@ -0,0 +1,111 @@
+import json
+import random
+
+import pytest
+
+from carbonarc.utils.decoding import JSONArrayParser, JSONArrayStream
+
+DOCUMENT = {
+    "total": 1234,
+    "pages": 13,
+    "ratio": -1.5e-7,
+    "data": [
+        1.5,
+        -0.25,
+        12345678901234567890,
+        3e10,
+        -2.5E+3,
+        0,
+        True,
+        None,
+        "text with \"quotes\", commas, ] and }",
+        "unicode: caf\u00e9 \u2603 \U0001f600",
+        {"carc_id": 42, "value": 10.75, "nested": {"list": [1, 2.0, [3]], "flag": False}},
+        [],
+        {},
+    ],
+    "query_metadata": {"total_records": 13, "page": 1},
+    "after": 7.25,
+}
+
+
+def _parse(body: bytes, sizes):
+    parser = JSONArrayParser("data")
+    items, start = [], 0
+    for size in sizes:
+        items += parser.feed(body[start:start + size])
+        start += size
+    items += parser.feed(body[start:])
+    items += parser.close()
+    return items, parser.meta
+
+
+def _expected(document):
+    meta = {k: v for k, v in document.items() if k != "data"}
+    return document["data"], meta
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_one_byte_at_a_time(indent):
+    body = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode()
+    assert _parse(body, [1] * len(body)) == _expected(DOCUMENT)
+
+
+def test_number_split_across_chunks():
+    parser = JSONArrayParser("data")
+    assert parser.feed(b'{"data":[1.') == []
+    assert parser.feed(b"5, 2") == [1.5]
+    assert parser.feed(b"e") == []
+    assert parser.feed(b"3]") == [2e3]
+    assert parser.feed(b', "total": 1') == []
+    assert parser.feed(b"0}") == []
+    assert parser.close() == []
+    assert parser.meta == {"total": 10}
+
+
+def test_number_at_end_of_body():
+    parser = JSONArrayParser("data")
+    parser.feed(b'{"data": [], "pages": 3')
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_chunking(seed):
+    rng = random.Random(seed)
+    document = {
+        "data": [
+            {
+                "id": rng.randrange(10 ** rng.randrange(1, 15)),
+                "value": rng.uniform(-1e6, 1e6),
+                "small": rng.uniform(-1, 1) * 10 ** rng.randrange(-12, 0),
+                "name": "".join(rng.choice("abc \u00e9\u2603\U0001f600\"\\") for _ in range(rng.randrange(6))),
+            }
+            for _ in range(rng.randrange(0, 30))
+        ],
+        "total": rng.randrange(1000),
+    }
+    body = json.dumps(document, ensure_ascii=rng.random() < 0.5).encode()
+    sizes = []
+    while sum(sizes) < len(body):
+        sizes.append(rng.randrange(1, 12))
+    assert _parse(body, sizes) == _expected(document)
+
+
+def test_truncated_body_raises():
+    body = json.dumps(DOCUMENT).encode()
+    parser = JSONArrayParser("data")
+    parser.feed(body[:-5])
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_stream_meta_and_close():
+    closed = []
+    body = json.dumps(DOCUMENT).encode()
+    stream = JSONArrayStream(
+        (body[i:i + 3] for i in range(0, len(body), 3)), close=lambda: closed.append(True)
+    )
+    assert list(stream) == DOCUMENT["data"]
+    assert stream.meta["after"] == 7.25
+    assert closed == [True]
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+ROWS = [
+    {"date": f"2024-01-{day:02d}", "entity_id": day % 3, "value": day * 1.5}
+    for day in range(1, 24)
+]
+
+
+def _framework_data(rows):
+    def handler(call):
+        if call.params.get("fetch_all") == "true":
+            return {"data": rows, "total": len(rows)}
+        page, size = int(call.params["page"]), int(call.params["size"])
+        return {
+            "data": rows[(page - 1) * size:page * size],
+            "page": page,
+            "size": size,
+            "pages": max(1, -(-len(rows) // size)),
+            "total": len(rows),
+        }
+
+    return handler
+
+
+def _pages_requested(api):
+    return sorted(int(c.params["page"]) for c in api.calls if "page" in c.params)
+
+
+@pytest.fixture
+def framework(api):
+    api.route("GET", "/v2/framework/F1/data", _framework_data(ROWS))
+    return "F1"
+
+
+def test_paged_download_matches_fetch_all(client, api, framework):
+    whole = client.explorer.get_framework_data(framework)
+    paged = client.explorer.get_framework_data(framework, size=5, max_workers=3)
+    assert paged["data"] == whole["data"]
+    assert paged["total"] == whole["total"]
+    assert "page" not in paged and "size" not in paged
+    assert _pages_requested(api) == [1, 2, 3, 4, 5]
+
+
+def test_paged_dataframe_matches_fetch_all(client, framework):
+    whole = client.explorer.get_framework_data(framework, data_type="dataframe")
+    paged = client.explorer.get_framework_data(
+        framework, data_type="dataframe", size=4, max_workers=4
+    )
+    pd.testing.assert_frame_equal(paged, whole)
+
+
+def test_paged_single_page(client, api):
+    api.route("GET", "/v2/framework/F2/data", _framework_data(ROWS[:3]))
+    assert client.explorer.get_framework_data("F2", size=10, max_workers=2)["data"] == ROWS[:3]
+    assert _pages_requested(api) == [1]
+
+
+def test_single_page_request(client, api, framework):
+    page = client.explorer.get_framework_data(framework, page=2, size=5, fetch_all=False)
+    assert page["data"] == ROWS[5:10]
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_stream_yields_each_page_in_order(client, api, framework, prefetch):
+    pages = list(client.explorer.stream_framework_data(framework, page_size=5, prefetch=prefetch))
+    assert [page["data"] for page in pages] == [ROWS[i:i + 5] for i in range(0, 23, 5)]
+    assert _pages_requested(api) == [1, 2, 3, 4, 5]
+
+
+def test_stream_dataframes(client, framework):
+    frames = list(client.explorer.stream_framework_data(framework, data_type="dataframe", page_size=10))
+    assert [len(f) for f in frames] == [10, 10, 3]
+    assert pd.concat(frames, ignore_index=True)["value"].tolist() == [r["value"] for r in ROWS]
+
+
+def test_stream_without_prefetch_fetches_on_demand(client, api, framework):
+    stream = client.explorer.stream_framework_data(framework, page_size=5, prefetch=0)
+    assert api.calls == []
+    next(stream)
+    assert _pages_requested(api) == [1]
+    next(stream)
+    assert _pages_requested(api) == [1, 2]
+    stream.close()
+
+
+def test_stream_of_an_empty_framework(client, api):
+    api.route("GET", "/v2/framework/F0/data", _framework_data([]))
+    assert list(client.explorer.stream_framework_data("F0")) == []
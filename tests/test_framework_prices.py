@@ -0,0 +1,50 @@
+import pytest
+
+from carbonarc.explorer import ExplorerAPIClient
+from carbonarc.utils.exceptions import ForbiddenError, RateLimitError
+
+
+@pytest.fixture
+def explorer():
+    return ExplorerAPIClient(token="t")
+
+
+def _framework(explorer, insight):
+    return explorer.build_framework(
+        [{"carc_id": 1, "representation": "brand"}], insight, {"date_resolution": "month"}
+    )
+
+
+def test_rejected_quotes_fill_the_error_column(explorer, monkeypatch):
+    def post(url, json, **kwargs):
+        insight = json["framework"]["insight"]["insight_id"]
+        if insight == 2:
+            raise ForbiddenError("Forbidden", status_code=403)
+        if insight == 3:
+            raise RateLimitError("Rate limit exceeded", status_code=429)
+        return {"price": 10.0 * insight}
+
+    monkeypatch.setattr(explorer, "_post", post)
+    frameworks = [_framework(explorer, i) for i in (1, 2, 3, 1)]
+    prices = explorer.check_framework_prices(frameworks)
+    assert prices["price"].tolist()[0] == 10.0
+    assert prices["price"].tolist()[3] == 10.0
+    assert prices["error"].tolist()[1] == "Forbidden"
+    assert prices["error"].tolist()[2] == "Rate limit exceeded"
+
+
+def test_failed_quotes_are_not_cached(explorer, monkeypatch):
+    calls = []
+
+    def post(url, json, **kwargs):
+        calls.append(json)
+        if len(calls) == 1:
+            raise RateLimitError("Rate limit exceeded", status_code=429)
+        return {"price": 5.0}
+
+    monkeypatch.setattr(explorer, "_post", post)
+    framework = _framework(explorer, 1)
+    assert explorer.check_framework_prices([framework])["price"].isna().all()
+    assert explorer.check_framework_prices([framework])["price"].tolist() == [5.0]
+    assert explorer.check_framework_prices([framework])["price"].tolist() == [5.0]
+    assert len(calls) == 2
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+ENTITIES = [
+    {"carc_id": i, "label": f"Entity {i:03d}", "entity_representation": "brand"}
+    for i in range(1, 231)
+]
+INSIGHTS = [{"insight_id": i, "insight_label": f"Insight {i}"} for i in range(1, 43)]
+
+
+def _listing(rows, with_total=True):
+    def handler(call):
+        page, size = int(call.params["page"]), int(call.params["size"])
+        response = {"items": rows[(page - 1) * size:page * size], "page": page, "size": size}
+        if with_total:
+            response["total"] = len(rows)
+        return response
+
+    return handler
+
+
+def _pages(api, path):
+    return sorted(int(c.params["page"]) for c in api.calls if c.path == path)
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+def test_iter_entities_yields_every_page_in_order(client, api, with_total):
+    api.route("GET", "/v2/ontology/entities", _listing(ENTITIES, with_total))
+    assert list(client.ontology.iter_entities(size=50, max_workers=3)) == ENTITIES
+    assert _pages(api, "/v2/ontology/entities") == [1, 2, 3, 4, 5]
+
+
+def test_iter_entities_passes_the_filters_on_every_page(client, api):
+    api.route("GET", "/v2/ontology/entities", _listing(ENTITIES))
+    list(client.ontology.iter_entities(representation=["brand"], search="shoe", size=100))
+    assert len(api.calls) == 3
+    for call in api.calls:
+        assert call.params["entity_representation"] == "brand"
+        assert call.params["search"] == "shoe"
+        assert call.params["size"] == "100"
+
+
+def test_iter_insights_as_dataframe(client, api):
+    api.route("GET", "/v2/ontology/insights", _listing(INSIGHTS))
+    frame = client.ontology.iter_insights(size=10, as_dataframe=True)
+    assert isinstance(frame, pd.DataFrame)
+    assert frame["insight_id"].tolist() == list(range(1, 43))
+
+
+def test_iterators_request_nothing_until_consumed(client, api):
+    api.route("GET", "/v2/ontology/entities", _listing(ENTITIES))
+    entities = client.ontology.iter_entities(size=50)
+    assert api.calls == []
+    assert next(entities) == ENTITIES[0]
+    entities.close()
+
+
+def test_empty_listing(client, api):
+    api.route("GET", "/v2/ontology/entities", _listing([]))
+    assert list(client.ontology.iter_entities()) == []
@@ -0,0 +1,110 @@
+import pytest
+
+from carbonarc.utils.ontology_index import OntologyIndex, records
+
+ENTITIES = [
+    {"carc_id": 1, "label": "Apple Inc.", "representation": "company", "ticker": "AAPL"},
+    {"carc_id": 1, "label": "Apple", "representation": "brand"},
+    {"carc_id": 2, "label": "Applebee's Grill", "representation": "brand"},
+    {"carc_id": 3, "label": "Nestlé", "representation": "company", "aliases": ["Nestle SA"]},
+    {"entity_id": 4, "entity_name": "Pineapple Express", "entity_representation": "brand"},
+    {"id": 5, "name": "Apple  Inc", "representation": "ticker"},
+    {"label": "no id"},
+]
+INSIGHTS = [
+    {"insight_id": 10, "insight_label": "Card spend", "entity_representations": ["brand", "company"]},
+    {"insight_id": 11, "insight_label": "Foot traffic", "entity_representations": "brand"},
+    {"insight_id": 12, "insight_label": "Share price"},
+]
+
+
+@pytest.fixture
+def index():
+    return OntologyIndex.from_records(ENTITIES, INSIGHTS, links=[(3, "company", 12)])
+
+
+def _ids(results):
+    return [(e["carc_id"], e["representation"]) for e in results]
+
+
+def test_lookup_matches_labels_and_aliases(index):
+    assert len(index) == 6
+    assert _ids(index.lookup("apple inc.")) == [(1, "company")]
+    assert _ids(index.lookup("  APPLE   INC ")) == [(5, "ticker")]
+    assert _ids(index.lookup("aapl")) == [(1, "company")]
+    assert _ids(index.lookup("nestle")) == [(3, "company")]
+    assert _ids(index.lookup("Nestle SA")) == [(3, "company")]
+    assert index.lookup("appl") == []
+    assert index.lookup("") == []
+
+
+def test_lookup_by_representation(index):
+    assert _ids(index.lookup("apple", representation="brand")) == [(1, "brand")]
+    assert index.lookup("apple", representation="company") == []
+    assert index.lookup("apple", representation="unknown") == []
+
+
+def test_prefix(index):
+    assert {e["label"] for e in index.prefix("apple")} == {
+        "Apple Inc.", "Apple", "Applebee's Grill", "Apple  Inc",
+    }
+    assert len(index.prefix("apple", limit=2)) == 2
+    assert _ids(index.prefix("apple", representation="ticker")) == [(5, "ticker")]
+    assert index.prefix("zzz") == []
+
+
+def test_search_matches_every_word_and_prefixes_the_last(index):
+    # Equal label lengths rank in record order.
+    assert _ids(index.search("apple inc")) == [(1, "company"), (5, "ticker")]
+    assert _ids(index.search("grill appleb")) == [(2, "brand")]
+    assert {e["carc_id"] for e in index.search("app")} == {1, 2, 5}
+    assert _ids(index.search("express")) == [(4, "brand")]
+    assert index.search("apple express") == []
+
+
+def test_entity_and_insights(index):
+    assert index.entity(1, "brand") == {"carc_id": 1, "label": "Apple", "representation": "brand"}
+    assert index.entity(1)["carc_id"] == 1
+    assert index.entity(99) is None
+    assert index.insights_for(1, "brand").tolist() == [10, 11]
+    assert index.insights_for(3).tolist() == [10, 12]
+    assert index.insights_for(5).tolist() == []
+    assert index.insight(11) == {"insight_id": 11, "label": "Foot traffic"}
+    assert index.insight(99) is None
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(index, tmp_path, mmap):
+    path = index.save(str(tmp_path / "index"))
+    loaded = OntologyIndex.load(path, mmap=mmap)
+    assert len(loaded) == len(index)
+    for query in ["apple", "apple inc", "nestle", "pine"]:
+        assert loaded.lookup(query) == index.lookup(query)
+        assert loaded.prefix(query) == index.prefix(query)
+        assert loaded.search(query) == index.search(query)
+    assert loaded.insights_for(3).tolist() == index.insights_for(3).tolist()
+    assert loaded.insight(12) == index.insight(12)
+
+
+def test_load_rejects_other_format_versions(index, tmp_path):
+    path = index.save(str(tmp_path / "index"))
+    with open(f"{path}/meta.json", "w") as f:
+        f.write('{"version": 999, "representations": []}')
+    with pytest.raises(ValueError, match="999"):
+        OntologyIndex.load(path)
+
+
+def test_records_flattens_listings_and_maps():
+    assert records({"items": [{"id": 1}, "x"]}) == [{"id": 1}]
+    assert records({"7": "Apple", "8": {"label": "Pear"}}) == [
+        {"id": "7", "label": "Apple"}, {"id": "8", "label": "Pear"},
+    ]
+    assert records(None) == []
+
+
+def test_empty_index(tmp_path):
+    index = OntologyIndex.from_records([])
+    assert len(index) == 0
+    assert index.lookup("apple") == [] and index.search("apple") == []
+    loaded = OntologyIndex.load(index.save(str(tmp_path / "empty")))
+    assert len(loaded) == 0
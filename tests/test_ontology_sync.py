@@ -0,0 +1,171 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from carbonarc.sync import OntologySync
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status}", response=response)
+
+
+class FakeOntology:
+    """Entity listing, detail endpoint and change feed of a versioned
+    ontology. The detail endpoint wraps the entity in ``data`` and adds a
+    field the listing doesn't carry."""
+
+    def __init__(self, entities, version="1"):
+        self.entities = {(e["entity_id"], e["entity_representation"]): dict(e) for e in entities}
+        self.version = version
+        self.changes = []
+        self.gap = False
+        self.detail_calls = []
+        self.listings = 0
+
+    def change(self, version, entity, action="updated"):
+        self.version = version
+        key = (entity["entity_id"], entity["entity_representation"])
+        if action == "removed":
+            self.entities.pop(key, None)
+        else:
+            self.entities[key] = dict(entity)
+        self.changes.append({**entity, "version": version, "change_type": action})
+
+    def get_ontology_version(self):
+        return {"version": self.version}
+
+    def iter_entities(self, representation=None, size=100, max_workers=4):
+        self.listings += 1
+        return iter([
+            dict(e) for e in self.entities.values()
+            if representation is None or e["entity_representation"] in representation
+        ])
+
+    def get_entity_information(self, entity_id, representation):
+        self.detail_calls.append((entity_id, representation))
+        return {"data": {**self.entities[(entity_id, representation)], "description": "detail"}}
+
+    def get_ontology_version_changes_for_entities(
+        self, version, entity_representation=None, page=1, size=100, order="asc"
+    ):
+        if self.gap:
+            raise _http_error(410)
+        rows = [
+            c for c in self.changes
+            if c["version"] > version
+            and (entity_representation is None or c["entity_representation"] == entity_representation)
+        ]
+        return {"items": rows[(page - 1) * size:page * size], "total": len(rows)}
+
+
+class FakeData:
+    def get_library_version_changes(self, version=None, page=1, size=100, order="asc"):
+        return {"items": [], "version": "1"}
+
+    def get_datasets(self):
+        return {"datasets": []}
+
+
+def _entity(entity_id, label, representation="brand"):
+    return {"entity_id": entity_id, "entity_representation": representation, "label": label}
+
+
+def _mirror(tmp_path, ontology, **kwargs):
+    client = SimpleNamespace(ontology=ontology, data=FakeData())
+    return OntologySync(client, str(tmp_path / "mirror.sqlite3"), page_size=2, **kwargs)
+
+
+def _labels(mirror):
+    return sorted(e["label"] for e in mirror.entities())
+
+
+def test_first_sync_rebuilds(tmp_path):
+    ontology = FakeOntology([_entity(1, "Apple"), _entity(2, "Pear")])
+    stats = _mirror(tmp_path, ontology).sync_ontology()
+    assert stats["mode"] == "full" and stats["rows"] == 2
+    assert _mirror(tmp_path, ontology).sync_ontology()["mode"] == "noop"
+
+
+def test_incremental_applies_updates_and_removals(tmp_path):
+    ontology = FakeOntology([_entity(1, "Apple"), _entity(2, "Pear"), _entity(3, "Plum")])
+    mirror = _mirror(tmp_path, ontology)
+    mirror.sync_ontology()
+    ontology.change("2", _entity(1, "Apple Inc"))
+    ontology.change("2", _entity(4, "Fig"))
+    ontology.change("3", _entity(2, "Pear"), action="removed")
+    stats = mirror.sync_ontology()
+    assert stats == {"mode": "incremental", "from": "1", "to": "3", "changes": 3, "rows": 2}
+    assert ontology.listings == 1
+    assert _labels(mirror) == ["Apple Inc", "Fig", "Plum"]
+
+
+def test_both_paths_store_the_same_record_form(tmp_path):
+    ontology = FakeOntology([_entity(1, "Apple"), _entity(2, "Pear")])
+    mirror = _mirror(tmp_path, ontology)
+    mirror.sync_ontology()
+    ontology.change("2", _entity(1, "Apple"))
+    mirror.sync_ontology()
+    rebuilt, refetched = mirror.entity(2, "brand"), mirror.entity(1, "brand")
+    assert "data" not in refetched
+    assert {"entity_id", "entity_representation", "label"} <= set(refetched)
+    assert set(rebuilt) <= set(refetched)
+
+
+def test_change_keys_are_passed_as_given(tmp_path):
+    ontology = FakeOntology([_entity("ent-1", "Apple")])
+    mirror = _mirror(tmp_path, ontology)
+    mirror.sync_ontology()
+    ontology.change("2", _entity("ent-1", "Apple Inc"))
+    mirror.sync_ontology()
+    assert ontology.detail_calls == [("ent-1", "brand")]
+    assert mirror.entity("ent-1", "brand")["label"] == "Apple Inc"
+
+
+def test_feed_gap_rebuilds(tmp_path):
+    ontology = FakeOntology([_entity(1, "Apple")])
+    mirror = _mirror(tmp_path, ontology)
+    mirror.sync_ontology()
+    ontology.change("2", _entity(2, "Pear"))
+    ontology.gap = True
+    stats = mirror.sync_ontology()
+    assert stats["mode"] == "full" and mirror.ontology_version == "2"
+    assert _labels(mirror) == ["Apple", "Pear"]
+
+
+def test_other_feed_errors_propagate(tmp_path):
+    ontology = FakeOntology([_entity(1, "Apple")])
+    mirror = _mirror(tmp_path, ontology)
+    mirror.sync_ontology()
+    ontology.version = "2"
+
+    def broken(**kwargs):
+        raise _http_error(500)
+
+    ontology.get_ontology_version_changes_for_entities = broken
+    with pytest.raises(requests.exceptions.HTTPError):
+        mirror.sync_ontology()
+    assert mirror.ontology_version == "1"
+
+
+@pytest.mark.parametrize("limit, mode", [(3, "incremental"), (2, "full"), (None, "incremental")])
+def test_max_incremental_changes(tmp_path, limit, mode):
+    ontology = FakeOntology([_entity(1, "Apple")])
+    mirror = _mirror(tmp_path, ontology, max_incremental_changes=limit)
+    mirror.sync_ontology()
+    for i in range(2, 5):
+        ontology.change(str(i), _entity(i, f"Entity {i}"))
+    assert mirror.sync_ontology()["mode"] == mode
+    assert len(_labels(mirror)) == 4
+
+
+def test_representations_filter(tmp_path):
+    ontology = FakeOntology([_entity(1, "Apple"), _entity(2, "AAPL", "ticker")])
+    mirror = _mirror(tmp_path, ontology, representations=["ticker"])
+    mirror.sync_ontology()
+    ontology.change("2", _entity(3, "Fig"))
+    ontology.change("2", _entity(4, "FIG", "ticker"))
+    mirror.sync_ontology()
+    assert _labels(mirror) == ["AAPL", "FIG"]
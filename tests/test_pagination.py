@@ -0,0 +1,230 @@
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+
+from carbonarc.utils.exceptions import CarbonArcException
+from carbonarc.utils.pagination import (
+    aiter_page_responses,
+    iter_page_responses,
+    iter_pages,
+    iter_paged_items,
+)
+
+ROWS = list(range(95))
+
+
+class Listing:
+    """Fake paginated endpoint over ``rows``; ``past_end`` is the status
+    raised for pages past the last one (``None`` returns an empty page)."""
+
+    def __init__(self, rows=ROWS, size=10, with_total=True, past_end=None, fail_page=None):
+        self.rows = rows
+        self.size = size
+        self.with_total = with_total
+        self.past_end = past_end
+        self.fail_page = fail_page
+        self.requested = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _response(self, page):
+        if page == self.fail_page:
+            raise CarbonArcException("server error", status_code=500)
+        items = self.rows[(page - 1) * self.size:page * self.size]
+        if not items and page > 1 and self.past_end is not None:
+            raise CarbonArcException("page out of range", status_code=self.past_end)
+        response = {"items": items}
+        if self.with_total:
+            response["total"] = len(self.rows)
+        return response
+
+    def __call__(self, page):
+        with self._lock:
+            self.requested.append(page)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.01)
+            return self._response(page)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    async def fetch(self, page):
+        with self._lock:
+            self.requested.append(page)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            return self._response(page)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _items(responses):
+    return [item for response in responses for item in response["items"]]
+
+
+def test_with_total_fetches_exactly_the_pages():
+    listing = Listing()
+    responses = list(iter_page_responses(listing, 10, max_workers=3))
+    assert _items(responses) == ROWS
+    assert sorted(listing.requested) == list(range(1, 11))
+    assert listing.peak <= 3
+
+
+@pytest.mark.parametrize("prefetch", [1, 4])
+def test_without_total_stops_at_the_short_page(prefetch):
+    listing = Listing(with_total=False)
+    assert _items(iter_page_responses(listing, 10, max_workers=4, prefetch=prefetch)) == ROWS
+    assert max(listing.requested) <= 10 + prefetch
+
+
+def test_without_total_exact_multiple_ends_at_the_empty_page():
+    listing = Listing(rows=list(range(40)), with_total=False)
+    assert _items(iter_page_responses(listing, 10)) == list(range(40))
+
+
+@pytest.mark.parametrize("status", [400, 404, 422])
+def test_out_of_range_error_after_a_full_page_ends_the_listing(status):
+    listing = Listing(rows=list(range(40)), with_total=False, past_end=status)
+    assert _items(iter_page_responses(listing, 10, prefetch=4)) == list(range(40))
+
+
+def test_errors_past_a_short_page_are_ignored():
+    listing = Listing(with_total=False, past_end=500)
+    assert _items(iter_page_responses(listing, 10, prefetch=4)) == ROWS
+
+
+def test_real_errors_propagate():
+    listing = Listing(with_total=False, fail_page=3)
+    with pytest.raises(CarbonArcException, match="server error"):
+        list(iter_page_responses(listing, 10))
+    listing = Listing(with_total=False, past_end=429)
+    listing.rows = list(range(40))
+    with pytest.raises(CarbonArcException):
+        list(iter_page_responses(listing, 10))
+
+
+def test_empty_and_single_page_listings():
+    assert list(iter_page_responses(Listing(rows=[]), 10)) == []
+    listing = Listing(rows=[1, 2], with_total=False)
+    assert _items(iter_page_responses(listing, 10)) == [1, 2]
+    assert listing.requested == [1]
+
+
+def test_iter_paged_items():
+    assert list(iter_paged_items(Listing(), 10, max_workers=3)) == ROWS
+    assert list(iter_paged_items(Listing(with_total=False), 10)) == ROWS
+
+
+def _collect_async(listing, **kwargs):
+    unretrieved = []
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unretrieved.append(context)
+        )
+        items = []
+        async for response in aiter_page_responses(listing.fetch, 10, **kwargs):
+            items += response["items"]
+        # Give the dropped tasks time to finish, then collect them.
+        await asyncio.sleep(0.05)
+        gc.collect()
+        return items
+
+    return asyncio.run(main()), unretrieved
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+def test_async_pages(with_total):
+    listing = Listing(with_total=with_total)
+    items, unretrieved = _collect_async(listing, max_workers=3)
+    assert items == ROWS
+    assert listing.peak <= 3
+    assert unretrieved == []
+
+
+def test_async_failed_speculative_pages_are_not_reported():
+    listing = Listing(rows=list(range(40)), with_total=False, past_end=404)
+    items, unretrieved = _collect_async(listing, prefetch=4)
+    assert items == list(range(40))
+    assert unretrieved == []
+
+
+def test_async_real_errors_propagate():
+    listing = Listing(with_total=False, fail_page=2)
+    with pytest.raises(CarbonArcException):
+        _collect_async(listing)
+
+
+def _pool_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("ThreadPoolExecutor")]
+
+
+def test_iter_pages_requests_nothing_until_iterated():
+    fetched = []
+    before = len(_pool_threads())
+    pages = iter_pages(fetched.append, 1, 10, max_workers=4)
+    time.sleep(0.02)
+    assert fetched == [] and len(_pool_threads()) == before
+    pages.close()
+
+
+def test_iter_pages_downloads_while_head_is_consumed():
+    fetched = []
+    pages = iter_pages(lambda page: fetched.append(page) or page, 2, 5, prefetch=2, head=["first"])
+    assert next(pages) == "first"
+    time.sleep(0.02)
+    assert sorted(fetched) == [2, 3]
+    assert list(pages) == [2, 3, 4, 5]
+
+
+def test_closing_iter_pages_cancels_pages_not_started():
+    release = threading.Event()
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        release.wait(1)
+        return page
+
+    before = len(_pool_threads())
+    pages = iter_pages(fetch, 1, 50, max_workers=2, prefetch=8)
+    release.set()
+    assert next(pages) == 1
+    pages.close()
+    time.sleep(0.05)
+    assert len(fetched) <= 9
+    assert len(_pool_threads()) == before
+
+
+def test_iter_paged_items_is_lazy_and_closes_its_pool():
+    listing = Listing()
+    before = len(_pool_threads())
+    items = iter_paged_items(listing, 10, max_workers=3)
+    assert listing.requested == []
+    assert next(items) == 0
+    items.close()
+    time.sleep(0.05)
+    assert len(_pool_threads()) == before
+    assert len(listing.requested) <= 4
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+def test_iter_page_responses_is_lazy_and_closes_its_pool(with_total):
+    listing = Listing(with_total=with_total)
+    before = len(_pool_threads())
+    responses = iter_page_responses(listing, 10, max_workers=3)
+    assert listing.requested == []
+    assert next(responses)["items"] == ROWS[:10]
+    responses.close()
+    time.sleep(0.05)
+    assert len(_pool_threads()) == before
+    assert len(listing.requested) <= 4
@@ -0,0 +1,104 @@
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+
+from carbonarc.pipeline import FrameworkPipeline
+
+
+class FakeExplorer:
+    """Buys every framework under its ``id``; ``states`` maps id -> status
+    reported (missing ids are left out of the status response)."""
+
+    def __init__(self, states, status_error=None, prices=None):
+        self.states = states
+        self.status_error = status_error
+        self.prices = prices or {}
+        self.polls = 0
+
+    def check_framework_prices(self, chunk):
+        return pd.DataFrame({"price": [self.prices.get(f["id"]) for f in chunk]})
+
+    def buy_frameworks(self, chunk):
+        return {"framework_ids": [f["id"] for f in chunk]}
+
+    def get_framework_status(self, ids):
+        self.polls += 1
+        if self.status_error is not None:
+            raise self.status_error
+        return [{"framework_id": i, "status": self.states[i]} for i in ids if i in self.states]
+
+    def get_raw_framework_data(self, framework_id, data_type):
+        if framework_id == "broken":
+            raise RuntimeError("download failed")
+        return {"data": [{"id": framework_id}]}
+
+
+def _pipeline(explorer, **kwargs):
+    options = dict(data_type=None, poll_interval=0.01, max_interval=0.02, timeout=0.3)
+    options.update(kwargs)
+    return FrameworkPipeline(SimpleNamespace(explorer=explorer), **options)
+
+
+def _errors(result, stage):
+    return [(item, e) for s, item, e in result.errors if s == stage]
+
+
+def test_completed_frameworks_flow_through():
+    explorer = FakeExplorer({"a": "completed", "b": "completed", "broken": "completed"})
+    result = _pipeline(explorer).run([{"id": "a"}, {"id": "b"}, {"id": "broken"}])
+    assert set(result.outputs) == {"a", "b"}
+    [(item, error)] = _errors(result, "download")
+    assert item[0] == "broken" and isinstance(error, RuntimeError)
+    assert list(result.metrics["stage"]) == ["buy", "wait", "download", "convert", "persist"]
+
+
+def test_stuck_and_unreported_frameworks_time_out():
+    explorer = FakeExplorer({"done": "completed", "stuck": "running"})
+    started = time.monotonic()
+    result = _pipeline(explorer).run([{"id": "done"}, {"id": "stuck"}, {"id": "ghost"}])
+    assert time.monotonic() - started < 5
+    assert set(result.outputs) == {"done"}
+    timeouts = {item: e for item, e in _errors(result, "wait")}
+    assert set(timeouts) == {"stuck", "ghost"}
+    assert all(isinstance(e, TimeoutError) for e in timeouts.values())
+    assert "not reported" in str(timeouts["ghost"])
+
+
+def test_failing_status_endpoint_is_recorded_once():
+    explorer = FakeExplorer({}, status_error=RuntimeError("status down"))
+    result = _pipeline(explorer).run([{"id": "a"}, {"id": "b"}])
+    assert explorer.polls > 2
+    errors = _errors(result, "wait")
+    assert [e for _, e in errors if isinstance(e, RuntimeError)] == [explorer.status_error]
+    assert sorted(item for item, e in errors if isinstance(e, TimeoutError)) == ["a", "b"]
+
+
+def test_price_stage_skips_expensive_frameworks():
+    explorer = FakeExplorer({"a": "completed", "b": "completed"}, prices={"a": 1.0, "b": 50.0})
+    result = _pipeline(explorer, max_price=10).run([{"id": "a"}, {"id": "b"}])
+    assert set(result.outputs) == {"a"}
+    assert result.skipped == [({"id": "b"}, 50.0)]
+
+
+def test_parallel_workers_record_every_result():
+    ids = [f"f{i}" for i in range(60)] + [f"broken{i}" for i in range(20)]
+    explorer = FakeExplorer({i: "completed" for i in ids})
+    download = explorer.get_raw_framework_data
+    explorer.get_raw_framework_data = lambda i, data_type: download(
+        "broken" if i.startswith("broken") else i, data_type
+    )
+    result = _pipeline(
+        explorer, chunk_size=7, buy_workers=3, download_workers=8, persist_workers=4, timeout=5
+    ).run([{"id": i} for i in ids])
+    assert set(result.outputs) == {i for i in ids if i.startswith("f")}
+    assert sorted(item[0] for item, _ in _errors(result, "download")) == sorted(
+        i for i in ids if i.startswith("broken")
+    )
+
+
+def test_raw_framework_data_is_not_converted(client, api):
+    rows = [{"date": "2024-01-01", "value": 1.0}]
+    api.route("GET", "/v2/framework/F1/data", {"data": rows, "total": 1})
+    assert client.explorer.get_raw_framework_data("F1", "dataframe") == {"data": rows, "total": 1}
+    assert api.calls[0].params == {"fetch_all": "true", "data_type": "dataframe"}
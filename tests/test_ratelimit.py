@@ -0,0 +1,221 @@
+import asyncio
+import io
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from carbonarc.utils.auth import TokenAuth
+from carbonarc.utils.manager import HttpRequestManager
+from carbonarc.utils.ratelimit import RateLimiter
+
+URL = "https://api.example.com/v2/data"
+
+
+def _free_slots(limiter, url=URL):
+    """Number of in-flight slots currently free for ``url``'s host."""
+    slots, taken = limiter._budget(url).slots, []
+    while True:
+        slot = slots.try_acquire()
+        if slot is None:
+            break
+        taken.append(slot)
+    for slot in taken:
+        slots.release(slot)
+    return len(taken)
+
+
+def test_in_flight_cap_across_threads():
+    limiter = RateLimiter(max_in_flight=3)
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def work():
+        with limiter.limit(URL):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 3
+
+
+def test_waiting_for_a_slot_blocks_instead_of_polling():
+    limiter = RateLimiter(max_in_flight=1)
+    release = limiter.acquire(URL)
+    acquired = threading.Event()
+
+    def wait_for_slot():
+        limiter.acquire(URL)()
+        acquired.set()
+
+    with mock.patch("carbonarc.utils.ratelimit.time.sleep") as sleep:
+        thread = threading.Thread(target=wait_for_slot)
+        thread.start()
+        assert not acquired.wait(0.05)
+        release()
+        assert acquired.wait(1)
+        thread.join()
+    sleep.assert_not_called()
+
+
+def test_release_is_idempotent():
+    limiter = RateLimiter(max_in_flight=2)
+    release = limiter.acquire(URL)
+    release()
+    release()
+    assert _free_slots(limiter) == 2
+
+
+def test_rate_spaces_requests():
+    limiter = RateLimiter(requests_per_second=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        with limiter.limit(URL):
+            pass
+    assert time.monotonic() - started >= 0.09
+
+
+def test_budgets_are_per_host():
+    limiter = RateLimiter(max_in_flight=1)
+    release = limiter.acquire(URL)
+    with limiter.limit("https://app.example.com/x"):
+        pass
+    release()
+
+
+def _streamed_response():
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(b'{"data": []}')
+    return response
+
+
+def test_streamed_response_holds_its_slot_until_closed():
+    limiter = RateLimiter(max_in_flight=2)
+    manager = HttpRequestManager(auth_token=TokenAuth("t"), rate_limiter=limiter)
+    with mock.patch.object(
+        manager.request_session, "request", side_effect=lambda *a, **k: _streamed_response()
+    ):
+        manager.get(URL)
+        assert _free_slots(limiter) == 2
+        response = manager.get(URL, stream=True)
+        assert _free_slots(limiter) == 1
+        assert b"".join(response.iter_content(4)) == b'{"data": []}'
+        response.close()
+        assert _free_slots(limiter) == 2
+        with manager.get(URL, stream=True):
+            assert _free_slots(limiter) == 1
+        assert _free_slots(limiter) == 2
+
+
+def test_async_streamed_response_holds_its_slot_until_read():
+    httpx = pytest.importorskip("httpx")
+    from carbonarc.utils.async_manager import AsyncHttpRequestManager
+
+    limiter = RateLimiter(max_in_flight=2)
+
+    async def main():
+        manager = AsyncHttpRequestManager(auth_token=TokenAuth("t"), rate_limiter=limiter)
+        async def body():
+            for _ in range(10):
+                yield b"x" * 10
+
+        manager.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        )
+        response = await manager.get(URL, stream=True)
+        assert _free_slots(limiter) == 1
+        assert b"".join([chunk async for chunk in response.aiter_bytes()]) == b"x" * 100
+        assert _free_slots(limiter) == 2
+        await manager.get(URL)
+        assert _free_slots(limiter) == 2
+        await manager.aclose()
+
+    asyncio.run(main())
+
+
+def test_slot_is_taken_after_the_token():
+    limiter = RateLimiter(requests_per_second=5, burst=1, max_in_flight=1)
+    limiter.acquire(URL)()
+    acquired = threading.Event()
+
+    def wait_for_token():
+        limiter.acquire(URL)
+        acquired.set()
+
+    thread = threading.Thread(target=wait_for_token)
+    thread.start()
+    time.sleep(0.05)
+    # The second caller is waiting for its token, not holding the slot.
+    assert not acquired.is_set()
+    assert _free_slots(limiter) == 1
+    thread.join()
+    assert _free_slots(limiter) == 0
+
+
+def test_async_slot_is_taken_after_the_token():
+    limiter = RateLimiter(requests_per_second=5, burst=1, max_in_flight=1)
+
+    async def main():
+        (await limiter.aacquire(URL))()
+        waiter = asyncio.ensure_future(limiter.aacquire(URL))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        assert _free_slots(limiter) == 1
+        await waiter
+        assert _free_slots(limiter) == 0
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_pause_holds_back_slots_without_a_rate(tmp_path, shared):
+    limiter = RateLimiter(max_in_flight=2, state_dir=str(tmp_path) if shared else None)
+    limiter.pause(URL, 0.15)
+    started = time.monotonic()
+    limiter.acquire(URL)()
+    assert time.monotonic() - started >= 0.14
+    started = time.monotonic()
+    limiter.acquire(URL)()
+    assert time.monotonic() - started < 0.05
+
+
+def test_async_pause_holds_back_slots_without_a_rate():
+    limiter = RateLimiter(max_in_flight=2)
+
+    async def main():
+        limiter.pause(URL, 0.15)
+        started = time.monotonic()
+        (await limiter.aacquire(URL))()
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.14
+
+
+def test_pause_applies_to_callers_already_waiting_for_a_slot():
+    limiter = RateLimiter(max_in_flight=1)
+    release = limiter.acquire(URL)
+    acquired = []
+
+    def wait_for_slot():
+        limiter.acquire(URL)()
+        acquired.append(time.monotonic())
+
+    thread = threading.Thread(target=wait_for_slot)
+    thread.start()
+    time.sleep(0.02)
+    limiter.pause(URL, 0.15)
+    paused = time.monotonic()
+    release()
+    thread.join()
+    assert acquired[0] - paused >= 0.14
@@ -0,0 +1,62 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from carbonarc.utils.retry import RetryPolicy, parse_retry_after
+
+
+def _response(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= parse_retry_after(later) <= 60
+
+
+def test_429_is_retried_for_any_method():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry_response(_response(429), 0, idempotent=False)
+    assert not policy.should_retry_response(_response(429), 2, idempotent=False)
+
+
+def test_5xx_is_retried_only_when_idempotent():
+    policy = RetryPolicy()
+    assert policy.should_retry_response(_response(503), 0, idempotent=True)
+    assert not policy.should_retry_response(_response(503), 0, idempotent=False)
+    assert not policy.should_retry_response(_response(404), 0, idempotent=True)
+
+
+def test_long_retry_after_gives_up():
+    policy = RetryPolicy(max_retry_after=10)
+    assert not policy.should_retry_response(_response(429, "60"), 0, idempotent=True)
+
+
+@pytest.mark.parametrize(
+    "exc, idempotent, expected",
+    [
+        (requests.exceptions.ConnectTimeout(), False, True),
+        (requests.exceptions.ConnectionError(), False, False),
+        (requests.exceptions.ReadTimeout(), True, True),
+        (ValueError(), True, False),
+    ],
+)
+def test_transport_errors(exc, idempotent, expected):
+    assert RetryPolicy().should_retry_exception(exc, 0, idempotent) is expected
+
+
+def test_backoff_grows_and_honours_retry_after():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(n) for n in range(4)] == [1, 2, 4, 5]
+    assert policy.backoff(0, _response(429, "3")) == 3.0
+    assert 0 <= RetryPolicy(backoff_factor=1).backoff(2) <= 4
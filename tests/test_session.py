@@ -0,0 +1,62 @@
+from unittest import mock
+
+from conftest import CAMS_HOST, HOST, StubAPI, mount
+
+from carbonarc import CarbonArcClient
+from carbonarc.utils.auth import TokenAuth
+from carbonarc.utils.manager import HttpRequestManager
+
+SUB_CLIENTS = ("block", "catalog", "data", "explorer", "hub", "client", "ontology", "transcripts")
+
+
+def test_sub_clients_share_one_manager_and_session(client):
+    managers = {id(getattr(client, name).request_manager) for name in SUB_CLIENTS}
+    assert managers == {id(client.request_manager)}
+
+
+def test_both_hosts_go_through_the_shared_session(client, api):
+    api.route("GET", "/v2/ontology/subjects", {"items": []})
+    api.route("GET", "/api/v1/block/arns", {"items": []})
+    client.ontology.get_subjects()
+    client.block.list_arns()
+    assert [c.host for c in api.calls] == [HOST, CAMS_HOST]
+    assert all(c.headers["Authorization"] == "Bearer token" for c in api.calls)
+
+
+def test_pool_options_reach_the_adapter():
+    manager = HttpRequestManager(
+        auth_token=TokenAuth("t"), pool_connections=3, pool_maxsize=32, pool_block=True
+    )
+    for prefix in ("https://", "http://"):
+        adapter = manager.request_session.get_adapter(prefix + "example.com")
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+
+def test_keep_alive_off_asks_to_close():
+    api = StubAPI()
+    api.route("GET", "/v2/ontology/subjects", {})
+    with CarbonArcClient("token", host=HOST, keep_alive=False) as client:
+        mount(client, api).ontology.get_subjects()
+    assert api.calls[0].headers["Connection"] == "close"
+
+
+def test_get_stream_leaves_the_session_headers_alone(client, api):
+    api.route("GET", "/file", b"raw bytes")
+    api.route("GET", "/v2/ontology/subjects", {})
+    response = client.request_manager.get_stream(f"{HOST}/file")
+    assert response.content == b"raw bytes"
+    client.ontology.get_subjects()
+    assert [c.headers["Accept"] for c in api.calls] == [
+        "application/octet-stream", "application/json",
+    ]
+    assert client.request_manager.request_session.headers["Accept"] == "application/json"
+
+
+def test_close_releases_the_session():
+    client = CarbonArcClient("token")
+    with mock.patch.object(client.request_manager.request_session, "close") as close:
+        with client:
+            pass
+    close.assert_called_once()
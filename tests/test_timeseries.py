@@ -0,0 +1,92 @@
+import datetime
+import random
+
+import pandas as pd
+import pytest
+
+from carbonarc.utils.timeseries import timeseries_response_to_pandas
+
+
+def legacy_timeseries_response_to_pandas(response: dict) -> pd.DataFrame:
+    # The per-series implementation the vectorized path replaced.
+    series = []
+    for item in response["data"]:
+        df = pd.DataFrame(item["series"])
+        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df["entity_representation"] = item["entity_representation"]
+        df["entity_id"] = item["entity_id"]
+        df["entity_name"] = item["entity_name"]
+        df.rename(columns={"value": item["insight"]}, inplace=True)
+        df = df[["entity_representation", "entity_id", "entity_name", "date", item["insight"]]]
+        series.append(df)
+    return pd.concat(series)
+
+
+def _response(seed, insights=2, entities=5, points=6, null_rate=0.2):
+    rng = random.Random(seed)
+    start = datetime.date(2024, 1, 1)
+    data = []
+    for insight in range(insights):
+        for entity_id in range(entities):
+            dates = [(start + datetime.timedelta(days=rng.randrange(60))).isoformat() for _ in range(points)]
+            data.append({
+                "entity_representation": rng.choice(["brand", "company"]),
+                "entity_id": entity_id,
+                "entity_name": f"Entity {entity_id}",
+                "insight": f"insight_{insight}",
+                "series": [
+                    {"date": None if rng.random() < null_rate else d, "value": rng.random()}
+                    for d in dates
+                ],
+            })
+    return {"data": data}
+
+
+def _plain(df):
+    return df.astype({c: object for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)})
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("insights", [1, 3])
+def test_matches_legacy_implementation(seed, insights):
+    response = _response(seed, insights=insights)
+    pd.testing.assert_frame_equal(
+        _plain(timeseries_response_to_pandas(response)),
+        legacy_timeseries_response_to_pandas(response),
+        check_dtype=False,
+    )
+
+
+def test_null_dates_stay_missing():
+    response = {"data": [{
+        "entity_representation": "brand",
+        "entity_id": 1,
+        "entity_name": "A",
+        "insight": "spend",
+        "series": [
+            {"date": "2024-01-01", "value": 1.0},
+            {"date": None, "value": 2.0},
+            {"date": "2024-02-01", "value": 3.0},
+        ],
+    }]}
+    dates = timeseries_response_to_pandas(response)["date"]
+    assert dates[0] == datetime.date(2024, 1, 1)
+    assert pd.isna(dates[1])
+    assert dates[2] == datetime.date(2024, 2, 1)
+
+
+def test_index_restarts_per_series():
+    df = timeseries_response_to_pandas(_response(0, insights=1, entities=3, points=4))
+    assert list(df.index) == [0, 1, 2, 3] * 3
+
+
+def test_pivot_one_row_per_entity_and_date():
+    response = _response(1, insights=2, entities=2, points=3, null_rate=0)
+    wide = timeseries_response_to_pandas(response, pivot=True)
+    assert {"insight_0", "insight_1"} <= set(wide.columns)
+    assert not wide.duplicated(["entity_representation", "entity_id", "entity_name", "date"]).any()
+
+
+def test_empty_response_raises():
+    with pytest.raises(ValueError):
+        timeseries_response_to_pandas({"data": []})
@@ -0,0 +1,66 @@
+from unittest import mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from carbonarc.utils.auth import TokenAuth
+from carbonarc.utils.manager import HttpRequestManager
+from carbonarc.utils.validators import ValidatorCache
+
+
+def _response(status=200, body=b"{}", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+def test_store_and_revalidate():
+    cache = ValidatorCache()
+    cache.store("k", {"ETag": '"v1"'}, b'{"a": 1}')
+    assert cache.request_headers("k") == {"If-None-Match": '"v1"'}
+    assert cache.not_modified("k").body == b'{"a": 1}'
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_uncacheable_responses_are_not_kept_or_counted():
+    cache = ValidatorCache(max_entry_bytes=10)
+    cache.store("plain", {}, b"{}")
+    cache.store("large", {"ETag": '"v1"'}, b"x" * 11)
+    assert cache.request_headers("plain") == {}
+    assert cache.request_headers("large") == {}
+    assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0, "bytes": 0}
+
+
+def test_total_size_evicts_least_recently_used():
+    cache = ValidatorCache(max_bytes=10, max_entry_bytes=6)
+    cache.store("a", {"ETag": "a"}, b"aaaaa")
+    cache.store("b", {"ETag": "b"}, b"bbbbb")
+    cache.not_modified("a")
+    cache.store("c", {"ETag": "c"}, b"ccccc")
+    assert cache.request_headers("b") == {}
+    assert cache.request_headers("a") and cache.request_headers("c")
+
+
+def test_manager_is_not_conditional_by_default():
+    assert HttpRequestManager(auth_token=TokenAuth("t")).validators is None
+
+
+def test_manager_serves_304_from_memory():
+    manager = HttpRequestManager(auth_token=TokenAuth("t"), conditional_requests=True)
+    sent = []
+
+    def request(method, url, **kwargs):
+        sent.append(kwargs.get("headers") or {})
+        if len(sent) == 1:
+            return _response(body=b'{"v": 1}', headers={"ETag": '"v1"'})
+        return _response(status=304)
+
+    with mock.patch.object(manager, "_request", side_effect=request):
+        assert manager.get("https://x/a").content == b'{"v": 1}'
+        second = manager.get("https://x/a")
+    assert second.status_code == 200
+    assert second.content == b'{"v": 1}'
+    assert sent[1] == {"If-None-Match": '"v1"'}
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+
+import pytest
+
+from carbonarc.aio import AsyncExplorerAPIClient
+from carbonarc.explorer import ExplorerAPIClient
+
+
+def _status_endpoint(finish_after, missing=()):
+    """Fake get_framework_status: each id completes after ``finish_after[id]``
+    polls; ids in ``missing`` are never reported."""
+    polls = {}
+
+    def get_framework_status(ids):
+        rows = []
+        for i in ids:
+            if i in missing:
+                continue
+            polls[i] = polls.get(i, 0) + 1
+            done = polls[i] >= finish_after.get(i, 1)
+            rows.append({"framework_id": i, "status": "completed" if done else "running"})
+        return rows
+
+    return get_framework_status
+
+
+def _download(framework_id):
+    if framework_id == "bad":
+        raise RuntimeError("download failed")
+    return {"id": framework_id}
+
+
+@pytest.fixture
+def explorer():
+    return ExplorerAPIClient(token="t")
+
+
+def test_failed_download_does_not_stop_the_others(explorer):
+    explorer.get_framework_status = _status_endpoint({"a": 1, "bad": 1, "c": 3})
+    results = {
+        r.framework_id: r
+        for r in explorer.wait_for_frameworks(
+            ["a", "bad", "c"], poll_interval=0.01, download=_download
+        )
+    }
+    assert set(results) == {"a", "bad", "c"}
+    assert results["a"].data == {"id": "a"} and results["a"].error is None
+    assert results["c"].data == {"id": "c"}
+    assert isinstance(results["bad"].error, RuntimeError)
+    assert results["bad"].data is None and results["bad"].completed
+
+
+def test_unreported_ids_are_logged_and_named_on_timeout(explorer, caplog):
+    explorer.get_framework_status = _status_endpoint({"a": 1}, missing={"ghost"})
+    seen = []
+    with caplog.at_level(logging.WARNING, logger="carbonarc.explorer"):
+        with pytest.raises(TimeoutError, match="not reported.*ghost"):
+            for result in explorer.wait_for_frameworks(
+                ["a", "ghost"], poll_interval=0.01, timeout=0.1
+            ):
+                seen.append(result.framework_id)
+    assert seen == ["a"]
+    warnings = [r for r in caplog.records if "left out" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_async_failed_download_is_returned():
+    explorer = AsyncExplorerAPIClient(token="t")
+    status = _status_endpoint({"a": 1, "bad": 2})
+
+    async def get_framework_status(ids):
+        return status(ids)
+
+    async def download(framework_id):
+        return _download(framework_id)
+
+    explorer.get_framework_status = get_framework_status
+
+    async def collect():
+        return {
+            r.framework_id: r
+            async for r in explorer.wait_for_frameworks(
+                ["a", "bad"], poll_interval=0.01, download=download
+            )
+        }
+
+    results = asyncio.run(collect())
+    assert results["a"].data == {"id": "a"}
+    assert isinstance(results["bad"].error, RuntimeError)
@@ -0,0 +1,107 @@
+import json
+import os
+
+import pytest
+import requests
+
+from carbonarc.utils import client as client_module
+
+RECORDS = [
+    {"timestamp": f"2024-03-{day:02d}T10:00:00Z", "content": f"post {day}", "likes": day}
+    for day in range(1, 11)
+]
+BODY = json.dumps({"query_metadata": {"total_records": len(RECORDS)}, "data": RECORDS}).encode()
+
+
+@pytest.fixture
+def feed(api, monkeypatch):
+    # Small chunks so records straddle chunk boundaries.
+    monkeypatch.setattr(client_module, "_STREAM_CHUNK_SIZE", 37)
+    api.route("GET", "/v2/webcontent/12/data", BODY)
+    return 12
+
+
+def _leftovers(directory):
+    return [name for name in os.listdir(directory) if name.endswith(".part")]
+
+
+def test_ndjson(client, api, feed, tmp_path):
+    path, count = client.hub.stream_webcontent_to_file(
+        feed, (">=", "2024-03-01"), directory=str(tmp_path)
+    )
+    assert path == str(tmp_path / "webcontent_12_gte_2024-03-01.ndjson")
+    assert count == len(RECORDS)
+    with open(path) as f:
+        assert [json.loads(line) for line in f] == RECORDS
+    assert api.calls[0].params == {
+        "fetch_all": "True",
+        "webcontent_date_operator": ">=",
+        "webcontent_date": "2024-03-01",
+    }
+    assert _leftovers(tmp_path) == []
+
+
+def test_json_keeps_the_body(client, feed, tmp_path):
+    path, count = client.hub.stream_webcontent_to_file(
+        feed, directory=str(tmp_path / "new"), filename="feed.json", file_format="json"
+    )
+    assert count == len(RECORDS)
+    with open(path, "rb") as f:
+        assert f.read() == BODY
+
+
+def test_parquet(client, feed, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path, count = client.hub.stream_webcontent_to_file(
+        feed, directory=str(tmp_path), file_format="parquet", batch_rows=4
+    )
+    assert count == len(RECORDS)
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("content").to_pylist() == [r["content"] for r in RECORDS]
+    assert table.column("likes").to_pylist() == [r["likes"] for r in RECORDS]
+
+
+def test_unknown_format_is_rejected(client, feed, tmp_path):
+    with pytest.raises(ValueError):
+        client.hub.stream_webcontent_to_file(feed, directory=str(tmp_path), file_format="csv")
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("file_format", ["json", "ndjson", "parquet"])
+def test_failed_download_keeps_the_previous_file(client, feed, tmp_path, monkeypatch, file_format):
+    if file_format == "parquet":
+        pytest.importorskip("pyarrow")
+    path, _ = client.hub.stream_webcontent_to_file(
+        feed, directory=str(tmp_path), filename="feed", file_format=file_format, batch_rows=2
+    )
+    with open(path, "rb") as f:
+        before = f.read()
+
+    def broken(url, **kwargs):
+        yield BODY[:200]
+        raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+    monkeypatch.setattr(client.hub, "_iter_bytes", broken)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        client.hub.stream_webcontent_to_file(
+            feed, directory=str(tmp_path), filename="feed", file_format=file_format, batch_rows=2
+        )
+    with open(path, "rb") as f:
+        assert f.read() == before
+    assert _leftovers(tmp_path) == []
+
+
+def test_truncated_body_is_not_committed(client, api, tmp_path):
+    api.route("GET", "/v2/webcontent/13/data", BODY[:-40])
+    with pytest.raises(Exception):
+        client.hub.stream_webcontent_to_file(13, directory=str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_error_status_leaves_no_file(client, api, tmp_path):
+    api.route("GET", "/v2/webcontent/14/data", (500, {"detail": "boom"}))
+    with pytest.raises(Exception):
+        client.hub.stream_webcontent_to_file(14, directory=str(tmp_path))
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,143 @@
+import glob
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from carbonarc.sync import WebcontentSync
+
+
+class FakeHub:
+    def __init__(self, records):
+        self.records = records
+        self.requests = []
+
+    def get_subscribed_feeds(self):
+        return {"feeds": [{"webcontent_id": 1}]}
+
+    def iter_webcontent_records(self, webcontent_id, webcontent_date=None):
+        self.requests.append(webcontent_date)
+        if webcontent_date is None:
+            return list(self.records)
+        # Like the API, the filter uses the feed's own web content date (the
+        # timestamp unless a record says otherwise) and also matches
+        # records without a date.
+        return [
+            r for r in self.records
+            if not r.get("webcontent_date", r.get("timestamp"))
+            or r.get("webcontent_date", r.get("timestamp"))[:10] >= webcontent_date[1]
+        ]
+
+
+def _stored(root):
+    rows = []
+    for path in glob.glob(os.path.join(root, "feed=1", "date=*", "*.ndjson")):
+        with open(path) as f:
+            rows += [json.loads(line)["content"] for line in f]
+    return sorted(rows)
+
+
+def _sync(hub, root, **kwargs):
+    return WebcontentSync(SimpleNamespace(hub=hub), root, **kwargs)
+
+
+def test_incremental_sync_does_not_duplicate(tmp_path):
+    root = str(tmp_path)
+    hub = FakeHub([
+        {"timestamp": "2025-03-01T10:00:00", "content": "a"},
+        {"timestamp": "2025-03-02T10:00:00", "content": "b"},
+        {"timestamp": None, "content": "undated"},
+    ])
+    first = _sync(hub, root).sync_feed(1)
+    assert first["high_water"] == "2025-03-02" and first["undated"] == 1
+    hub.records.append({"timestamp": "2025-03-02T12:00:00", "content": "c"})
+    hub.records.append({"content": "undated 2"})
+    second = _sync(hub, root).sync_feed(1)
+    assert hub.requests[-1] == (">=", "2025-03-02")
+    assert second["records"] == 4
+    _sync(hub, root).sync_feed(1)
+    assert _stored(root) == ["a", "b", "c", "undated", "undated 2"]
+
+
+def test_missing_date_field_fails_without_storing(tmp_path):
+    root = str(tmp_path)
+    hub = FakeHub([{"published": "2025-03-01", "content": "a"}] * 3)
+    with pytest.raises(ValueError, match="published"):
+        _sync(hub, root).sync_feed(1)
+    sync = _sync(hub, root)
+    assert sync.high_water(1) is None
+    assert _stored(root) == []
+    assert sync.sync([1])[1]["error"].startswith("None of the 3 records")
+
+
+def test_date_field_option(tmp_path):
+    root = str(tmp_path)
+    hub = FakeHub([{"published": "2025-03-01", "content": "a"}])
+    assert _sync(hub, root, date_field="published").sync_feed(1)["high_water"] == "2025-03-01"
+    assert os.listdir(os.path.join(root, "feed=1")) == ["date=2025-03-01"]
+
+
+def test_resyncing_a_day_keeps_its_earlier_records(tmp_path):
+    root = str(tmp_path)
+    hub = FakeHub([{"timestamp": "2025-03-02T10:00:00", "content": "a"}])
+    _sync(hub, root).sync_feed(1)
+    for content in ["b", "c"]:
+        hub.records.append({"timestamp": "2025-03-02T11:00:00", "content": content})
+        stats = _sync(hub, root).sync_feed(1)
+        assert stats["stored"] == 1
+    assert _sync(hub, root).sync_feed(1)["stored"] == 0
+    assert _stored(root) == ["a", "b", "c"]
+    day = os.path.join(root, "feed=1", "date=2025-03-02")
+    assert sorted(os.listdir(day)) == ["_keys.txt", "part-0.ndjson", "part-1.ndjson", "part-2.ndjson"]
+
+
+def test_older_date_field_merges_into_its_day(tmp_path):
+    # The API filters on webcontent_date, the partitions follow timestamp:
+    # a record the filter lets through can belong to an older day.
+    root = str(tmp_path)
+    hub = FakeHub([
+        {"timestamp": "2025-03-01T10:00:00", "content": "a"},
+        {"timestamp": "2025-03-01T11:00:00", "content": "b"},
+        {"timestamp": "2025-03-05T10:00:00", "content": "c"},
+    ])
+    _sync(hub, root).sync_feed(1)
+    hub.records.append({
+        "timestamp": "2025-03-01T12:00:00",
+        "webcontent_date": "2025-03-06",
+        "content": "late",
+    })
+    _sync(hub, root).sync_feed(1)
+    _sync(hub, root).sync_feed(1)
+    assert _stored(root) == ["a", "b", "c", "late"]
+
+
+def test_mismatched_fields_never_drop_stored_records(tmp_path):
+    # A record stored under a day at or after the mark, but dated earlier
+    # by the API, is not sent again when that day is re-synced.
+    root = str(tmp_path)
+    hub = FakeHub([
+        {"timestamp": "2025-03-05T10:00:00", "webcontent_date": "2025-03-01", "content": "a"},
+        {"timestamp": "2025-03-05T11:00:00", "content": "b"},
+    ])
+    _sync(hub, root).sync_feed(1)
+    hub.records.append({"timestamp": "2025-03-05T12:00:00", "content": "c"})
+    _sync(hub, root).sync_feed(1)
+    assert hub.requests[-1] == (">=", "2025-03-05")
+    assert _stored(root) == ["a", "b", "c"]
+
+
+def test_failed_sync_leaves_partitions_untouched(tmp_path):
+    root = str(tmp_path)
+    hub = FakeHub([{"timestamp": "2025-03-02T10:00:00", "content": "a"}])
+    _sync(hub, root).sync_feed(1)
+
+    class Broken(FakeHub):
+        def iter_webcontent_records(self, webcontent_id, webcontent_date=None):
+            yield {"timestamp": "2025-03-02T12:00:00", "content": "b"}
+            raise ConnectionError("dropped")
+
+    with pytest.raises(ConnectionError):
+        _sync(Broken([]), root).sync_feed(1)
+    assert _stored(root) == ["a"]
+    assert not [n for n in os.listdir(os.path.join(root, "feed=1")) if n.startswith(".")]